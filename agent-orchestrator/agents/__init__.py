@@ -24,7 +24,9 @@ from .metric_sanity_gates import MetricSanityGates, get_sanity_gates
 from .eli5_formatter import ELI5FormatterAgent
 from .new_pipeline import NewPipelineOrchestrator, create_pipeline_orchestrator
 from .deepseek_final_analyst import DeepSeekFinalAnalyst, create_deepseek_analyst
-from .deepseek_fallback import DeepSeekFallback, get_deepseek_fallback, is_fallback_available
+from .deepseek_fallback import (
+    DeepSeekFallback, close_deepseek_fallback, get_deepseek_fallback, is_fallback_available
+)
 from .advanced_analysis_engine import AdvancedAnalysisEngine, run_advanced_analysis
 
 # New v2.0 Modules
@@ -110,6 +112,7 @@ __all__ = [
     "create_deepseek_analyst",
     "DeepSeekFallback",
     "get_deepseek_fallback",
+    "close_deepseek_fallback",
     "is_fallback_available",
     "AdvancedAnalysisEngine",
     "run_advanced_analysis",
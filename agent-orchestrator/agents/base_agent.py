@@ -4,11 +4,12 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, TypedDict
 from functools import wraps
 from datetime import datetime
-import json
 import re
 import logging
 import asyncio
 
+from .fast_json import JSONDecodeError, loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -530,6 +531,13 @@ BU HESAPLAR İÇİN BAŞARI METRİĞİ:
 - İçerik değer sunuyor mu yoksa ürün tanıtıyor mu?
 """
 
+    # Instance attributes set in __init__; subclasses that declare their own
+    # __slots__ drop the per-instance __dict__, the rest keep it as before.
+    __slots__ = (
+        "client", "generation_config", "model_name",
+        "name", "role", "specialty", "metrics",
+    )
+
     def __init__(self, gemini_client, generation_config=None, model_name: str = "gemini-2.0-flash"):
         """
         Initialize base agent with new Google GenAI SDK
@@ -796,20 +804,20 @@ BU HESAPLAR İÇİN BAŞARI METRİĞİ:
         if "```json" in content:
             try:
                 return self._extract_markdown_json(content)
-            except json.JSONDecodeError as e:
+            except JSONDecodeError as e:
                 logger.warning(f"Failed to parse markdown JSON block: {e}")
         
         # Strategy 2: Generic code block
         if "```" in content:
             try:
                 return self._extract_code_block(content)
-            except json.JSONDecodeError as e:
+            except JSONDecodeError as e:
                 logger.warning(f"Failed to parse generic code block: {e}")
         
         # Strategy 3: Direct JSON parse
         try:
-            return json.loads(content.strip())
-        except json.JSONDecodeError:
+            return _json_loads(content.strip())
+        except JSONDecodeError:
             pass
         
         # Strategy 4: Regex extraction with repair
@@ -818,8 +826,8 @@ BU HESAPLAR İÇİN BAŞARI METRİĞİ:
             try:
                 json_str = json_match.group()
                 repaired = self._repair_json(json_str)
-                return json.loads(repaired)
-            except json.JSONDecodeError as e:
+                return _json_loads(repaired)
+            except JSONDecodeError as e:
                 logger.warning(f"Failed to parse regex-extracted JSON even after repair: {e}")
         
         # Strategy 5: Fallback with metric extraction
@@ -839,11 +847,11 @@ BU HESAPLAR İÇİN BAŞARI METRİĞİ:
         
         # Try direct parse first
         try:
-            return json.loads(json_str)
-        except json.JSONDecodeError:
+            return _json_loads(json_str)
+        except JSONDecodeError:
             # Try to repair incomplete JSON
             repaired = self._repair_json(json_str)
-            return json.loads(repaired)
+            return _json_loads(repaired)
     
     def _repair_json(self, json_str: str) -> str:
         """
@@ -923,10 +931,10 @@ BU HESAPLAR İÇİN BAŞARI METRİĞİ:
             json_str = content[start:end].strip()
         
         try:
-            return json.loads(json_str)
-        except json.JSONDecodeError:
+            return _json_loads(json_str)
+        except JSONDecodeError:
             repaired = self._repair_json(json_str)
-            return json.loads(repaired)
+            return _json_loads(repaired)
     
     def _create_fallback_response(self, content: str) -> Dict[str, Any]:
         """Create fallback response when parsing fails, but try to extract metrics"""
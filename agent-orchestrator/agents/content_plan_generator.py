@@ -19,20 +19,64 @@ Output: Complete 7-day content plan with topics, hooks, captions,
 hashtags, visual guidelines, and story schedule.
 """
 
-import json
 import logging
 import os
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from google import genai
 from google.genai import types
 
 from .base_agent import BaseAgent
+from .fast_json import dumps as _dumps
 
 logger = logging.getLogger(__name__)
 
 
+def _coalesce(*paths: Tuple[str, ...], default: Callable[[], Any] = dict) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Build an accessor returning the value at the first path present in a dict.
+    
+    Replaces `d.get('a', d.get('b', {}).get('c', {}))` fallback ladders:
+    _coalesce(('a',), ('b', 'c'))(d). Missing paths yield default().
+    """
+    def accessor(data: Dict[str, Any]) -> Any:
+        for path in paths:
+            node = data
+            for key in path:
+                if not isinstance(node, dict) or key not in node:
+                    break
+                node = node[key]
+            else:
+                return node
+        return default()
+    return accessor
+
+
+# Field fallbacks across agent output schema versions, compiled once
+_FIELD_ACCESSORS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    # audienceDynamics
+    'optimal_posting_times': _coalesce(('optimal_posting_times',), ('audience_analysis', 'optimal_posting_times')),
+    'active_hours': _coalesce(('active_hours',), ('audience_analysis', 'active_hours')),
+    'pain_points': _coalesce(('pain_points',), ('audience_analysis', 'pain_points'), default=list),
+    'language_patterns': _coalesce(('language_patterns',), ('audience_analysis', 'language_patterns')),
+    'emoji_patterns': _coalesce(('emoji_patterns',), ('audience_analysis', 'emoji_patterns'), default=list),
+    # contentStrategist
+    'hashtag_clusters': _coalesce(('hashtag_clusters',), ('hashtagAnalysis',)),
+    'hashtag_analysis': _coalesce(('hashtagAnalysis',), ('hashtag_analysis',)),
+    'high_reach_hashtags': _coalesce(('high_reach',), ('topPerforming',), default=list),
+    'best_ctas': _coalesce(('best_performing_ctas',), ('hookAnalysis', 'best_ctas'), default=list),
+    'brand_voice': _coalesce(('brand_voice',), ('content_analysis', 'brand_voice')),
+    # visualBrand
+    'color_palette': _coalesce(('brand_colors',), ('color_palette',)),
+    'brand_colors': _coalesce(('brand_colors',), ('brand_analysis', 'color_palette')),
+    'visual_archetype': _coalesce(('visualArchetypeAnalysis',), ('visual_archetype',)),
+    # domainMaster
+    'niche_hashtags': _coalesce(('niche_hashtags',), ('nicheBenchmarks', 'recommended_hashtags'), default=list),
+    'trending_hashtags': _coalesce(('trending_hashtags',), ('trend_analysis', 'trending_tags'), default=list),
+}
+
+
 class ContentPlanGenerator(BaseAgent):
     """
     7-Day Content Plan Generator
@@ -277,6 +321,10 @@ class ContentPlanGenerator(BaseAgent):
                 "conversionFunnel"
             ]
         }
+        # Missing agents weigh 2, missing fields 1: keep completeness in integers
+        self._double_total_required = 2 * sum(
+            len(fields) for fields in self.required_agent_data.values()
+        )
     
     def get_system_prompt(self) -> str:
         return """Sen Content Plan Generator Agent'sın - 7 günlük içerik planı oluşturma uzmanısın.
@@ -388,7 +436,7 @@ OUTPUT FORMAT: Yanıtını SADECE belirtilen JSON yapısında ver."""
         
         # Extract visual brand data
         visual_data = agent_results.get('visualBrand', {})
-        color_palette = visual_data.get('brand_colors', visual_data.get('color_palette', {}))
+        color_palette = _FIELD_ACCESSORS['color_palette'](visual_data)
         visual_archetype = visual_data.get('visualArchetypeAnalysis', {}).get('archetype', 'N/A')
         
         # Extract pain points from audience dynamics
@@ -397,7 +445,7 @@ OUTPUT FORMAT: Yanıtını SADECE belirtilen JSON yapısında ver."""
         
         # Extract hashtag data from content strategist
         content_data = agent_results.get('contentStrategist', {})
-        hashtag_clusters = content_data.get('hashtag_clusters', content_data.get('hashtagAnalysis', {}))
+        hashtag_clusters = _FIELD_ACCESSORS['hashtag_clusters'](content_data)
         
         # Extract domain-specific hashtags
         domain_data = agent_results.get('domainMaster', {})
@@ -413,33 +461,33 @@ OUTPUT FORMAT: Yanıtını SADECE belirtilen JSON yapısında ver."""
 - Timezone: {timezone}
 
 ## PLAN TARİHLERİ:
-{json.dumps(dict(zip(range(1, 8), zip(plan_dates, day_names))), indent=2, ensure_ascii=False)}
+{_dumps(dict(zip(range(1, 8), zip(plan_dates, day_names))), indent=True)}
 
 ## KRİTİK VERİ KAYNAKLARI (Bu verilerden dinamik üret):
 
 ### POSTING TIMES (Audience Dynamics'ten):
-{json.dumps(posting_times, ensure_ascii=False, indent=2)}
+{_dumps(posting_times, indent=True)}
 
 ### COLOR PALETTE (Visual Brand'den):
-{json.dumps(color_palette, ensure_ascii=False, indent=2)}
+{_dumps(color_palette, indent=True)}
 
 ### VISUAL ARCHETYPE:
 {visual_archetype}
 
 ### PAIN POINTS (Audience Dynamics'ten):
-{json.dumps(pain_points[:5] if isinstance(pain_points, list) else pain_points, ensure_ascii=False, indent=2)}
+{_dumps(pain_points[:5] if isinstance(pain_points, list) else pain_points, indent=True)}
 
 ### PERSONAS (Audience Dynamics'ten):
-{json.dumps(personas[:3] if isinstance(personas, list) else personas, ensure_ascii=False, indent=2)}
+{_dumps(personas[:3] if isinstance(personas, list) else personas, indent=True)}
 
 ### HASHTAG CLUSTERS (Content Strategist'ten):
-{json.dumps(hashtag_clusters, ensure_ascii=False, indent=2)[:2000]}
+{_dumps(hashtag_clusters)[:2000]}
 
 ### NICHE HASHTAGS (Domain Master'dan):
-{json.dumps(niche_hashtags[:20] if isinstance(niche_hashtags, list) else niche_hashtags, ensure_ascii=False)}
+{_dumps(niche_hashtags[:20] if isinstance(niche_hashtags, list) else niche_hashtags)}
 
 ### TRENDING HASHTAGS (Domain Master'dan):
-{json.dumps(trending_hashtags[:10] if isinstance(trending_hashtags, list) else trending_hashtags, ensure_ascii=False)}
+{_dumps(trending_hashtags[:10] if isinstance(trending_hashtags, list) else trending_hashtags)}
 
 ## 7 AJAN ANALİZ VERİLERİ:
 
@@ -807,204 +855,192 @@ Aşağıdaki JSON yapısında yanıt ver:
     ) -> str:
         """Build comprehensive data summary from all agent outputs"""
         
-        summary_parts = []
+        # One slot per agent section, filled in order below
+        summary_parts: List[str] = [''] * 9
         
         # 1. Audience Dynamics Data - CRITICAL FOR POSTING TIMES & PAIN POINTS
         audience_data = agent_results.get('audienceDynamics', {})
         cross_audience = cross_insights.get('audienceDynamics', {})
         
         # Extract posting times specifically
-        optimal_times = audience_data.get('optimal_posting_times', 
-                         audience_data.get('audience_analysis', {}).get('optimal_posting_times', {}))
-        active_hours = audience_data.get('active_hours', 
-                        audience_data.get('audience_analysis', {}).get('active_hours', {}))
+        optimal_times = _FIELD_ACCESSORS['optimal_posting_times'](audience_data)
+        active_hours = _FIELD_ACCESSORS['active_hours'](audience_data)
         
         # Extract pain points specifically
-        pain_points = audience_data.get('pain_points',
-                       audience_data.get('audience_analysis', {}).get('pain_points', []))
+        pain_points = _FIELD_ACCESSORS['pain_points'](audience_data)
         
         # Extract language patterns for caption generation
-        language_patterns = audience_data.get('language_patterns',
-                             audience_data.get('audience_analysis', {}).get('language_patterns', {}))
+        language_patterns = _FIELD_ACCESSORS['language_patterns'](audience_data)
         
         # Extract emoji patterns
-        emoji_patterns = audience_data.get('emoji_patterns',
-                          audience_data.get('audience_analysis', {}).get('emoji_patterns', []))
+        emoji_patterns = _FIELD_ACCESSORS['emoji_patterns'](audience_data)
         
-        summary_parts.append(f"""
+        summary_parts[0] = f"""
 ### AUDIENCE DYNAMICS - KRİTİK VERİLER:
 
 **POSTING TIMES (Content Plan için ZORUNLU):**
-{json.dumps(optimal_times, ensure_ascii=False, indent=2)}
+{_dumps(optimal_times, indent=True)}
 
 **ACTIVE HOURS BY TIME OF DAY:**
-{json.dumps(active_hours, ensure_ascii=False, indent=2)}
+{_dumps(active_hours, indent=True)}
 
 **PAIN POINTS (Her gün için topic mapping ZORUNLU):**
-{json.dumps(pain_points, ensure_ascii=False, indent=2)}
+{_dumps(pain_points, indent=True)}
 
 **LANGUAGE PATTERNS (Caption generation için):**
-{json.dumps(language_patterns, ensure_ascii=False, indent=2)[:1000]}
+{_dumps(language_patterns)[:1000]}
 
 **EMOJI PATTERNS (Caption emoji usage için):**
-{json.dumps(emoji_patterns, ensure_ascii=False)}
+{_dumps(emoji_patterns)}
 
 **PERSONAS (Relevance scoring için):**
-{json.dumps(cross_audience.get('topPersonas', []), ensure_ascii=False, indent=2)}
+{_dumps(cross_audience.get('topPersonas', []), indent=True)}
 
-- Segmentasyon: {json.dumps(cross_audience.get('followerSegmentation', {}), ensure_ascii=False, indent=2)}
+- Segmentasyon: {_dumps(cross_audience.get('followerSegmentation', {}), indent=True)}
 - Kitle Kalitesi: {cross_audience.get('audienceQuality', 'N/A')}
-""")
+"""
         
         # 2. Content Strategist Data - CRITICAL FOR HASHTAGS & CTAs
         content_data = agent_results.get('contentStrategist', {})
         cross_content = cross_insights.get('contentStrategist', {})
         
         # Extract hashtag clusters specifically
-        hashtag_analysis = content_data.get('hashtagAnalysis', 
-                            content_data.get('hashtag_analysis', {}))
-        high_reach_hashtags = hashtag_analysis.get('high_reach', 
-                               hashtag_analysis.get('topPerforming', []))
+        hashtag_analysis = _FIELD_ACCESSORS['hashtag_analysis'](content_data)
+        high_reach_hashtags = _FIELD_ACCESSORS['high_reach_hashtags'](hashtag_analysis)
         
         # Extract best CTAs
-        best_ctas = content_data.get('best_performing_ctas',
-                     content_data.get('hookAnalysis', {}).get('best_ctas', []))
+        best_ctas = _FIELD_ACCESSORS['best_ctas'](content_data)
         
         # Extract brand voice
-        brand_voice = content_data.get('brand_voice',
-                       content_data.get('content_analysis', {}).get('brand_voice', {}))
+        brand_voice = _FIELD_ACCESSORS['brand_voice'](content_data)
         
-        summary_parts.append(f"""
+        summary_parts[1] = f"""
 ### CONTENT STRATEGIST - KRİTİK VERİLER:
 
 **HASHTAG CLUSTERS (Her gün için ZORUNLU):**
-- High Reach Tags: {json.dumps(high_reach_hashtags, ensure_ascii=False)}
-- Full Analysis: {json.dumps(hashtag_analysis, ensure_ascii=False, indent=2)[:1500]}
+- High Reach Tags: {_dumps(high_reach_hashtags)}
+- Full Analysis: {_dumps(hashtag_analysis)[:1500]}
 
 **BEST PERFORMING CTAs (Caption için ZORUNLU):**
-{json.dumps(best_ctas, ensure_ascii=False, indent=2)}
+{_dumps(best_ctas, indent=True)}
 
 **BRAND VOICE (Caption generation için):**
-{json.dumps(brand_voice, ensure_ascii=False, indent=2)}
+{_dumps(brand_voice, indent=True)}
 
-- İçerik Sütunları: {json.dumps(cross_content.get('contentPillars', []), ensure_ascii=False)}
-- Hook Analizi: {json.dumps(cross_content.get('hookAnalysis', {}), ensure_ascii=False, indent=2)[:1000]}
+- İçerik Sütunları: {_dumps(cross_content.get('contentPillars', []))}
+- Hook Analizi: {_dumps(cross_content.get('hookAnalysis', {}))[:1000]}
 - Caption Kalitesi: {cross_content.get('captionQuality', 'N/A')}
 - Optimal Caption Length: {content_data.get('optimal_caption_length', 'N/A')}
-""")
+"""
         
         # 3. Attention Architect Data
         attention_data = agent_results.get('attentionArchitect', {})
-        summary_parts.append(f"""
+        summary_parts[2] = f"""
 ### ATTENTION ARCHITECT:
-- Retention Prediction: {json.dumps(attention_data.get('retentionPrediction', {}), ensure_ascii=False, indent=2)}
-- Emotional Triggers: {json.dumps(attention_data.get('emotionalTriggers', []), ensure_ascii=False, indent=2)}
-- Post Level Analysis: {json.dumps(attention_data.get('postLevelAnalysis', [])[:3], ensure_ascii=False, indent=2)}
-- Hook Effectiveness: {json.dumps(attention_data.get('hook_analysis', {}), ensure_ascii=False, indent=2)[:1500]}
-- Pattern Interrupts: {json.dumps(attention_data.get('pattern_interrupts', {}), ensure_ascii=False, indent=2)[:1000]}
-""")
+- Retention Prediction: {_dumps(attention_data.get('retentionPrediction', {}), indent=True)}
+- Emotional Triggers: {_dumps(attention_data.get('emotionalTriggers', []), indent=True)}
+- Post Level Analysis: {_dumps(attention_data.get('postLevelAnalysis', [])[:3], indent=True)}
+- Hook Effectiveness: {_dumps(attention_data.get('hook_analysis', {}))[:1500]}
+- Pattern Interrupts: {_dumps(attention_data.get('pattern_interrupts', {}))[:1000]}
+"""
         
         # 4. Visual Brand Data - CRITICAL FOR VISUAL GUIDELINES
         visual_data = agent_results.get('visualBrand', {})
         cross_visual = cross_insights.get('visualBrand', {})
         
         # Extract brand colors specifically
-        brand_colors = visual_data.get('brand_colors',
-                        visual_data.get('brand_analysis', {}).get('color_palette', {}))
+        brand_colors = _FIELD_ACCESSORS['brand_colors'](visual_data)
         
         # Extract visual archetype
-        visual_archetype = visual_data.get('visualArchetypeAnalysis',
-                            visual_data.get('visual_archetype', {}))
+        visual_archetype = _FIELD_ACCESSORS['visual_archetype'](visual_data)
         
-        summary_parts.append(f"""
+        summary_parts[3] = f"""
 ### VISUAL BRAND - KRİTİK VERİLER:
 
 **BRAND COLORS (Visual guidelines için ZORUNLU):**
-{json.dumps(brand_colors, ensure_ascii=False, indent=2)}
+{_dumps(brand_colors, indent=True)}
 
 **VISUAL ARCHETYPE (Style için ZORUNLU):**
-{json.dumps(visual_archetype, ensure_ascii=False, indent=2)}
+{_dumps(visual_archetype, indent=True)}
 
 **DOMINANT COLORS:**
-{json.dumps(cross_visual.get('dominantColors', []), ensure_ascii=False)}
+{_dumps(cross_visual.get('dominantColors', []))}
 
-- Renk Tutarlılığı: {json.dumps(cross_visual.get('colorConsistencyScore', {}), ensure_ascii=False, indent=2)}
-- Grid Profesyonelliği: {json.dumps(cross_visual.get('gridProfessionalism', {}), ensure_ascii=False, indent=2)}
-- Thumbnail Analizi: {json.dumps(cross_visual.get('thumbnailAnalysis', {}), ensure_ascii=False, indent=2)[:1000]}
-""")
+- Renk Tutarlılığı: {_dumps(cross_visual.get('colorConsistencyScore', {}), indent=True)}
+- Grid Profesyonelliği: {_dumps(cross_visual.get('gridProfessionalism', {}), indent=True)}
+- Thumbnail Analizi: {_dumps(cross_visual.get('thumbnailAnalysis', {}))[:1000]}
+"""
         
         # 5. Growth Architect Data
         growth_data = agent_results.get('growthVirality', {})
-        summary_parts.append(f"""
+        summary_parts[4] = f"""
 ### GROWTH ARCHITECT:
-- Growth Projection: {json.dumps(growth_data.get('growthProjection', {}), ensure_ascii=False, indent=2)[:1500]}
-- Competitor Gap Analysis: {json.dumps(growth_data.get('competitorGapAnalysis', {}), ensure_ascii=False, indent=2)[:1500]}
-- Funnel Analysis: {json.dumps(growth_data.get('funnelAnalysis', {}), ensure_ascii=False, indent=2)[:1000]}
-- Viral Loop Strategy: {json.dumps(growth_data.get('viralLoopStrategy', {}), ensure_ascii=False, indent=2)[:1000]}
-- Projections: {json.dumps(growth_data.get('projections', {}), ensure_ascii=False, indent=2)}
-""")
+- Growth Projection: {_dumps(growth_data.get('growthProjection', {}))[:1500]}
+- Competitor Gap Analysis: {_dumps(growth_data.get('competitorGapAnalysis', {}))[:1500]}
+- Funnel Analysis: {_dumps(growth_data.get('funnelAnalysis', {}))[:1000]}
+- Viral Loop Strategy: {_dumps(growth_data.get('viralLoopStrategy', {}))[:1000]}
+- Projections: {_dumps(growth_data.get('projections', {}), indent=True)}
+"""
         
         # 6. Domain Master Data - CRITICAL FOR NICHE HASHTAGS
         domain_data = agent_results.get('domainMaster', {})
         
         # Extract niche hashtags specifically
-        niche_hashtags = domain_data.get('niche_hashtags',
-                          domain_data.get('nicheBenchmarks', {}).get('recommended_hashtags', []))
+        niche_hashtags = _FIELD_ACCESSORS['niche_hashtags'](domain_data)
         
         # Extract trending hashtags
-        trending_hashtags = domain_data.get('trending_hashtags',
-                             domain_data.get('trend_analysis', {}).get('trending_tags', []))
+        trending_hashtags = _FIELD_ACCESSORS['trending_hashtags'](domain_data)
         
         # Extract seasonal content
         seasonal = domain_data.get('seasonalConsiderations', {})
         
-        summary_parts.append(f"""
+        summary_parts[5] = f"""
 ### DOMAIN MASTER - KRİTİK VERİLER:
 
 **NICHE HASHTAGS (Her gün için ZORUNLU):**
-{json.dumps(niche_hashtags, ensure_ascii=False, indent=2)}
+{_dumps(niche_hashtags, indent=True)}
 
 **TRENDING HASHTAGS (Güncel trendler):**
-{json.dumps(trending_hashtags, ensure_ascii=False, indent=2)}
+{_dumps(trending_hashtags, indent=True)}
 
 **SEASONAL CONSIDERATIONS:**
-{json.dumps(seasonal, ensure_ascii=False, indent=2)}
+{_dumps(seasonal, indent=True)}
 
-- Niche: {json.dumps(domain_data.get('niche_identification', {}), ensure_ascii=False, indent=2)}
-- Niche Benchmarks: {json.dumps(domain_data.get('nicheBenchmarks', {}), ensure_ascii=False, indent=2)[:1000]}
-- Sector Best Practices: {json.dumps(domain_data.get('sectorBestPractices', {}), ensure_ascii=False, indent=2)[:1000]}
-- Competitor Analysis: {json.dumps(domain_data.get('competitorAnalysis', {}), ensure_ascii=False, indent=2)[:1000]}
-""")
+- Niche: {_dumps(domain_data.get('niche_identification', {}), indent=True)}
+- Niche Benchmarks: {_dumps(domain_data.get('nicheBenchmarks', {}))[:1000]}
+- Sector Best Practices: {_dumps(domain_data.get('sectorBestPractices', {}))[:1000]}
+- Competitor Analysis: {_dumps(domain_data.get('competitorAnalysis', {}))[:1000]}
+"""
         
         # 7. Community Loyalty Data
         community_data = agent_results.get('communityLoyalty', {})
-        summary_parts.append(f"""
+        summary_parts[6] = f"""
 ### COMMUNITY LOYALTY:
-- Community Health: {json.dumps(community_data.get('community_health', {}), ensure_ascii=False, indent=2)[:1000]}
-- Loyalty Indicators: {json.dumps(community_data.get('loyalty_analysis', {}), ensure_ascii=False, indent=2)[:1000]}
-- Engagement Patterns: {json.dumps(community_data.get('engagement_patterns', {}), ensure_ascii=False, indent=2)[:1000]}
-""")
+- Community Health: {_dumps(community_data.get('community_health', {}))[:1000]}
+- Loyalty Indicators: {_dumps(community_data.get('loyalty_analysis', {}))[:1000]}
+- Engagement Patterns: {_dumps(community_data.get('engagement_patterns', {}))[:1000]}
+"""
         
         # 8. Sales Conversion Data
         sales_data = agent_results.get('salesConversion', {})
-        summary_parts.append(f"""
+        summary_parts[7] = f"""
 ### SALES CONVERSION:
-- Monetization Readiness: {json.dumps(sales_data.get('monetization_readiness', {}), ensure_ascii=False, indent=2)[:1000]}
-- Offer Alignment: {json.dumps(sales_data.get('offer_analysis', {}), ensure_ascii=False, indent=2)[:1000]}
-- Conversion Potential: {json.dumps(sales_data.get('conversion_analysis', {}), ensure_ascii=False, indent=2)[:1000]}
-""")
+- Monetization Readiness: {_dumps(sales_data.get('monetization_readiness', {}))[:1000]}
+- Offer Alignment: {_dumps(sales_data.get('offer_analysis', {}))[:1000]}
+- Conversion Potential: {_dumps(sales_data.get('conversion_analysis', {}))[:1000]}
+"""
         
         # 9. Level 0 Summary (from orchestrator)
         level0_summary = account_data.get('level0Summary', {})
-        summary_parts.append(f"""
+        summary_parts[8] = f"""
 ### LEVEL 0 ÖZET:
 - Ortalama İçerik Skoru: {level0_summary.get('avgContentScore', 'N/A')}
 - Ortalama Kitle Skoru: {level0_summary.get('avgAudienceScore', 'N/A')}
 - Ortalama Görsel Skoru: {level0_summary.get('avgVisualScore', 'N/A')}
 - Genel Level 0 Skoru: {level0_summary.get('overallLevel0Score', 'N/A')}
-- Kritik Sorunlar: {json.dumps(level0_summary.get('criticalIssues', []), ensure_ascii=False)}
-- Güçlü Yönler: {json.dumps(level0_summary.get('topStrengths', []), ensure_ascii=False)}
-""")
+- Kritik Sorunlar: {_dumps(level0_summary.get('criticalIssues', []))}
+- Güçlü Yönler: {_dumps(level0_summary.get('topStrengths', []))}
+"""
         
         return "\n".join(summary_parts)
     
@@ -1065,13 +1101,13 @@ Aşağıdaki JSON yapısında yanıt ver:
                     warnings.append(f"{agent}.{field}: Alan bulunamadı")
         
         is_valid = len(missing) == 0
-        completeness = 1.0 - (len(missing) + len(warnings) * 0.5) / (
-            sum(len(fields) for fields in self.required_agent_data.values())
-        )
+        completeness = max(0.0, min(1.0, 1.0 - (
+            2 * len(missing) + len(warnings)
+        ) / self._double_total_required))
         
         return {
             "status": "valid" if is_valid else "incomplete",
-            "completeness": max(0, min(1, completeness)),
+            "completeness": completeness,
             "missing_agents": missing,
             "warnings": warnings,
             "can_generate": completeness >= 0.5,  # Need at least 50% data
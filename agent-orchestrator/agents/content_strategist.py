@@ -2,483 +2,767 @@
 # Version: 2.0
 # Gelişmiş Algoritma ve Puanlama Sistemi
 
-from typing import Dict, Any, List, Optional
+from bisect import bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Sequence, Tuple, Union
 from .base_agent import BaseAgent
-import math
+from .frozen_config import freeze as _freeze
+from .scoring_numeric import engagement_quality, posting_gaps
 import json
+import math
+import re
+import sys
+import numpy as np
 from datetime import datetime, timedelta
 
 
-class ContentStrategistAgent(BaseAgent):
+# =========================
+# STATIC CONFIGURATION (read-only, shared by all agent instances)
+# =========================
+
+# Instagram algorithm weight configurations
+_ALGORITHM_WEIGHTS: Mapping[str, Any] = _freeze({
+    # Feed Algorithm Weights
+    "feed": {
+        "relationship": 0.35,
+        "interest": 0.30,
+        "timeliness": 0.20,
+        "frequency": 0.15,
+        "relationship_signals": {
+            "dm_history": 25,
+            "comment_history": 20,
+            "like_history": 15,
+            "profile_visit": 15,
+            "tagged_together": 15,
+            "story_view": 10
+        },
+        "interest_signals": {
+            "similar_content_engagement": 30,
+            "dwell_time": 25,
+            "save_action": 25,
+            "share_action": 20
+        },
+        "timeliness_decay": {
+            "0-1h": 1.0,
+            "1-6h": 0.7,
+            "6-24h": 0.4,
+            "24h+": 0.15
+        }
+    },
+    # Reels Algorithm Weights (Most Critical 2024/2025)
+    "reels": {
+        "watch_time": 0.40,
+        "engagement_velocity": 0.25,
+        "share_rate": 0.20,
+        "audio_trend": 0.15,
+        "watch_time_scoring": {
+            "0-25%": -50,
+            "25-50%": 0,
+            "50-75%": 30,
+            "75-100%": 60,
+            "loop_1x": 100,
+            "loop_2x+": 150
+        },
+        "engagement_velocity_30min": {
+            "0-10": "low_potential",
+            "10-50": "medium_potential",
+            "50-200": "high_potential",
+            "200+": "viral_candidate"
+        },
+        "share_multipliers": {
+            "dm_share": 3,
+            "story_share": 5,
+            "external_share": 2
+        }
+    },
+    # Explore Algorithm Weights
+    "explore": {
+        "content_quality": 0.35,
+        "user_interest_match": 0.30,
+        "engagement_rate": 0.20,
+        "account_authority": 0.15,
+        "quality_signals": {
+            "original_content": 40,
+            "no_watermark": 20,
+            "hd_quality_1080p": 15,
+            "text_ratio_under_20": 15,
+            "no_banned_hashtags": 10
+        },
+        "authority_signals": {
+            "account_age_6m+": 20,
+            "consistent_posting_3plus_week": 25,
+            "niche_consistency": 30,
+            "follower_following_ratio_above_1": 15,
+            "verified_badge": 10
+        }
+    },
+    # Search Algorithm Weights
+    "search": {
+        "username_match": 0.30,
+        "bio_keywords": 0.25,
+        "caption_text": 0.20,
+        "hashtag_relevance": 0.15,
+        "engagement": 0.10,
+        "username_optimization": {
+            "primary_keyword_in_username": 50,
+            "readable_format": 20,
+            "under_15_chars": 15,
+            "no_special_chars": 15
+        },
+        "bio_seo": {
+            "primary_keyword_first_30_chars": 40,
+            "secondary_keywords_2_3": 30,
+            "location_keyword": 20,
+            "niche_identifier": 10
+        },
+        "caption_seo": {
+            "keyword_first_125_chars": 35,
+            "natural_keyword_density_1_2_percent": 25,
+            "alt_text_usage": 25,
+            "location_tag": 15
+        }
+    }
+})
+
+
+# Scoring benchmarks for different metrics
+_SCORING_BENCHMARKS: Mapping[str, Any] = _freeze({
+    "engagement_rate": {
+        "poor": {"min": 0, "max": 1},
+        "average": {"min": 1, "max": 3},
+        "good": {"min": 3, "max": 6},
+        "excellent": {"min": 6, "max": 100}
+    },
+    "follower_growth": {
+        "poor": {"min": -100, "max": 0},
+        "average": {"min": 0, "max": 2},
+        "good": {"min": 2, "max": 5},
+        "excellent": {"min": 5, "max": 100}
+    },
+    "post_frequency": {
+        "poor": {"posts_per_week": 0, "score": 20},
+        "low": {"posts_per_week": 1, "score": 40},
+        "average": {"posts_per_week": 3, "score": 60},
+        "good": {"posts_per_week": 5, "score": 80},
+        "excellent": {"posts_per_week": 7, "score": 100}
+    },
+    "story_activity": {
+        "none": {"per_day": 0, "score": 0},
+        "low": {"per_day": 2, "score": 40},
+        "average": {"per_day": 5, "score": 70},
+        "good": {"per_day": 7, "score": 85},
+        "excellent": {"per_day": 8, "score": 100}
+    },
+    "reels_ratio": {
+        "none": {"percent": 0, "score": 20},
+        "low": {"percent": 20, "score": 50},
+        "good": {"percent": 50, "score": 85},
+        "excellent": {"percent": 50, "score": 100}
+    },
+    "save_rate": {
+        "poor": {"min": 0, "max": 0.5, "score": 30},
+        "average": {"min": 0.5, "max": 1, "score": 50},
+        "good": {"min": 1, "max": 3, "score": 75},
+        "excellent": {"min": 3, "max": 100, "score": 100}
+    },
+    "share_rate": {
+        "poor": {"min": 0, "max": 0.1, "score": 30},
+        "average": {"min": 0.1, "max": 0.5, "score": 50},
+        "good": {"min": 0.5, "max": 1, "score": 75},
+        "excellent": {"min": 1, "max": 100, "score": 100}
+    },
+    "comment_rate": {
+        "poor": {"min": 0, "max": 0.1, "score": 30},
+        "average": {"min": 0.1, "max": 0.5, "score": 50},
+        "good": {"min": 0.5, "max": 2, "score": 75},
+        "excellent": {"min": 2, "max": 100, "score": 100}
+    }
+})
+
+
+def _build_benchmark_lut(spec: Mapping[str, Any]) -> Tuple[np.ndarray, Tuple[str, ...], Optional[np.ndarray]]:
     """
-    Content Strategist Agent v2.0
-    Role: Instagram algorithm optimization, content strategy, SEO, and comprehensive scoring
+    Flatten a {bucket: {min, max[, score]}} benchmark into a searchsorted LUT.
     
-    Kapsamlı Uzmanlık Alanları:
-    - Instagram 6 farklı algoritma sistemi (Feed, Stories, Reels, Explore, Search, Hashtag)
-    - Content effectiveness scoring (0-100)
-    - Hashtag effectiveness analysis
-    - Caption quality optimization
-    - Posting consistency analysis
-    - Content diversity scoring
-    - Google SEO & Instagram Search optimization
-    - Target account profiling & tier classification
-    - Niche detection & market saturation analysis
+    Returns (upper bounds of all but the last bucket, bucket labels, scores or None).
+    Buckets are half-open [min, max), so a value equal to a bound falls into the
+    higher bucket: labels[np.searchsorted(bounds, values, side="right")].
     """
+    buckets = sorted(spec.items(), key=lambda item: item[1]["min"])
+    bounds = np.array([b["max"] for _, b in buckets[:-1]], dtype=np.float64)
+    labels = tuple(name for name, _ in buckets)
+    if all("score" in b for _, b in buckets):
+        scores: Optional[np.ndarray] = np.array([b["score"] for _, b in buckets], dtype=np.int16)
+    else:
+        scores = None
+    return bounds, labels, scores
+
+
+# Range benchmarks as searchsorted LUTs; the dicts above stay the source of truth
+_BENCHMARK_LUTS: Mapping[str, Tuple[np.ndarray, Tuple[str, ...], Optional[np.ndarray]]] = MappingProxyType({
+    metric: _build_benchmark_lut(spec)
+    for metric, spec in _SCORING_BENCHMARKS.items()
+    if all("min" in bucket and "max" in bucket for bucket in spec.values())
+})
+
+
+# Account tier definitions
+_TIER_DEFINITIONS: Mapping[str, Any] = _freeze({
+    "nano": {
+        "min_followers": 1000,
+        "max_followers": 10000,
+        "expected_er_min": 5,
+        "expected_er_max": 12,
+        "growth_potential": "high",
+        "priority": "community_building",
+        "characteristics": "High engagement, low reach"
+    },
+    "micro": {
+        "min_followers": 10000,
+        "max_followers": 50000,
+        "expected_er_min": 3,
+        "expected_er_max": 6,
+        "growth_potential": "medium-high",
+        "priority": "niche_authority",
+        "characteristics": "Balanced metrics"
+    },
+    "mid": {
+        "min_followers": 50000,
+        "max_followers": 100000,
+        "expected_er_min": 2,
+        "expected_er_max": 4,
+        "growth_potential": "medium",
+        "priority": "monetization",
+        "characteristics": "Reach increasing, ER decreasing"
+    },
+    "macro": {
+        "min_followers": 100000,
+        "max_followers": 500000,
+        "expected_er_min": 1,
+        "expected_er_max": 2.5,
+        "growth_potential": "low-medium",
+        "priority": "brand_deals",
+        "characteristics": "High reach, low intimacy"
+    },
+    "mega": {
+        "min_followers": 500000,
+        "max_followers": sys.maxsize,  # open-ended sentinel (int keeps int64 comparisons)
+        "expected_er_min": 0.5,
+        "expected_er_max": 1.5,
+        "growth_potential": "low",
+        "priority": "media_value",
+        "characteristics": "Maximum reach, minimum ER"
+    }
+})
+
+
+# Tier lookup tables derived from _TIER_DEFINITIONS (sorted by min_followers).
+# Accounts below the nano minimum are treated as nano.
+_TIER_NAMES: Tuple[str, ...] = tuple(
+    sorted(_TIER_DEFINITIONS, key=lambda t: _TIER_DEFINITIONS[t]["min_followers"])
+)
+_TIER_CUTOFFS: Tuple[int, ...] = tuple(
+    _TIER_DEFINITIONS[t]["min_followers"] for t in _TIER_NAMES[1:]
+)
+_TIER_CUTOFFS_ARR = np.array(_TIER_CUTOFFS, dtype=np.int64)
+
+
+@lru_cache(maxsize=1024)
+def _tier_for(followers: int) -> str:
+    """Tier name for a follower count (bisect over the tier cutoffs)"""
+    return _TIER_NAMES[bisect_right(_TIER_CUTOFFS, followers)]
+
+
+def _tier_index_batch(followers: Union[Sequence[int], np.ndarray]) -> np.ndarray:
+    """Vectorized tier index (into _TIER_NAMES) for many follower counts"""
+    return np.searchsorted(_TIER_CUTOFFS_ARR, np.asarray(followers), side="right")
+
+
+# Niche-specific adjustments
+_NICHE_ADJUSTMENTS: Mapping[str, Any] = _freeze({
+    "b2b": {
+        "expected_er_modifier": 0.6,  # Lower ER is normal
+        "priority_metric": "save_rate",
+        "posting_preference": "weekdays",
+        "notes": "LinkedIn cross-post analysis important"
+    },
+    "ecommerce": {
+        "expected_er_modifier": 0.8,
+        "priority_metric": "conversion_cta",
+        "features_to_check": ["product_tags", "shop_feature", "ugc_ratio"],
+        "notes": "Conversion-focused CTA analysis"
+    },
+    "personal_brand": {
+        "expected_er_modifier": 1.2,  # Higher ER expected
+        "priority_metric": "story_reply_rate",
+        "features_to_check": ["face_visibility", "authenticity_signals", "bts_content"],
+        "notes": "Behind-the-scenes content important"
+    },
+    "media_news": {
+        "expected_er_modifier": 0.7,
+        "priority_metric": "share_rate",
+        "posting_frequency_expectation": "high",
+        "features_to_check": ["timeliness", "breaking_content"],
+        "notes": "Timeliness is critical"
+    },
+    "lifestyle": {
+        "expected_er_modifier": 1.0,
+        "priority_metric": "engagement_quality",
+        "features_to_check": ["aesthetic_consistency", "story_engagement"],
+        "notes": "Visual consistency important"
+    },
+    "education": {
+        "expected_er_modifier": 1.1,
+        "priority_metric": "save_rate",
+        "features_to_check": ["carousel_usage", "value_delivery"],
+        "notes": "Save rate indicates content value"
+    },
+    "fitness": {
+        "expected_er_modifier": 1.0,
+        "priority_metric": "reels_performance",
+        "features_to_check": ["transformation_content", "tutorial_engagement"],
+        "notes": "Before/after content performs well"
+    },
+    "food": {
+        "expected_er_modifier": 1.1,
+        "priority_metric": "save_rate",
+        "features_to_check": ["recipe_saves", "location_tags"],
+        "notes": "Recipe content has high save rate"
+    },
+    "travel": {
+        "expected_er_modifier": 0.9,
+        "priority_metric": "engagement_quality",
+        "features_to_check": ["location_diversity", "seasonal_patterns"],
+        "notes": "Seasonal account adjustments needed"
+    },
+    "tech": {
+        "expected_er_modifier": 0.8,
+        "priority_metric": "share_rate",
+        "features_to_check": ["tutorial_content", "review_engagement"],
+        "notes": "Educational content priority"
+    }
+})
+
+
+_NO_NICHE_ADJUSTMENT: Mapping[str, Any] = MappingProxyType({})
+
+
+class _NicheProfile:
+    """One niche adjustment with its fields as slotted attributes (built once at import)"""
+    __slots__ = (
+        "er_modifier", "priority_metric", "posting_preference",
+        "posting_frequency_expectation", "features_to_check", "notes",
+    )
     
-    def __init__(self, gemini_client, generation_config=None, model_name: str = "gemini-2.5-flash"):
-        super().__init__(gemini_client, generation_config, model_name)
-        self.name = "Content Strategist"
-        self.role = "Instagram Algorithm & Content Strategy Expert"
-        self.specialty = "Algorithm optimization, SEO, content scoring, strategic planning"
-        
-        # Algorithm weight configurations
-        self.algorithm_weights = self._init_algorithm_weights()
-        self.scoring_benchmarks = self._init_scoring_benchmarks()
-        self.tier_definitions = self._init_tier_definitions()
-        self.niche_adjustments = self._init_niche_adjustments()
-        
-        # 2026 Technical Optimization Strategies
-        self.technical_optimization_2026 = self._init_2026_technical_optimization()
-    
-    def _init_algorithm_weights(self) -> Dict[str, Any]:
-        """Initialize Instagram algorithm weight configurations"""
-        return {
-            # Feed Algorithm Weights
-            "feed": {
-                "relationship": 0.35,
-                "interest": 0.30,
-                "timeliness": 0.20,
-                "frequency": 0.15,
-                "relationship_signals": {
-                    "dm_history": 25,
-                    "comment_history": 20,
-                    "like_history": 15,
-                    "profile_visit": 15,
-                    "tagged_together": 15,
-                    "story_view": 10
-                },
-                "interest_signals": {
-                    "similar_content_engagement": 30,
-                    "dwell_time": 25,
-                    "save_action": 25,
-                    "share_action": 20
-                },
-                "timeliness_decay": {
-                    "0-1h": 1.0,
-                    "1-6h": 0.7,
-                    "6-24h": 0.4,
-                    "24h+": 0.15
-                }
-            },
-            # Reels Algorithm Weights (Most Critical 2024/2025)
-            "reels": {
-                "watch_time": 0.40,
-                "engagement_velocity": 0.25,
-                "share_rate": 0.20,
-                "audio_trend": 0.15,
-                "watch_time_scoring": {
-                    "0-25%": -50,
-                    "25-50%": 0,
-                    "50-75%": 30,
-                    "75-100%": 60,
-                    "loop_1x": 100,
-                    "loop_2x+": 150
-                },
-                "engagement_velocity_30min": {
-                    "0-10": "low_potential",
-                    "10-50": "medium_potential",
-                    "50-200": "high_potential",
-                    "200+": "viral_candidate"
-                },
-                "share_multipliers": {
-                    "dm_share": 3,
-                    "story_share": 5,
-                    "external_share": 2
-                }
-            },
-            # Explore Algorithm Weights
-            "explore": {
-                "content_quality": 0.35,
-                "user_interest_match": 0.30,
-                "engagement_rate": 0.20,
-                "account_authority": 0.15,
-                "quality_signals": {
-                    "original_content": 40,
-                    "no_watermark": 20,
-                    "hd_quality_1080p": 15,
-                    "text_ratio_under_20": 15,
-                    "no_banned_hashtags": 10
-                },
-                "authority_signals": {
-                    "account_age_6m+": 20,
-                    "consistent_posting_3plus_week": 25,
-                    "niche_consistency": 30,
-                    "follower_following_ratio_above_1": 15,
-                    "verified_badge": 10
-                }
-            },
-            # Search Algorithm Weights
-            "search": {
-                "username_match": 0.30,
-                "bio_keywords": 0.25,
-                "caption_text": 0.20,
-                "hashtag_relevance": 0.15,
-                "engagement": 0.10,
-                "username_optimization": {
-                    "primary_keyword_in_username": 50,
-                    "readable_format": 20,
-                    "under_15_chars": 15,
-                    "no_special_chars": 15
-                },
-                "bio_seo": {
-                    "primary_keyword_first_30_chars": 40,
-                    "secondary_keywords_2_3": 30,
-                    "location_keyword": 20,
-                    "niche_identifier": 10
-                },
-                "caption_seo": {
-                    "keyword_first_125_chars": 35,
-                    "natural_keyword_density_1_2_percent": 25,
-                    "alt_text_usage": 25,
-                    "location_tag": 15
-                }
-            }
-        }
+    def __init__(self, spec: Mapping[str, Any] = _NO_NICHE_ADJUSTMENT):
+        self.er_modifier: float = spec.get("expected_er_modifier", 1.0)
+        self.priority_metric: Optional[str] = spec.get("priority_metric")
+        self.posting_preference: Optional[str] = spec.get("posting_preference")
+        self.posting_frequency_expectation: Optional[str] = spec.get("posting_frequency_expectation")
+        self.features_to_check: Tuple[str, ...] = spec.get("features_to_check", ())
+        self.notes: str = spec.get("notes", "")
+
+
+_NICHE_PROFILES: Mapping[str, _NicheProfile] = MappingProxyType({
+    niche: _NicheProfile(spec) for niche, spec in _NICHE_ADJUSTMENTS.items()
+})
+_NO_NICHE_PROFILE = _NicheProfile()
+
+
+@lru_cache(maxsize=64)
+def _niche_profile(niche: str) -> _NicheProfile:
+    """Niche profile for a free-form niche label (neutral profile if unknown)"""
+    profile = _NICHE_PROFILES.get(niche)
+    if profile is not None:
+        return profile
+    return _NICHE_PROFILES.get(niche.lower().replace(' ', '_'), _NO_NICHE_PROFILE)
+
+
+# Base benchmarks by tier (unknown tiers use micro)
+_TIER_BASE_BENCHMARKS: Mapping[str, Mapping[str, float]] = _freeze({
+    "nano": {"avg_er": 7.0, "growth_rate": 8.0, "save_rate": 2.0, "share_rate": 0.8},
+    "micro": {"avg_er": 4.5, "growth_rate": 5.0, "save_rate": 1.5, "share_rate": 0.5},
+    "mid": {"avg_er": 3.0, "growth_rate": 3.0, "save_rate": 1.2, "share_rate": 0.4},
+    "macro": {"avg_er": 1.8, "growth_rate": 2.0, "save_rate": 0.8, "share_rate": 0.3},
+    "mega": {"avg_er": 1.0, "growth_rate": 1.0, "save_rate": 0.5, "share_rate": 0.2}
+})
+
+
+@lru_cache(maxsize=256)
+def _niche_benchmarks(niche: str, tier: str) -> Mapping[str, Any]:
+    """Niche-adjusted tier benchmarks (read-only; callers get a copy)"""
+    base = _TIER_BASE_BENCHMARKS.get(tier, _TIER_BASE_BENCHMARKS["micro"])
     
-    def _init_scoring_benchmarks(self) -> Dict[str, Any]:
-        """Initialize scoring benchmarks for different metrics"""
-        return {
-            "engagement_rate": {
-                "poor": {"min": 0, "max": 1},
-                "average": {"min": 1, "max": 3},
-                "good": {"min": 3, "max": 6},
-                "excellent": {"min": 6, "max": 100}
-            },
-            "follower_growth": {
-                "poor": {"min": -100, "max": 0},
-                "average": {"min": 0, "max": 2},
-                "good": {"min": 2, "max": 5},
-                "excellent": {"min": 5, "max": 100}
-            },
-            "post_frequency": {
-                "poor": {"posts_per_week": 0, "score": 20},
-                "low": {"posts_per_week": 1, "score": 40},
-                "average": {"posts_per_week": 3, "score": 60},
-                "good": {"posts_per_week": 5, "score": 80},
-                "excellent": {"posts_per_week": 7, "score": 100}
-            },
-            "story_activity": {
-                "none": {"per_day": 0, "score": 0},
-                "low": {"per_day": 2, "score": 40},
-                "average": {"per_day": 5, "score": 70},
-                "good": {"per_day": 7, "score": 85},
-                "excellent": {"per_day": 8, "score": 100}
-            },
-            "reels_ratio": {
-                "none": {"percent": 0, "score": 20},
-                "low": {"percent": 20, "score": 50},
-                "good": {"percent": 50, "score": 85},
-                "excellent": {"percent": 50, "score": 100}
-            },
-            "save_rate": {
-                "poor": {"min": 0, "max": 0.5, "score": 30},
-                "average": {"min": 0.5, "max": 1, "score": 50},
-                "good": {"min": 1, "max": 3, "score": 75},
-                "excellent": {"min": 3, "max": 100, "score": 100}
-            },
-            "share_rate": {
-                "poor": {"min": 0, "max": 0.1, "score": 30},
-                "average": {"min": 0.1, "max": 0.5, "score": 50},
-                "good": {"min": 0.5, "max": 1, "score": 75},
-                "excellent": {"min": 1, "max": 100, "score": 100}
-            },
-            "comment_rate": {
-                "poor": {"min": 0, "max": 0.1, "score": 30},
-                "average": {"min": 0.1, "max": 0.5, "score": 50},
-                "good": {"min": 0.5, "max": 2, "score": 75},
-                "excellent": {"min": 2, "max": 100, "score": 100}
-            }
-        }
+    # Apply niche modifier
+    niche_mod = _niche_profile(niche)
+    modifier = niche_mod.er_modifier
     
-    def _init_tier_definitions(self) -> Dict[str, Any]:
-        """Initialize account tier definitions"""
-        return {
-            "nano": {
-                "min_followers": 1000,
-                "max_followers": 10000,
-                "expected_er_min": 5,
-                "expected_er_max": 12,
-                "growth_potential": "high",
-                "priority": "community_building",
-                "characteristics": "High engagement, low reach"
-            },
-            "micro": {
-                "min_followers": 10000,
-                "max_followers": 50000,
-                "expected_er_min": 3,
-                "expected_er_max": 6,
-                "growth_potential": "medium-high",
-                "priority": "niche_authority",
-                "characteristics": "Balanced metrics"
-            },
-            "mid": {
-                "min_followers": 50000,
-                "max_followers": 100000,
-                "expected_er_min": 2,
-                "expected_er_max": 4,
-                "growth_potential": "medium",
-                "priority": "monetization",
-                "characteristics": "Reach increasing, ER decreasing"
-            },
-            "macro": {
-                "min_followers": 100000,
-                "max_followers": 500000,
-                "expected_er_min": 1,
-                "expected_er_max": 2.5,
-                "growth_potential": "low-medium",
-                "priority": "brand_deals",
-                "characteristics": "High reach, low intimacy"
-            },
-            "mega": {
-                "min_followers": 500000,
-                "max_followers": float('inf'),
-                "expected_er_min": 0.5,
-                "expected_er_max": 1.5,
-                "growth_potential": "low",
-                "priority": "media_value",
-                "characteristics": "Maximum reach, minimum ER"
-            }
+    return MappingProxyType({
+        "niche_average_er": round(base["avg_er"] * modifier, 2),
+        "niche_growth_rate": base["growth_rate"],
+        "niche_save_rate": round(base["save_rate"] * modifier, 2),
+        "niche_share_rate": round(base["share_rate"] * modifier, 2),
+        "adjustment_applied": modifier != 1.0,
+        "niche_notes": niche_mod.notes
+    })
+
+
+# 2026 Instagram Teknik Kurulum ve Hesap Sağlığı
+# Algoritma-dostu teknik ayarlar ve hesap optimizasyonu
+_TECH_OPT_2026: Mapping[str, Any] = _freeze({
+    "account_health_check": {
+        "green_check_system": {
+            "location": "Ayarlar > Hesap Durumu (Account Status)",
+            "requirement": "Tüm maddeler yeşil tik olmalı",
+            "items_to_check": [
+                "Topluluk Kurallarına Uyum",
+                "Önerilme Uygunluğu (Recommendation Eligibility)",
+                "Hesap Güvenliği",
+                "Telif Hakkı İhlali Durumu"
+            ]
+        },
+        "frozen_account_protocol": {
+            "symptoms": "Yeşil tikler tamam ama erişim sıfır",
+            "solution_steps": [
+                "Profil sayfasının ekran görüntüsünü al",
+                "Hesap Durumu sayfasının ekran görüntüsünü al",
+                "Düşük izlenmelerin ekran görüntüsünü al",
+                "Yardım > Sorun Bildir menüsüne git",
+                "Mesaj: 'Hesabım teknik olarak kusursuz ancak erişim kısıtlaması var'",
+                "Ekran görüntülerini ekle ve gönder"
+            ],
+            "expected_response_time": "24-72 saat"
         }
-    
-    def _init_niche_adjustments(self) -> Dict[str, Any]:
-        """Initialize niche-specific adjustments"""
-        return {
-            "b2b": {
-                "expected_er_modifier": 0.6,  # Lower ER is normal
-                "priority_metric": "save_rate",
-                "posting_preference": "weekdays",
-                "notes": "LinkedIn cross-post analysis important"
-            },
-            "ecommerce": {
-                "expected_er_modifier": 0.8,
-                "priority_metric": "conversion_cta",
-                "features_to_check": ["product_tags", "shop_feature", "ugc_ratio"],
-                "notes": "Conversion-focused CTA analysis"
-            },
-            "personal_brand": {
-                "expected_er_modifier": 1.2,  # Higher ER expected
-                "priority_metric": "story_reply_rate",
-                "features_to_check": ["face_visibility", "authenticity_signals", "bts_content"],
-                "notes": "Behind-the-scenes content important"
-            },
-            "media_news": {
-                "expected_er_modifier": 0.7,
-                "priority_metric": "share_rate",
-                "posting_frequency_expectation": "high",
-                "features_to_check": ["timeliness", "breaking_content"],
-                "notes": "Timeliness is critical"
-            },
-            "lifestyle": {
-                "expected_er_modifier": 1.0,
-                "priority_metric": "engagement_quality",
-                "features_to_check": ["aesthetic_consistency", "story_engagement"],
-                "notes": "Visual consistency important"
-            },
-            "education": {
-                "expected_er_modifier": 1.1,
-                "priority_metric": "save_rate",
-                "features_to_check": ["carousel_usage", "value_delivery"],
-                "notes": "Save rate indicates content value"
-            },
-            "fitness": {
-                "expected_er_modifier": 1.0,
-                "priority_metric": "reels_performance",
-                "features_to_check": ["transformation_content", "tutorial_engagement"],
-                "notes": "Before/after content performs well"
-            },
-            "food": {
-                "expected_er_modifier": 1.1,
-                "priority_metric": "save_rate",
-                "features_to_check": ["recipe_saves", "location_tags"],
-                "notes": "Recipe content has high save rate"
-            },
-            "travel": {
-                "expected_er_modifier": 0.9,
-                "priority_metric": "engagement_quality",
-                "features_to_check": ["location_diversity", "seasonal_patterns"],
-                "notes": "Seasonal account adjustments needed"
-            },
-            "tech": {
-                "expected_er_modifier": 0.8,
-                "priority_metric": "share_rate",
-                "features_to_check": ["tutorial_content", "review_engagement"],
-                "notes": "Educational content priority"
-            }
+    },
+    "critical_settings": {
+        "media_quality": {
+            "setting_path": "Ayarlar > Hesap > Medya Kalitesi",
+            "required_state": "AÇIK",
+            "option": "En Yüksek Kalitede Yükle",
+            "impact": "Düşük kalite yükleme erişimi %30-50 azaltır",
+            "note": "Mobil veri kullanırken bile açık bırak"
+        },
+        "hide_like_count": {
+            "setting_path": "Yükleme ekranı > Gelişmiş Ayarlar",
+            "required_state": "AÇIK",
+            "reason": "Az beğeni görünümü psikolojik engel yaratır",
+            "psychology": "İlk izleyiciler az beğeni görünce videoyu geçer",
+            "algorithm_benefit": "İlk saatlerdeki engagement düşüşünü önler"
+        },
+        "disable_download": {
+            "setting_path": "Yükleme ekranı > Gelişmiş Ayarlar",
+            "required_state": "AÇIK (İndirmeyi Kapat)",
+            "reason": "Instagram içi paylaşım algoritma için daha değerli",
+            "priority": "Share/Save > Download",
+            "note": "İndirme algoritma sinyali sıfır, paylaşım ise yüksek"
+        },
+        "flag_for_review": {
+            "setting_path": "Ayarlar > Gizlilik > Takip ve Davet",
+            "required_state": "KAPALI",
+            "risk": "Gerçek takipçilerin spam olarak filtrelenmesi",
+            "recommendation": "Spam koruması otomatik yeterli, manuel flagleme gereksiz"
         }
-    
-    def _init_2026_technical_optimization(self) -> Dict[str, Any]:
-        """
-        2026 Instagram Teknik Kurulum ve Hesap Sağlığı
-        Algoritma-dostu teknik ayarlar ve hesap optimizasyonu
-        """
-        return {
-            "account_health_check": {
-                "green_check_system": {
-                    "location": "Ayarlar > Hesap Durumu (Account Status)",
-                    "requirement": "Tüm maddeler yeşil tik olmalı",
-                    "items_to_check": [
-                        "Topluluk Kurallarına Uyum",
-                        "Önerilme Uygunluğu (Recommendation Eligibility)",
-                        "Hesap Güvenliği",
-                        "Telif Hakkı İhlali Durumu"
-                    ]
-                },
-                "frozen_account_protocol": {
-                    "symptoms": "Yeşil tikler tamam ama erişim sıfır",
-                    "solution_steps": [
-                        "Profil sayfasının ekran görüntüsünü al",
-                        "Hesap Durumu sayfasının ekran görüntüsünü al",
-                        "Düşük izlenmelerin ekran görüntüsünü al",
-                        "Yardım > Sorun Bildir menüsüne git",
-                        "Mesaj: 'Hesabım teknik olarak kusursuz ancak erişim kısıtlaması var'",
-                        "Ekran görüntülerini ekle ve gönder"
-                    ],
-                    "expected_response_time": "24-72 saat"
-                }
-            },
-            "critical_settings": {
-                "media_quality": {
-                    "setting_path": "Ayarlar > Hesap > Medya Kalitesi",
-                    "required_state": "AÇIK",
-                    "option": "En Yüksek Kalitede Yükle",
-                    "impact": "Düşük kalite yükleme erişimi %30-50 azaltır",
-                    "note": "Mobil veri kullanırken bile açık bırak"
-                },
-                "hide_like_count": {
-                    "setting_path": "Yükleme ekranı > Gelişmiş Ayarlar",
-                    "required_state": "AÇIK",
-                    "reason": "Az beğeni görünümü psikolojik engel yaratır",
-                    "psychology": "İlk izleyiciler az beğeni görünce videoyu geçer",
-                    "algorithm_benefit": "İlk saatlerdeki engagement düşüşünü önler"
-                },
-                "disable_download": {
-                    "setting_path": "Yükleme ekranı > Gelişmiş Ayarlar",
-                    "required_state": "AÇIK (İndirmeyi Kapat)",
-                    "reason": "Instagram içi paylaşım algoritma için daha değerli",
-                    "priority": "Share/Save > Download",
-                    "note": "İndirme algoritma sinyali sıfır, paylaşım ise yüksek"
-                },
-                "flag_for_review": {
-                    "setting_path": "Ayarlar > Gizlilik > Takip ve Davet",
-                    "required_state": "KAPALI",
-                    "risk": "Gerçek takipçilerin spam olarak filtrelenmesi",
-                    "recommendation": "Spam koruması otomatik yeterli, manuel flagleme gereksiz"
-                }
-            },
-            "upload_optimization": {
-                "video_specs": {
-                    "resolution": "1080x1920 (9:16 aspect ratio)",
-                    "minimum_quality": "1080p",
-                    "bitrate": "Minimum 5 Mbps",
-                    "framerate": "30 fps (viral içerik), 60 fps (smooth motion)",
-                    "format": "MP4 (H.264 codec)",
-                    "audio": "AAC codec, 128+ kbps"
-                },
-                "image_specs": {
-                    "feed_post": "1080x1080 (1:1) veya 1080x1350 (4:5)",
-                    "story": "1080x1920 (9:16)",
-                    "format": "JPG veya PNG",
-                    "max_file_size": "30 MB",
-                    "color_space": "sRGB"
-                },
-                "carousel_best_practices": [
-                    "İlk kare en güçlü hook olmalı",
-                    "Maksimum 10 slide (3-7 ideal)",
-                    "Her slide 3-5 saniye değerinde olmalı",
-                    "Son slide'da CTA (yorum yap, kaydet, paylaş)"
-                ]
-            },
-            "posting_strategy_2026": {
-                "frequency": {
-                    "minimum": "3 post/hafta (hesap sağlığı için)",
-                    "optimal_growth": "5-7 post/hafta",
-                    "maximum_safe": "14 post/hafta (günde 2)",
-                    "trial_reels": "Haftalık içeriğin %50'si trial reel olmalı"
-                },
-                "timing": {
-                    "analysis_method": "Son 10 postun etkileşim aldığı saatleri analiz et",
-                    "general_peaks": ["08:00-10:00", "12:00-14:00", "18:00-22:00"],
-                    "avoid": "02:00-06:00 (düşük aktivite)",
-                    "note": "Her hesabın kendi kitlesi için unique timing vardır"
-                },
-                "content_mix": {
-                    "reels": "60% (en yüksek erişim)",
-                    "carousel": "25% (save rate yüksek)",
-                    "single_image": "15% (niche için özel durumlar)",
-                    "trial_reels": "Toplam reels'in %50'si trial olarak paylaş"
-                }
-            },
-            "hashtag_strategy_2026": {
-                "quantity": "5-10 hashtag (spam algılanmamak için)",
-                "distribution": {
-                    "small": "2-3 hashtag (10K-50K post)",
-                    "medium": "3-4 hashtag (50K-500K post)",
-                    "large": "2-3 hashtag (500K+ post)"
-                },
-                "placement": "Caption içinde değil, ilk yorumda",
-                "research": "Hedef kitlenin kullandığı hashtagleri takip et",
-                "banned_check": "Banned hashtag kullanımı erişimi %80 azaltır",
-                "trend_hashtags": "1-2 trending hashtag ekle (keşfet boost)"
-            },
-            "caption_optimization": {
-                "hook_rule": "İlk 125 karakter kritik (Daha Fazla'dan öncesi)",
-                "structure": [
-                    "1-2 cümle: Hook (merak uyandırıcı)",
-                    "3-5 cümle: Value (içerik özeti)",
-                    "CTA: Yorum yap/Kaydet/Paylaş çağrısı",
-                    "Hashtags: İlk yorumda"
-                ],
-                "length": "150-300 karakter (optimal engagement)",
-                "emojis": "3-5 emoji kullan (dikkat çekici ama spam değil)",
-                "line_breaks": "Her 2-3 cümlede satır atla (okunabilirlik)"
-            },
-            "story_strategy": {
-                "frequency": "Günde 3-7 story (sürekli görünür ol)",
-                "engagement_tactics": [
-                    "Anket (Poll): En yüksek etkileşim",
-                    "Soru sticker: DM trafiği yaratır",
-                    "Slider: Eğlenceli ve hızlı etkileşim",
-                    "Quiz: Educasyonel içerik için ideal",
-                    "Link sticker: 10K+ follower için özel"
-                ],
-                "reshare_protocol": "Yeni post yükledikten sonra 20 dk içinde story'de paylaş",
-                "note": "Story'de 'Yeni Post' yazma, anket/soru ile etkileşim yarat"
-            },
-            "analytics_tracking": {
-                "daily_check": [
-                    "Erişim: Takipçi/Takipçi olmayan oranı",
-                    "Engagement rate: Like + Comment / Reach",
-                    "Save rate: Saves / Reach (değerli içerik sinyali)",
-                    "Share rate: Shares / Reach (viral potansiyel)"
-                ],
-                "weekly_analysis": [
-                    "En iyi performans gösteren 3 post",
-                    "Bu postların ortak özellikleri (format, konu, hook)",
-                    "Trial reels başarı oranı (%50+ non-follower reach)",
-                    "Takipçi büyüme hızı (Net growth rate)"
-                ],
-                "red_flags": [
-                    "Reach %70+ düşüş: Shadowban şüphesi",
-                    "Engagement rate %50+ düşüş: İçerik kalitesi sorunu",
-                    "Takipçi kaybı: İçerik niche uyumsuzluğu",
-                    "Story görüntülenme %60+ düşüş: Algoritma cezası"
-                ]
-            }
+    },
+    "upload_optimization": {
+        "video_specs": {
+            "resolution": "1080x1920 (9:16 aspect ratio)",
+            "minimum_quality": "1080p",
+            "bitrate": "Minimum 5 Mbps",
+            "framerate": "30 fps (viral içerik), 60 fps (smooth motion)",
+            "format": "MP4 (H.264 codec)",
+            "audio": "AAC codec, 128+ kbps"
+        },
+        "image_specs": {
+            "feed_post": "1080x1080 (1:1) veya 1080x1350 (4:5)",
+            "story": "1080x1920 (9:16)",
+            "format": "JPG veya PNG",
+            "max_file_size": "30 MB",
+            "color_space": "sRGB"
+        },
+        "carousel_best_practices": [
+            "İlk kare en güçlü hook olmalı",
+            "Maksimum 10 slide (3-7 ideal)",
+            "Her slide 3-5 saniye değerinde olmalı",
+            "Son slide'da CTA (yorum yap, kaydet, paylaş)"
+        ]
+    },
+    "posting_strategy_2026": {
+        "frequency": {
+            "minimum": "3 post/hafta (hesap sağlığı için)",
+            "optimal_growth": "5-7 post/hafta",
+            "maximum_safe": "14 post/hafta (günde 2)",
+            "trial_reels": "Haftalık içeriğin %50'si trial reel olmalı"
+        },
+        "timing": {
+            "analysis_method": "Son 10 postun etkileşim aldığı saatleri analiz et",
+            "general_peaks": ["08:00-10:00", "12:00-14:00", "18:00-22:00"],
+            "avoid": "02:00-06:00 (düşük aktivite)",
+            "note": "Her hesabın kendi kitlesi için unique timing vardır"
+        },
+        "content_mix": {
+            "reels": "60% (en yüksek erişim)",
+            "carousel": "25% (save rate yüksek)",
+            "single_image": "15% (niche için özel durumlar)",
+            "trial_reels": "Toplam reels'in %50'si trial olarak paylaş"
         }
+    },
+    "hashtag_strategy_2026": {
+        "quantity": "5-10 hashtag (spam algılanmamak için)",
+        "distribution": {
+            "small": "2-3 hashtag (10K-50K post)",
+            "medium": "3-4 hashtag (50K-500K post)",
+            "large": "2-3 hashtag (500K+ post)"
+        },
+        "placement": "Caption içinde değil, ilk yorumda",
+        "research": "Hedef kitlenin kullandığı hashtagleri takip et",
+        "banned_check": "Banned hashtag kullanımı erişimi %80 azaltır",
+        "trend_hashtags": "1-2 trending hashtag ekle (keşfet boost)"
+    },
+    "caption_optimization": {
+        "hook_rule": "İlk 125 karakter kritik (Daha Fazla'dan öncesi)",
+        "structure": [
+            "1-2 cümle: Hook (merak uyandırıcı)",
+            "3-5 cümle: Value (içerik özeti)",
+            "CTA: Yorum yap/Kaydet/Paylaş çağrısı",
+            "Hashtags: İlk yorumda"
+        ],
+        "length": "150-300 karakter (optimal engagement)",
+        "emojis": "3-5 emoji kullan (dikkat çekici ama spam değil)",
+        "line_breaks": "Her 2-3 cümlede satır atla (okunabilirlik)"
+    },
+    "story_strategy": {
+        "frequency": "Günde 3-7 story (sürekli görünür ol)",
+        "engagement_tactics": [
+            "Anket (Poll): En yüksek etkileşim",
+            "Soru sticker: DM trafiği yaratır",
+            "Slider: Eğlenceli ve hızlı etkileşim",
+            "Quiz: Educasyonel içerik için ideal",
+            "Link sticker: 10K+ follower için özel"
+        ],
+        "reshare_protocol": "Yeni post yükledikten sonra 20 dk içinde story'de paylaş",
+        "note": "Story'de 'Yeni Post' yazma, anket/soru ile etkileşim yarat"
+    },
+    "analytics_tracking": {
+        "daily_check": [
+            "Erişim: Takipçi/Takipçi olmayan oranı",
+            "Engagement rate: Like + Comment / Reach",
+            "Save rate: Saves / Reach (değerli içerik sinyali)",
+            "Share rate: Shares / Reach (viral potansiyel)"
+        ],
+        "weekly_analysis": [
+            "En iyi performans gösteren 3 post",
+            "Bu postların ortak özellikleri (format, konu, hook)",
+            "Trial reels başarı oranı (%50+ non-follower reach)",
+            "Takipçi büyüme hızı (Net growth rate)"
+        ],
+        "red_flags": [
+            "Reach %70+ düşüş: Shadowban şüphesi",
+            "Engagement rate %50+ düşüş: İçerik kalitesi sorunu",
+            "Takipçi kaybı: İçerik niche uyumsuzluğu",
+            "Story görüntülenme %60+ düşüş: Algoritma cezası"
+        ]
+    }
+})
+
+
+# (account_data key, default) pairs read by get_analysis_prompt, in unpack order.
+# Any falsy value in these fields takes the default ...
+_ACCOUNT_FIELDS: Tuple[Tuple[str, Any], ...] = (
+    ("username", "unknown"),
+    ("followers", 0),
+    ("following", 0),
+    ("posts", 0),
+    ("engagementRate", 0),
+    ("avgLikes", 0),
+    ("avgComments", 0),
+    ("avgSaves", 0),
+    ("avgShares", 0),
+    ("niche", "General"),
+    ("bio", "No bio"),
+)
+
+# ... while these are used as given when present
+_ACCOUNT_RAW_FIELDS: Tuple[Tuple[str, Any], ...] = (
+    ("isBusiness", False),
+    ("verified", False),
+    ("recentPosts", []),
+    ("accountAgeDays", 365),
+    ("postingFrequency", {}),
+    ("hashtagData", {}),
+    ("storyData", {}),
+    ("reelsData", {}),
+)
+
+
+def _field_or_default(value: Any, default: Any) -> Any:
+    """Missing (None) or blank ("") fields take the default; other falsy values are kept"""
+    return default if value is None or value == "" else value
+
+
+def _post_epoch(value: Any) -> int:
+    """Unix seconds for a post timestamp (ISO string or epoch s/ms); 0 if unknown"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        try:
+            seconds = value / 1000 if value > 1e12 else value
+        except OverflowError:
+            return 0
+        return int(seconds) if 0 < seconds < 1e12 else 0
+    if isinstance(value, str) and value:
+        try:
+            return int(datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp())
+        except ValueError:
+            return 0
+    return 0
+
+
+# Abbreviated counter suffixes as scraped ("1.2K", "3M")
+_COUNT_SUFFIXES: Mapping[str, float] = MappingProxyType({"K": 1e3, "M": 1e6, "B": 1e9})
+
+
+def _post_count(value: Any) -> float:
+    """A post counter (likes, comments, ...) as float; 0 if missing or unparseable"""
+    if isinstance(value, (int, float)):
+        try:
+            return float(value)
+        except OverflowError:
+            return 0.0
+    if isinstance(value, str):
+        text = value.strip().replace(',', '').upper()
+        scale = _COUNT_SUFFIXES.get(text[-1:])
+        try:
+            return float(text[:-1]) * scale if scale else float(text)
+        except ValueError:
+            return 0.0
+    return 0.0
+
+
+# Recent posts as a typed structured array (one named column per field);
+# format holds an index into the per-call label tuple from _posts_to_sarr
+_POST_DTYPE = np.dtype([
+    ("likes", np.float64),
+    ("comments", np.float64),
+    ("saves", np.float64),
+    ("shares", np.float64),
+    ("ts", np.int64),
+    ("format", np.intp),
+])
+
+
+def _posts_to_sarr(recent_posts: Sequence[Any]) -> Tuple[np.ndarray, Tuple[str, ...]]:
+    """
+    Convert recentPosts dicts to a _POST_DTYPE structured array in one pass.
     
-    def get_system_prompt(self) -> str:
-        return """Sen Content Strategist Agent'sın - Instagram Algoritma ve İçerik Stratejisi Uzmanı.
+    Returns (array, format_labels): the post types (lowercased, 'unknown'
+    when missing) in first-seen order, indexed by the format column.
+    """
+    format_codes: Dict[str, int] = {}
+    rows = [
+        (
+            _post_count(p.get('likesCount', p.get('likes', 0))),
+            _post_count(p.get('commentsCount', p.get('comments', 0))),
+            _post_count(p.get('saves', 0)),
+            _post_count(p.get('shares', 0)),
+            _post_epoch(p.get('timestamp')),
+            format_codes.setdefault(str(p.get('type') or 'unknown').lower(), len(format_codes)),
+        )
+        for p in (recent_posts or ()) if isinstance(p, dict)
+    ]
+    return np.array(rows, dtype=_POST_DTYPE), tuple(format_codes)
+
+
+# Batch account scoring (score_accounts): one row per account
+_ENGAGEMENT_QUALITY_BENCHMARK = 12.0  # average weighted engagement score
+_ACCOUNT_SCORE_DTYPE = np.dtype([
+    ("tier", "U5"),
+    ("engagement_level", "U9"),
+    ("er_vs_expected", np.float64),
+    ("engagement_quality", np.float64),
+    ("save_score", np.int16),
+    ("share_score", np.int16),
+    ("comment_score", np.int16),
+])
+_TIER_NAMES_ARR = np.array(_TIER_NAMES)
+_TIER_EXPECTED_ER = np.array([
+    (_TIER_DEFINITIONS[t]["expected_er_min"] + _TIER_DEFINITIONS[t]["expected_er_max"]) / 2
+    for t in _TIER_NAMES
+], dtype=np.float64)
+
+
+def _account_column(accounts: Sequence[Mapping[str, Any]], key: str, default: float = 0) -> np.ndarray:
+    """One numeric account_data field across all accounts as a float64 column"""
+    return np.fromiter(
+        (_field_or_default(a.get(key), default) for a in accounts),
+        dtype=np.float64,
+        count=len(accounts),
+    )
+
+
+# Ideal hashtag size mix (Large 10-15%, Medium 40-50%, Small 35-45%, Micro 5-10%)
+_IDEAL_HASHTAG_SIZES: Mapping[str, float] = MappingProxyType({
+    "large": 0.125, "medium": 0.45, "small": 0.40, "micro": 0.075,
+})
+
+
+# Step-score ladders: score = SCORES[bisect_right(THRESHOLDS, value)].
+# Where bucket 0 scales linearly with the input its table entry is unused.
+_HASHTAG_RELEVANCE_THRESHOLDS: Tuple[float, ...] = (60, 80)
+_HASHTAG_RELEVANCE_SCORES: Tuple[float, ...] = (0, 80, 100)  # <60: relevance_percent
+_HASHTAG_DIVERSITY_THRESHOLDS: Tuple[float, ...] = (50, 70, 100)
+_HASHTAG_DIVERSITY_SCORES: Tuple[float, ...] = (0, 60, 80, 100)  # <50: rotation_rate × 0.8
+_HASHTAG_PERFORMANCE_THRESHOLDS: Tuple[float, ...] = (5, 10, 20, 30)
+_HASHTAG_PERFORMANCE_SCORES: Tuple[int, ...] = (20, 40, 60, 80, 100)
+
+# Algorithm alignment / trend utilization: flag bit i is worth POINTS[i]; the
+# score of every flag combination is tabulated once, indexed by the bitmask
+_ALIGNMENT_POINTS: Tuple[int, ...] = (30, 25, 20, 15, 10)  # reels, time, caption SEO, hashtags, alt text
+_TREND_POINTS: Tuple[int, ...] = (40, 30, 20, 10)  # audio, format, seasonal, viral template
+
+
+def _mask_score_table(points: Tuple[int, ...]) -> Tuple[int, ...]:
+    """Score for each bitmask over len(points) flags"""
+    return tuple(
+        sum(p for bit, p in enumerate(points) if mask >> bit & 1)
+        for mask in range(1 << len(points))
+    )
+
+
+_ALIGNMENT_SCORES: Tuple[float, ...] = tuple(map(float, _mask_score_table(_ALIGNMENT_POINTS)))
+_TREND_SCORES: Tuple[float, ...] = tuple(map(float, _mask_score_table(_TREND_POINTS)))
+
+
+# Caption quality section points, in mask bit order (each section max 100)
+_HOOK_POINTS: Tuple[int, ...] = (25, 25, 15, 20, 15)  # question, number list, emoji start, <10 words, pattern interrupt
+_VALUE_POINTS: Tuple[int, ...] = (35, 25, 25, 15)  # actionable, example, problem/solution, unique insight
+_CTA_POINTS: Tuple[int, ...] = (40, 30, 20, 10)  # clear CTA, matches engagement, last line, emoji
+_SEO_POINTS: Tuple[int, ...] = (40, 25, 20, 15)  # keyword in first 125, secondary keywords, density, location
+_READABILITY_POINTS: Tuple[int, ...] = (30, 25, 25, 20)  # paragraphs, 3-7 emoji, line breaks, short sentences
+
+_HOOK_SCORES = _mask_score_table(_HOOK_POINTS)
+_VALUE_SCORES = _mask_score_table(_VALUE_POINTS)
+_CTA_SCORES = _mask_score_table(_CTA_POINTS)
+_SEO_SCORES = _mask_score_table(_SEO_POINTS)
+_READABILITY_SCORES = _mask_score_table(_READABILITY_POINTS)
+
+
+# Content diversity topic variety score by pillar count (5+ pillars = 100)
+_TOPIC_VARIETY_SCORES: Tuple[int, ...] = (20, 20, 40, 60, 80, 100)
+
+# Impact/effort matrix bucket per (impact, effort); other pairs go to the backlog
+_PRIORITY_BUCKETS: Mapping[Tuple[str, str], str] = MappingProxyType({
+    ("high", "low"): "p1_immediate",
+    ("high", "medium"): "p2_short_term",
+    ("medium", "low"): "p2_short_term",
+    ("high", "high"): "p3_planned",
+    ("medium", "medium"): "p3_planned",
+    ("medium", "high"): "p4_low_priority",
+    ("low", "low"): "p4_low_priority",
+    ("low", "medium"): "p4_low_priority",
+})
+
+
+# System prompt is static; one shared string for every call
+_SYSTEM_PROMPT = """Sen Content Strategist Agent'sın - Instagram Algoritma ve İçerik Stratejisi Uzmanı.
 
 ## TEMEL UZMANLIK ALANLARIN:
 
@@ -629,65 +913,40 @@ class ContentStrategistAgent(BaseAgent):
 
 OUTPUT FORMAT: Sadece geçerli JSON objesi döndür."""
 
-    def get_analysis_prompt(self, account_data: Dict[str, Any]) -> str:
-        username = account_data.get('username', 'unknown') or 'unknown'
-        followers = account_data.get('followers', 0) or 0
-        following = account_data.get('following', 0) or 0
-        posts = account_data.get('posts', 0) or 0
-        engagement_rate = account_data.get('engagementRate', 0) or 0
-        avg_likes = account_data.get('avgLikes', 0) or 0
-        avg_comments = account_data.get('avgComments', 0) or 0
-        avg_saves = account_data.get('avgSaves', 0) or 0
-        avg_shares = account_data.get('avgShares', 0) or 0
-        niche = account_data.get('niche', 'General') or 'General'
-        bio = account_data.get('bio', 'No bio') or 'No bio'
-        is_business = account_data.get('isBusiness', False)
-        verified = account_data.get('verified', False)
-        recent_posts = account_data.get('recentPosts', [])
-        account_age_days = account_data.get('accountAgeDays', 365)
-        posting_frequency = account_data.get('postingFrequency', {})
-        hashtag_data = account_data.get('hashtagData', {})
-        story_data = account_data.get('storyData', {})
-        reels_data = account_data.get('reelsData', {})
-        
-        # Calculate tier
-        tier = self._calculate_tier(followers)
-        tier_info = self.tier_definitions.get(tier, {})
-        
-        # Get niche adjustments
-        niche_key = niche.lower().replace(' ', '_')
-        niche_adjustment = self.niche_adjustments.get(niche_key, {})
-        
-        return f"""Bu Instagram hesabı için kapsamlı Content Strategy analizi yap:
+
+# Analysis prompt, split at the last placeholder: the head is a printf-style
+# %(name)s template (literal % doubled), the constant tail follows it as is.
+# Both are pre-split into segments below and filled in _analysis_prompt_parts.
+_ANALYSIS_PROMPT_HEAD = """Bu Instagram hesabı için kapsamlı Content Strategy analizi yap:
 
 ## HESAP VERİLERİ:
-- Username: @{username}
-- Takipçi: {followers:,}
-- Takip: {following:,}
-- Gönderi Sayısı: {posts:,}
-- Engagement Rate: {engagement_rate:.2f}%
-- Ortalama Like: {avg_likes:,.0f}
-- Ortalama Yorum: {avg_comments:,.0f}
-- Ortalama Kaydetme: {avg_saves:,.0f}
-- Ortalama Paylaşım: {avg_shares:,.0f}
-- Niche: {niche}
-- Bio: {bio}
-- İş Hesabı: {is_business}
-- Onaylı: {verified}
-- Hesap Yaşı (gün): {account_age_days}
-- Son Analiz Edilen Post Sayısı: {len(recent_posts)}
+- Username: @%(username)s
+- Takipçi: %(followers)s
+- Takip: %(following)s
+- Gönderi Sayısı: %(posts_fmt)s
+- Engagement Rate: %(engagement_rate)s%%
+- Ortalama Like: %(avg_likes)s
+- Ortalama Yorum: %(avg_comments)s
+- Ortalama Kaydetme: %(avg_saves)s
+- Ortalama Paylaşım: %(avg_shares)s
+- Niche: %(niche)s
+- Bio: %(bio)s
+- İş Hesabı: %(is_business)s
+- Onaylı: %(verified)s
+- Hesap Yaşı (gün): %(account_age_days)s
+- Son Analiz Edilen Post Sayısı: %(post_count)s
 
 ## TİER BİLGİSİ:
-- Tier: {tier.upper()}
-- Beklenen ER Aralığı: %{tier_info.get('expected_er_min', 0)}-{tier_info.get('expected_er_max', 0)}
-- Büyüme Potansiyeli: {tier_info.get('growth_potential', 'unknown')}
-- Öncelik: {tier_info.get('priority', 'unknown')}
+- Tier: %(tier_upper)s
+- Beklenen ER Aralığı: %%%(expected_er_min)s-%(expected_er_max)s
+- Büyüme Potansiyeli: %(growth_potential)s
+- Öncelik: %(tier_priority)s
 
 ## POSTING VERİLERİ:
-- Posting Frequency: {json.dumps(posting_frequency, indent=2) if posting_frequency else 'Veri yok'}
-- Story Data: {json.dumps(story_data, indent=2) if story_data else 'Veri yok'}
-- Reels Data: {json.dumps(reels_data, indent=2) if reels_data else 'Veri yok'}
-- Hashtag Data: {json.dumps(hashtag_data, indent=2) if hashtag_data else 'Veri yok'}
+- Posting Frequency: %(posting_frequency_json)s
+- Story Data: %(story_data_json)s
+- Reels Data: %(reels_data_json)s
+- Hashtag Data: %(hashtag_data_json)s
 
 ## ANALİZ GÖREVLERİ:
 
@@ -728,7 +987,7 @@ OUTPUT FORMAT: Sadece geçerli JSON objesi döndür."""
    - Search/SEO optimizasyonu
 
 7. **Niche Spesifik Değerlendirme:**
-   - {niche} için özel metrikler
+   - %(niche)s için özel metrikler
    - Benchmark karşılaştırması
    - Sektör ayarlamaları
 
@@ -741,21 +1000,21 @@ OUTPUT FORMAT: Sadece geçerli JSON objesi döndür."""
 
 Aşağıdaki JSON yapısında yanıt ver:
 
-{{
+{
     "agent": "content_strategist",
-    "analysis_timestamp": "{datetime.now().isoformat()}",
-    "account_profile": {{
-        "tier": "{tier}",
-        "primary_niche": "{niche}",
+    "analysis_timestamp": "%(analysis_timestamp)s",
+    "account_profile": {
+        "tier": "%(tier)s",
+        "primary_niche": "%(niche)s",
         "secondary_niches": ["string", "string"],
         "niche_confidence": 0.85,
-        "account_age_days": {account_age_days},
-        "total_posts": {posts},
-        "follower_following_ratio": {followers / max(following, 1):.2f},
-        "is_business": {str(is_business).lower()},
-        "is_verified": {str(verified).lower()}
-    }},
-    "metrics": {{
+        "account_age_days": %(account_age_days)s,
+        "total_posts": %(posts)s,
+        "follower_following_ratio": %(follower_following_ratio)s,
+        "is_business": %(is_business_json)s,
+        "is_verified": %(verified_json)s
+    },
+    "metrics": {
         "contentEffectivenessScore": 0,
         "postingConsistency": "high|medium|low",
         "postingConsistencyScore": 0,
@@ -774,33 +1033,33 @@ Aşağıdaki JSON yapısında yanıt ver:
         "singlePostRatio": 0,
         "postsPerWeek": 0,
         "overallScore": 0
-    }},
-    "detailed_scores": {{
-        "content_effectiveness": {{
+    },
+    "detailed_scores": {
+        "content_effectiveness": {
             "score": 0,
-            "format_diversity": {{
+            "format_diversity": {
                 "score": 0,
-                "breakdown": {{
+                "breakdown": {
                     "reels_ratio": 0.0,
                     "carousel_ratio": 0.0,
                     "single_ratio": 0.0,
                     "story_frequency_daily": 0.0
-                }},
+                },
                 "entropy_value": 0.0,
                 "recommendation": "string"
-            }},
-            "engagement_quality": {{
+            },
+            "engagement_quality": {
                 "score": 0,
-                "rates": {{
+                "rates": {
                     "save_rate": 0.0,
                     "share_rate": 0.0,
                     "comment_rate": 0.0,
                     "like_rate": 0.0
-                }},
+                },
                 "weighted_score": 0.0,
                 "vs_benchmark": "above|at|below"
-            }},
-            "posting_consistency": {{
+            },
+            "posting_consistency": {
                 "score": 0,
                 "level": "high|medium|low",
                 "posts_per_week_avg": 0.0,
@@ -808,242 +1067,242 @@ Aşağıdaki JSON yapısında yanıt ver:
                 "std_deviation_days": 0.0,
                 "bonuses_applied": [],
                 "penalties_applied": []
-            }},
-            "algorithm_alignment": {{
+            },
+            "algorithm_alignment": {
                 "score": 0,
-                "factors": {{
+                "factors": {
                     "reels_usage_adequate": true,
                     "optimal_posting_time": true,
                     "caption_seo_optimized": true,
                     "hashtag_strategy": "strong|medium|weak",
                     "alt_text_usage": true
-                }}
-            }},
-            "trend_utilization": {{
+                }
+            },
+            "trend_utilization": {
                 "score": 0,
                 "trending_audio_usage": true,
                 "trending_format_adoption": true,
                 "seasonal_content": true,
                 "viral_template_usage": true
-            }}
-        }},
-        "hashtag_effectiveness": {{
+            }
+        },
+        "hashtag_effectiveness": {
             "score": 0,
-            "relevance": {{
+            "relevance": {
                 "score": 0,
                 "niche_alignment_percent": 0
-            }},
-            "size_distribution": {{
+            },
+            "size_distribution": {
                 "score": 0,
                 "large_1m_plus": 0,
                 "medium_100k_1m": 0,
                 "small_10k_100k": 0,
                 "micro_under_10k": 0,
                 "deviation_from_ideal": 0
-            }},
-            "diversity": {{
+            },
+            "diversity": {
                 "score": 0,
                 "rotation_rate_percent": 0,
                 "unique_sets_used": 0
-            }},
-            "performance": {{
+            },
+            "performance": {
                 "score": 0,
                 "reach_from_hashtags_percent": 0
-            }}
-        }},
-        "caption_quality": {{
+            }
+        },
+        "caption_quality": {
             "score": 0,
-            "hook_strength": {{
+            "hook_strength": {
                 "score": 0,
                 "has_question": true,
                 "has_number_list": true,
                 "starts_with_emoji": true,
                 "under_10_words": true,
                 "has_pattern_interrupt": true
-            }},
-            "value_delivery": {{
+            },
+            "value_delivery": {
                 "score": 0,
                 "has_actionable_info": true,
                 "has_specific_example": true,
                 "has_problem_solution": true,
                 "has_unique_insight": true
-            }},
-            "cta_effectiveness": {{
+            },
+            "cta_effectiveness": {
                 "score": 0,
                 "has_clear_cta": true,
                 "cta_matches_engagement_type": true,
                 "cta_in_last_line": true,
                 "cta_has_emoji": true
-            }},
-            "seo_optimization": {{
+            },
+            "seo_optimization": {
                 "score": 0,
                 "primary_keyword_in_first_125": true,
                 "has_secondary_keywords": true,
                 "natural_keyword_density": true,
                 "has_location_mention": true
-            }},
-            "readability": {{
+            },
+            "readability": {
                 "score": 0,
                 "has_paragraph_breaks": true,
                 "emoji_count_3_to_7": true,
                 "has_line_breaks": true,
                 "avg_sentence_under_15_words": true
-            }}
-        }},
-        "content_diversity": {{
+            }
+        },
+        "content_diversity": {
             "score": 0,
-            "format_mix": {{
+            "format_mix": {
                 "score": 0,
                 "shannon_entropy": 0.0,
                 "max_entropy": 0.0,
                 "normalized_score": 0
-            }},
-            "topic_variety": {{
+            },
+            "topic_variety": {
                 "score": 0,
                 "content_pillars_count": 0,
                 "pillars_identified": []
-            }},
-            "visual_diversity": {{
+            },
+            "visual_diversity": {
                 "score": 0,
                 "color_palette_variation": "high|medium|low",
                 "composition_variety": "high|medium|low",
                 "text_to_visual_ratio_variation": "high|medium|low"
-            }},
-            "tone_range": {{
+            },
+            "tone_range": {
                 "score": 0,
-                "distribution": {{
+                "distribution": {
                     "educational": 0,
                     "entertaining": 0,
                     "inspirational": 0,
                     "promotional": 0,
                     "personal": 0
-                }},
+                },
                 "dominant_tone_under_50_percent": true,
                 "active_tones_count": 0
-            }}
-        }},
-        "algorithm_alignment": {{
+            }
+        },
+        "algorithm_alignment": {
             "overall_score": 0,
-            "feed_algorithm": {{
+            "feed_algorithm": {
                 "score": 0,
                 "relationship_building": "strong|medium|weak",
                 "interest_targeting": "strong|medium|weak",
                 "timeliness": "good|needs_improvement"
-            }},
-            "reels_algorithm": {{
+            },
+            "reels_algorithm": {
                 "score": 0,
                 "watch_time_potential": "high|medium|low",
                 "engagement_velocity_potential": "high|medium|low",
                 "share_potential": "high|medium|low",
                 "trending_audio_alignment": true
-            }},
-            "explore_algorithm": {{
+            },
+            "explore_algorithm": {
                 "score": 0,
                 "content_quality_signals": "strong|medium|weak",
                 "account_authority_signals": "strong|medium|weak",
                 "explore_potential": "high|medium|low"
-            }},
-            "search_seo": {{
+            },
+            "search_seo": {
                 "score": 0,
                 "username_optimized": true,
                 "bio_optimized": true,
                 "captions_optimized": true,
                 "hashtags_optimized": true
-            }}
-        }}
-    }},
-    "benchmarks": {{
+            }
+        }
+    },
+    "benchmarks": {
         "niche_average_er": 0.0,
-        "account_er": {engagement_rate:.2f},
+        "account_er": %(engagement_rate)s,
         "percentile_rank": 0,
         "top_performer_gap": 0.0,
-        "tier_expected_er_min": {tier_info.get('expected_er_min', 0)},
-        "tier_expected_er_max": {tier_info.get('expected_er_max', 0)},
+        "tier_expected_er_min": %(expected_er_min)s,
+        "tier_expected_er_max": %(expected_er_max)s,
         "er_vs_tier_expectation": "above|within|below"
-    }},
-    "edge_cases": {{
-        "is_new_account": {str(account_age_days < 30).lower()},
+    },
+    "edge_cases": {
+        "is_new_account": %(is_new_account_json)s,
         "has_viral_spike": false,
         "niche_pivot_detected": false,
         "is_seasonal_account": false,
         "engagement_pod_suspected": false,
         "flags": []
-    }},
+    },
     "findings": [
-        {{
+        {
             "type": "strength|weakness|opportunity|threat",
             "category": "content|timing|hashtag|caption|format|algorithm|seo",
             "severity": "low|medium|high",
-            "finding": "TÜRKÇE - örn: Carousel içerik oranı düşük (%15), oysa carousel'ler Reels'den %30 daha fazla kaydetme alıyor ve algoritma tarafından 72 saat daha uzun süre gösteriliyor",
-            "evidence": "TÜRKÇE - örn: Son 30 postta sadece 4 carousel var. Bu carousel'lerin ortalama kaydetme oranı %8.5 iken Reels'lerin kaydetme oranı %3.2",
+            "finding": "TÜRKÇE - örn: Carousel içerik oranı düşük (%%15), oysa carousel'ler Reels'den %%30 daha fazla kaydetme alıyor ve algoritma tarafından 72 saat daha uzun süre gösteriliyor",
+            "evidence": "TÜRKÇE - örn: Son 30 postta sadece 4 carousel var. Bu carousel'lerin ortalama kaydetme oranı %%8.5 iken Reels'lerin kaydetme oranı %%3.2",
             "impact_score": 78
-        }},
-        {{
+        },
+        {
             "type": "opportunity",
             "category": "timing",
             "severity": "medium",
             "finding": "TÜRKÇE - örn: Paylaşım zamanlaması optimal değil, takipçilerin en aktif olduğu 19:00-21:00 aralığı kaçırılıyor",
-            "evidence": "TÜRKÇE - örn: Son 20 postun 15'i 14:00-16:00 arasında paylaşılmış, bu saatlerde takipçi aktivitesi %40 daha düşük",
+            "evidence": "TÜRKÇE - örn: Son 20 postun 15'i 14:00-16:00 arasında paylaşılmış, bu saatlerde takipçi aktivitesi %%40 daha düşük",
             "impact_score": 65
-        }}
+        }
     ],
     "recommendations": [
-        {{
+        {
             "priority": 1,
             "category": "TÜRKÇE - örn: İçerik Formatı Optimizasyonu",
             "action": "TÜRKÇE - örn: Haftalık içerik dağılımını 3 Reels + 2 Carousel + 2 Story serisi olarak yeniden planlayın",
-            "expected_impact": "TÜRKÇE - örn: Toplam kaydetme oranında %45 artış, ortalama erişimde %25 iyileşme, 1000 yeni organik takipçi/ay",
+            "expected_impact": "TÜRKÇE - örn: Toplam kaydetme oranında %%45 artış, ortalama erişimde %%25 iyileşme, 1000 yeni organik takipçi/ay",
             "implementation_difficulty": "easy|medium|hard",
             "timeframe": "immediate|short-term|long-term",
             "effort": "low|medium|high",
             "impact": "low|medium|high"
-        }},
-        {{
+        },
+        {
             "priority": 2,
             "category": "TÜRKÇE - örn: Paylaşım Zamanlaması",
             "action": "TÜRKÇE - örn: Tüm içerikleri 19:00-21:00 aralığında paylaşın, Salı ve Perşembe günleri öncelikli olsun",
-            "expected_impact": "TÜRKÇE - örn: İlk 1 saatte etkileşim oranında %60 artış, keşfet algoritmasına girme şansı 2 kat",
+            "expected_impact": "TÜRKÇE - örn: İlk 1 saatte etkileşim oranında %%60 artış, keşfet algoritmasına girme şansı 2 kat",
             "implementation_difficulty": "easy",
             "timeframe": "immediate",
             "effort": "low",
             "impact": "high"
-        }}
+        }
     ],
-    "priority_matrix": {{
+    "priority_matrix": {
         "p1_immediate": [],
         "p2_short_term": [],
         "p3_planned": [],
         "p4_low_priority": [],
         "p5_backlog": []
-    }},
-    "weekly_action_plan": {{
+    },
+    "weekly_action_plan": {
         "week_1": [],
         "week_2": [],
         "week_3": [],
         "week_4": []
-    }},
-    "hookAnalysis": {{
+    },
+    "hookAnalysis": {
         "description": "Per-post hook analysis for the latest 10-20 posts",
         "posts": [
-            {{
+            {
                 "postId": "string",
                 "postType": "reel|carousel|single",
                 "hookText": "First 125 characters or first 3 seconds transcript",
                 "hookType": "question|statistic|bold_claim|storytelling|pattern_interrupt|curiosity_gap|controversy|how_to|listicle|before_after",
                 "hookEffectivenessScore": 0,
                 "formula_used": "Hook_Effectiveness = (Attention_Grab × 0.30 + Curiosity_Gap × 0.25 + Relevance × 0.25 + CTA_Integration × 0.20)",
-                "breakdownScores": {{
+                "breakdownScores": {
                     "attentionGrab": 0,
                     "curiosityGap": 0,
                     "relevance": 0,
                     "ctaIntegration": 0
-                }},
-                "estimatedScrollStopRate": "0%",
+                },
+                "estimatedScrollStopRate": "0%%",
                 "improvements": ["string", "string"],
                 "alternativeHooks": ["Better hook option 1", "Better hook option 2"]
-            }}
+            }
         ],
-        "hookTypeDistribution": {{
+        "hookTypeDistribution": {
             "question": 0,
             "statistic": 0,
             "bold_claim": 0,
@@ -1054,22 +1313,24 @@ Aşağıdaki JSON yapısında yanıt ver:
             "how_to": 0,
             "listicle": 0,
             "before_after": 0
-        }},
+        },
         "bestPerformingHookType": "string",
         "worstPerformingHookType": "string",
         "hookRecommendations": [
-            "Based on {niche} niche, increase use of X hook type",
-            "Your audience responds best to Y - use more"
+            "Based on %(niche)s niche, increase use of X hook type",
+"""
+
+_ANALYSIS_PROMPT_TAIL = """            "Your audience responds best to Y - use more"
         ]
-    }},
-    "hashtagAnalysis": {{
+    },
+    "hashtagAnalysis": {
         "description": "Detailed hashtag strategy analysis",
         "formula_used": "Hashtag_Score = (Relevance × 0.30 + Size_Distribution × 0.25 + Diversity × 0.20 + Performance × 0.25)",
         "totalHashtagsAnalyzed": 0,
         "uniqueHashtagsUsed": 0,
         "avgHashtagsPerPost": 0,
         "topPerforming": [
-            {{
+            {
                 "hashtag": "#example",
                 "timesUsed": 0,
                 "avgEngagementWhenUsed": 0.0,
@@ -1077,10 +1338,10 @@ Aşağıdaki JSON yapısında yanıt ver:
                 "hashtagSize": "large|medium|small|micro",
                 "nicheRelevance": "high|medium|low",
                 "recommendedAction": "keep_using|increase_usage|maintain"
-            }}
+            }
         ],
         "underperforming": [
-            {{
+            {
                 "hashtag": "#example",
                 "timesUsed": 0,
                 "avgEngagementWhenUsed": 0.0,
@@ -1089,10 +1350,10 @@ Aşağıdaki JSON yapısında yanıt ver:
                 "nicheRelevance": "high|medium|low",
                 "issue": "too_competitive|not_relevant|oversaturated|shadowban_risk",
                 "recommendedAction": "remove|replace|reduce_usage"
-            }}
+            }
         ],
         "recommended": [
-            {{
+            {
                 "hashtag": "#recommendedTag",
                 "hashtagSize": "large|medium|small|micro",
                 "estimatedReach": 0,
@@ -1100,47 +1361,47 @@ Aşağıdaki JSON yapısında yanıt ver:
                 "competitionLevel": "high|medium|low",
                 "reason": "string",
                 "bestUsedWith": ["#relatedTag1", "#relatedTag2"]
-            }}
+            }
         ],
-        "hashtagSets": {{
+        "hashtagSets": {
             "description": "Recommended hashtag set rotation strategy",
             "set1_high_reach": ["#tag1", "#tag2"],
             "set2_medium_niche": ["#tag3", "#tag4"],
             "set3_micro_engagement": ["#tag5", "#tag6"]
-        }},
-        "sizeDistributionAnalysis": {{
-            "current": {{
+        },
+        "sizeDistributionAnalysis": {
+            "current": {
                 "large_1m_plus": 0,
                 "medium_100k_1m": 0,
                 "small_10k_100k": 0,
                 "micro_under_10k": 0
-            }},
-            "ideal": {{
+            },
+            "ideal": {
                 "large_1m_plus": "10-15%",
                 "medium_100k_1m": "40-50%",
                 "small_10k_100k": "35-45%",
                 "micro_under_10k": "5-10%"
-            }},
+            },
             "deviation": 0,
             "recommendation": "string"
-        }},
+        },
         "bannedOrShadowbanRisk": ["#riskyTag1", "#riskyTag2"]
-    }},
-    "abTestRecommendations": {{
+    },
+    "abTestRecommendations": {
         "description": "A/B test recommendations based on content analysis",
         "tests": [
-            {{
+            {
                 "testId": 1,
                 "testName": "string",
                 "hypothesis": "string",
-                "variantA": {{
+                "variantA": {
                     "description": "Control (current approach)",
                     "example": "string"
-                }},
-                "variantB": {{
+                },
+                "variantB": {
                     "description": "Test variant",
                     "example": "string"
-                }},
+                },
                 "category": "hook|format|posting_time|hashtag|caption|cta|visual",
                 "expectedImpactMetric": "engagement_rate|reach|saves|shares|comments|follower_growth",
                 "expectedImpact": "+X% to Y%",
@@ -1148,59 +1409,370 @@ Aşağıdaki JSON yapısında yanıt ver:
                 "duration": "X weeks",
                 "priority": "high|medium|low",
                 "implementationSteps": ["Step 1", "Step 2", "Step 3"]
-            }}
+            }
         ],
         "prioritizedTestOrder": [1, 2, 3],
         "currentTestingOpportunities": ["string"],
-        "testingCalendar": {{
+        "testingCalendar": {
             "week_1_2": "Test 1: Hook types",
             "week_3_4": "Test 2: Posting times",
             "week_5_6": "Test 3: Caption length"
-        }}
-    }},
-    "contentCalendarSuggestion": {{
+        }
+    },
+    "contentCalendarSuggestion": {
         "description": "Suggested content calendar based on analysis",
-        "optimalPostingSchedule": {{
-            "monday": {{"time": "HH:MM", "contentType": "reel|carousel|single"}},
-            "tuesday": {{"time": "HH:MM", "contentType": "reel|carousel|single"}},
-            "wednesday": {{"time": "HH:MM", "contentType": "reel|carousel|single"}},
-            "thursday": {{"time": "HH:MM", "contentType": "reel|carousel|single"}},
-            "friday": {{"time": "HH:MM", "contentType": "reel|carousel|single"}},
-            "saturday": {{"time": "HH:MM", "contentType": "reel|carousel|single"}},
-            "sunday": {{"time": "HH:MM", "contentType": "reel|carousel|single"}}
-        }},
+        "optimalPostingSchedule": {
+            "monday": {"time": "HH:MM", "contentType": "reel|carousel|single"},
+            "tuesday": {"time": "HH:MM", "contentType": "reel|carousel|single"},
+            "wednesday": {"time": "HH:MM", "contentType": "reel|carousel|single"},
+            "thursday": {"time": "HH:MM", "contentType": "reel|carousel|single"},
+            "friday": {"time": "HH:MM", "contentType": "reel|carousel|single"},
+            "saturday": {"time": "HH:MM", "contentType": "reel|carousel|single"},
+            "sunday": {"time": "HH:MM", "contentType": "reel|carousel|single"}
+        },
         "contentPillarRotation": ["Pillar 1", "Pillar 2", "Pillar 3"],
         "trendingOpportunities": ["Trend 1 to leverage", "Trend 2 to leverage"]
-    }},
-    "score_breakdown": {{
+    },
+    "score_breakdown": {
         "overall_content_strategy_score": 0,
         "formula_used": "Overall = (Content_Effectiveness × 0.30 + Hashtag_Effectiveness × 0.20 + Caption_Quality × 0.20 + Content_Diversity × 0.15 + Algorithm_Alignment × 0.15)",
-        "components": {{
-            "content_effectiveness": {{"score": 0, "weight": 0.30, "weighted": 0}},
-            "hashtag_effectiveness": {{"score": 0, "weight": 0.20, "weighted": 0}},
-            "caption_quality": {{"score": 0, "weight": 0.20, "weighted": 0}},
-            "content_diversity": {{"score": 0, "weight": 0.15, "weighted": 0}},
-            "algorithm_alignment": {{"score": 0, "weight": 0.15, "weighted": 0}}
-        }},
+        "components": {
+            "content_effectiveness": {"score": 0, "weight": 0.30, "weighted": 0},
+            "hashtag_effectiveness": {"score": 0, "weight": 0.20, "weighted": 0},
+            "caption_quality": {"score": 0, "weight": 0.20, "weighted": 0},
+            "content_diversity": {"score": 0, "weight": 0.15, "weighted": 0},
+            "algorithm_alignment": {"score": 0, "weight": 0.15, "weighted": 0}
+        },
         "tier_adjustment_applied": true,
         "niche_adjustment_applied": true
-    }}
-}}"""
-
-    def _calculate_tier(self, followers: int) -> str:
-        """Calculate account tier based on follower count"""
-        if followers < 1000:
-            return "nano"  # Pre-nano accounts treated as nano
-        elif followers < 10000:
-            return "nano"
-        elif followers < 50000:
-            return "micro"
-        elif followers < 100000:
-            return "mid"
-        elif followers < 500000:
-            return "macro"
+    }
+}"""
+
+
+_PROMPT_SLOT_RE = re.compile(r"%\((\w+)\)s")
+
+
+def _split_prompt_template(head: str, tail: str) -> Tuple[Tuple[Optional[str], ...], Tuple[Tuple[int, str], ...]]:
+    """
+    Pre-split a %(name)s template into literal segments and slot positions.
+    
+    Returns (parts, slots): parts holds the literal text (%% unescaped) with
+    None at each slot, slots maps part index -> context key. Filling the slots
+    and "".join-ing the parts copies each literal once instead of re-scanning
+    the whole template for % on every prompt.
+    """
+    parts: List[Optional[str]] = []
+    slots: List[Tuple[int, str]] = []
+    for i, piece in enumerate(_PROMPT_SLOT_RE.split(head)):
+        if i % 2:
+            slots.append((len(parts), piece))
+            parts.append(None)
         else:
-            return "mega"
+            parts.append(piece.replace('%%', '%'))
+    parts.append(tail)
+    return tuple(parts), tuple(slots)
+
+
+def _specialize_prompt(
+    parts: Tuple[Optional[str], ...],
+    slots: Tuple[Tuple[int, str], ...],
+    fixed: Mapping[str, Any],
+) -> Tuple[Tuple[Optional[str], ...], Tuple[Tuple[int, str], ...]]:
+    """Pre-fill the slots named in fixed and merge adjacent literal segments"""
+    slot_at = dict(slots)
+    merged: List[Optional[str]] = []
+    remaining: List[Tuple[int, str]] = []
+    for index, part in enumerate(parts):
+        key = slot_at.get(index)
+        if key is not None and key not in fixed:
+            remaining.append((len(merged), key))
+            merged.append(None)
+            continue
+        text = str(fixed[key]) if key is not None else part
+        if merged and merged[-1] is not None:
+            merged[-1] += text
+        else:
+            merged.append(text)
+    return tuple(merged), tuple(remaining)
+
+
+_ANALYSIS_PROMPT_PARTS, _ANALYSIS_PROMPT_SLOTS = _split_prompt_template(
+    _ANALYSIS_PROMPT_HEAD, _ANALYSIS_PROMPT_TAIL
+)
+
+# One prompt skeleton per tier with the tier-determined slots already filled
+_ANALYSIS_PROMPTS_BY_TIER: Mapping[str, Tuple[Tuple[Optional[str], ...], Tuple[Tuple[int, str], ...]]] = MappingProxyType({
+    tier: _specialize_prompt(_ANALYSIS_PROMPT_PARTS, _ANALYSIS_PROMPT_SLOTS, {
+        "tier": tier,
+        "tier_upper": tier.upper(),
+        "expected_er_min": info.get('expected_er_min', 0),
+        "expected_er_max": info.get('expected_er_max', 0),
+        "growth_potential": info.get('growth_potential', 'unknown'),
+        "tier_priority": info.get('priority', 'unknown'),
+    })
+    for tier, info in _TIER_DEFINITIONS.items()
+})
+
+
+
+class ContentStrategistAgent(BaseAgent):
+    """
+    Content Strategist Agent v2.0
+    Role: Instagram algorithm optimization, content strategy, SEO, and comprehensive scoring
+    
+    Kapsamlı Uzmanlık Alanları:
+    - Instagram 6 farklı algoritma sistemi (Feed, Stories, Reels, Explore, Search, Hashtag)
+    - Content effectiveness scoring (0-100)
+    - Hashtag effectiveness analysis
+    - Caption quality optimization
+    - Posting consistency analysis
+    - Content diversity scoring
+    - Google SEO & Instagram Search optimization
+    - Target account profiling & tier classification
+    - Niche detection & market saturation analysis
+    """
+    
+    __slots__ = (
+        "algorithm_weights", "scoring_benchmarks",
+        "tier_definitions", "niche_adjustments",
+    )
+    
+    def __init__(self, gemini_client, generation_config=None, model_name: str = "gemini-2.5-flash"):
+        super().__init__(gemini_client, generation_config, model_name)
+        self.name = "Content Strategist"
+        self.role = "Instagram Algorithm & Content Strategy Expert"
+        self.specialty = "Algorithm optimization, SEO, content scoring, strategic planning"
+        
+        self._bind_config_tables()
+    
+    def _bind_config_tables(self) -> None:
+        """Algorithm weight configurations (module-level, shared by all instances)"""
+        self.algorithm_weights = _ALGORITHM_WEIGHTS
+        self.scoring_benchmarks = _SCORING_BENCHMARKS
+        self.tier_definitions = _TIER_DEFINITIONS
+        self.niche_adjustments = _NICHE_ADJUSTMENTS
+    
+    # mappingproxy tables cannot be pickled or deep-copied: copies and pickles
+    # leave the shared config tables out and rebind the module ones on load
+    def __getstate__(self):
+        state, slots = super().__getstate__()
+        slots = {k: v for k, v in slots.items() if k not in ContentStrategistAgent.__slots__}
+        return state, slots
+    
+    def __setstate__(self, state):
+        state, slots = state
+        if state:
+            self.__dict__.update(state)
+        for name, value in slots.items():
+            setattr(self, name, value)
+        self._bind_config_tables()
+    
+    @classmethod
+    def _init_algorithm_weights(cls) -> Mapping[str, Any]:
+        """Instagram algorithm weight configurations (shared module constant)"""
+        return _ALGORITHM_WEIGHTS
+    
+    @classmethod
+    def _init_scoring_benchmarks(cls) -> Mapping[str, Any]:
+        """Scoring benchmarks for different metrics (shared module constant)"""
+        return _SCORING_BENCHMARKS
+    
+    @classmethod
+    def _init_tier_definitions(cls) -> Mapping[str, Any]:
+        """Account tier definitions (shared module constant)"""
+        return _TIER_DEFINITIONS
+    
+    @classmethod
+    def _init_niche_adjustments(cls) -> Mapping[str, Any]:
+        """Niche-specific adjustments (shared module constant)"""
+        return _NICHE_ADJUSTMENTS
+    
+    @property
+    def technical_optimization_2026(self) -> Mapping[str, Any]:
+        """2026 Technical Optimization Strategies (shared, resolved on access)"""
+        return self._init_2026_technical_optimization()
+    
+    @classmethod
+    def _init_2026_technical_optimization(cls) -> Mapping[str, Any]:
+        """2026 Instagram technical setup and account health (shared module constant)"""
+        return _TECH_OPT_2026
+    
+    def get_system_prompt(self) -> str:
+        return _SYSTEM_PROMPT
+
+    def get_analysis_prompt(self, account_data: Dict[str, Any]) -> str:
+        return "".join(self._analysis_prompt_parts(account_data))
+    
+    def _analysis_prompt_parts(self, account_data: Dict[str, Any]) -> List[str]:
+        """Per-tier prompt skeleton with the per-account slots filled in"""
+        (
+            username, followers, following, posts, engagement_rate,
+            avg_likes, avg_comments, avg_saves, avg_shares, niche, bio,
+            is_business, verified, recent_posts, account_age_days,
+            posting_frequency, hashtag_data, story_data, reels_data,
+        ) = [
+            account_data.get(key, default) or default for key, default in _ACCOUNT_FIELDS
+        ] + [
+            account_data.get(key, default) for key, default in _ACCOUNT_RAW_FIELDS
+        ]
+        
+        # Calculate tier (tier fields are pre-filled in the per-tier skeleton)
+        tier = self._calculate_tier(followers)
+        
+        context = {
+            "username": username,
+            # Numbers are pre-formatted here; the template carries no format specs
+            "followers": f"{followers:,}",
+            "following": f"{following:,}",
+            "posts": posts,
+            "posts_fmt": f"{posts:,}",
+            "engagement_rate": f"{engagement_rate:.2f}",
+            "avg_likes": f"{avg_likes:,.0f}",
+            "avg_comments": f"{avg_comments:,.0f}",
+            "avg_saves": f"{avg_saves:,.0f}",
+            "avg_shares": f"{avg_shares:,.0f}",
+            "niche": niche,
+            "bio": bio,
+            "is_business": is_business,
+            "verified": verified,
+            "account_age_days": account_age_days,
+            "post_count": len(recent_posts),
+            "posting_frequency_json": json.dumps(posting_frequency, indent=2) if posting_frequency else 'Veri yok',
+            "story_data_json": json.dumps(story_data, indent=2) if story_data else 'Veri yok',
+            "reels_data_json": json.dumps(reels_data, indent=2) if reels_data else 'Veri yok',
+            "hashtag_data_json": json.dumps(hashtag_data, indent=2) if hashtag_data else 'Veri yok',
+            "analysis_timestamp": datetime.now().isoformat(),
+            "follower_following_ratio": f"{followers / max(following, 1):.2f}",
+            "is_business_json": str(is_business).lower(),
+            "verified_json": str(verified).lower(),
+            "is_new_account_json": str(account_age_days < 30).lower(),
+        }
+        
+        skeleton, slots = _ANALYSIS_PROMPTS_BY_TIER[tier]
+        parts = list(skeleton)
+        for index, key in slots:
+            parts[index] = str(context[key])
+        return parts
+
+    def summarize_recent_posts(self, recent_posts: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Compute numeric statistics over an account's recentPosts.
+        
+        The posts are converted once with _posts_to_sarr; reductions run on
+        whole columns via NumPy and the scoring_numeric kernels
+        (numba-compiled when available).
+        """
+        posts, formats = _posts_to_sarr(recent_posts)
+        n = posts.shape[0]
+        if n == 0:
+            return {}
+        
+        format_counts = np.bincount(posts['format'], minlength=len(formats))
+        format_ratios = {
+            label: count / n for label, count in zip(formats, format_counts.tolist())
+        }
+        
+        weighted = engagement_quality(posts['likes'], posts['comments'], posts['saves'], posts['shares'])
+        stats: Dict[str, Any] = {
+            "post_count": n,
+            "format_distribution": {k: round(v, 2) for k, v in format_ratios.items()},
+            "format_diversity_score": self._calculate_format_diversity(format_ratios),
+            "avg_weighted_engagement": round(float(weighted.mean()), 1),
+        }
+        
+        timestamps = posts['ts'][posts['ts'] > 0]
+        if timestamps.shape[0] >= 2:
+            mean_gap, max_gap, std_gap = posting_gaps(timestamps)
+            stats["avg_gap_days"] = round(mean_gap, 2)
+            stats["max_gap_days"] = round(max_gap, 2)
+            stats["std_gap_days"] = round(std_gap, 2)
+        
+        return stats
+    
+    def classify_benchmark(
+        self,
+        metric: str,
+        values: Union[float, Sequence[float], np.ndarray]
+    ) -> Dict[str, Any]:
+        """
+        Classify one or many metric values against the range benchmarks.
+        
+        Supported metrics: engagement_rate, follower_growth, save_rate,
+        share_rate, comment_rate. Returns bucket labels and, where the
+        benchmark defines them, bucket scores.
+        """
+        lut = _BENCHMARK_LUTS.get(metric)
+        if lut is None:
+            raise ValueError(f"No range benchmark for metric: {metric}")
+        bounds, labels, scores = lut
+        
+        arr = np.atleast_1d(np.asarray(values, dtype=np.float64))
+        idx = np.searchsorted(bounds, arr, side="right")
+        
+        return {
+            "levels": [labels[i] for i in idx],
+            "scores": scores[idx].tolist() if scores is not None else None
+        }
+    
+    def score_accounts(self, accounts: Sequence[Dict[str, Any]]) -> np.ndarray:
+        """
+        Score a batch of accounts (account_data dicts) in one vectorized pass.
+        
+        Columns are pulled out once with np.fromiter; tiers, benchmark buckets
+        and weighted engagement are then computed over whole arrays (searchsorted
+        LUTs + the scoring_numeric kernel) instead of per account. Rates are the
+        per-post averages as a percentage of followers.
+        
+        Returns a structured array with one row per account:
+        tier, engagement_level, er_vs_expected (ER / tier midpoint × niche
+        modifier), engagement_quality (0-100), save/share/comment_score.
+        """
+        n = len(accounts)
+        scores = np.zeros(n, dtype=_ACCOUNT_SCORE_DTYPE)
+        if n == 0:
+            return scores
+        
+        followers = _account_column(accounts, "followers")
+        engagement_rate = _account_column(accounts, "engagementRate")
+        er_modifier = np.fromiter(
+            (
+                _niche_profile(str(_field_or_default(a.get("niche"), "General"))).er_modifier
+                for a in accounts
+            ),
+            dtype=np.float64,
+            count=n,
+        )
+        
+        # Tier and engagement rate bucket
+        tier_idx = _tier_index_batch(followers)
+        scores["tier"] = _TIER_NAMES_ARR[tier_idx]
+        er_bounds, er_labels, _ = _BENCHMARK_LUTS["engagement_rate"]
+        scores["engagement_level"] = np.asarray(er_labels)[np.searchsorted(er_bounds, engagement_rate, side="right")]
+        scores["er_vs_expected"] = np.round(engagement_rate / (_TIER_EXPECTED_ER[tier_idx] * er_modifier), 2)
+        
+        # Per-post interaction rates (% of followers)
+        pct = np.divide(100.0, followers, out=np.zeros(n), where=followers > 0)
+        like_rate = _account_column(accounts, "avgLikes") * pct
+        comment_rate = _account_column(accounts, "avgComments") * pct
+        save_rate = _account_column(accounts, "avgSaves") * pct
+        share_rate = _account_column(accounts, "avgShares") * pct
+        
+        scores["engagement_quality"] = np.round(
+            self.calculate_engagement_quality_batch(save_rate, share_rate, comment_rate, like_rate), 1
+        )
+        
+        for field, metric, rate in (
+            ("save_score", "save_rate", save_rate),
+            ("share_score", "share_rate", share_rate),
+            ("comment_score", "comment_rate", comment_rate),
+        ):
+            bounds, _, bucket_scores = _BENCHMARK_LUTS[metric]
+            scores[field] = bucket_scores[np.searchsorted(bounds, rate, side="right")]
+        
+        return scores
+    
+    # Calculate account tier based on follower count (cached bisect, no wrapper frame)
+    _calculate_tier = staticmethod(_tier_for)
     
     def calculate_content_effectiveness_score(
         self,
@@ -1266,7 +1838,8 @@ Aşağıdaki JSON yapısında yanıt ver:
         if not ratios or len(ratios) == 1:
             return 20.0  # Single format = 20 points
         
-        # Shannon Entropy calculation
+        # Shannon Entropy calculation (a handful of formats: a plain loop beats
+        # the array round trip; calculate_format_diversity_batch vectorizes)
         entropy = -sum(p * math.log2(p) for p in ratios if p > 0)
         max_entropy = math.log2(len(ratios))
         
@@ -1286,6 +1859,8 @@ Aşağıdaki JSON yapısında yanıt ver:
         comment_rate = engagement_data.get('comment_rate', 0)
         like_rate = engagement_data.get('like_rate', 0)
         
+        # Scalar arithmetic for one account; calculate_engagement_quality_batch
+        # runs the same formula through the kernel for many accounts
         weighted_score = (
             save_rate * 3.5 +
             share_rate * 3.0 +
@@ -1294,10 +1869,33 @@ Aşağıdaki JSON yapısında yanıt ver:
         )
         
         # Benchmark: Average weighted score is around 10-15
-        benchmark = 12.0
-        score = min(100, (weighted_score / benchmark) * 100)
+        return round(min(100, (weighted_score / _ENGAGEMENT_QUALITY_BENCHMARK) * 100), 1)
+    
+    def calculate_engagement_quality_batch(self, save_rate, share_rate, comment_rate, like_rate) -> np.ndarray:
+        """
+        Engagement quality (0-100, unrounded) for many accounts at once.
+        
+        Takes parallel 1-D rate arrays (one entry per account) and scores them
+        in a single pass of the scoring_numeric kernel:
+        min(100, (save×3.5 + share×3 + comment×2.5 + like×1) / benchmark × 100)
+        """
+        weighted = engagement_quality(like_rate, comment_rate, save_rate, share_rate)
+        # Benchmark: Average weighted score is around 10-15
+        return np.minimum(100.0, weighted / _ENGAGEMENT_QUALITY_BENCHMARK * 100)
+    
+    def calculate_format_diversity_batch(self, ratios) -> np.ndarray:
+        """
+        Format diversity (0-100, unrounded) for an (accounts × formats) ratio matrix.
         
-        return round(score, 1)
+        Row-wise Shannon entropy over the positive ratios, normalized by
+        log2 of the number of formats used; rows with 0-1 formats score 20,
+        as in _calculate_format_diversity.
+        """
+        p = np.atleast_2d(np.asarray(ratios, dtype=np.float64))
+        used = p > 0
+        entropy = -(p * np.log2(p, out=np.zeros_like(p), where=used)).sum(axis=1)
+        formats = used.sum(axis=1)
+        return np.where(formats > 1, entropy / np.log2(np.maximum(formats, 2)) * 100, 20.0)
     
     def _calculate_posting_consistency(self, posting_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -1364,20 +1962,15 @@ Aşağıdaki JSON yapısında yanıt ver:
         - Hashtag strategy: 15 points
         - Alt text usage: 10 points
         """
-        score = 0
-        
-        if algorithm_data.get('reels_usage_adequate', False):
-            score += 30
-        if algorithm_data.get('optimal_posting_time', False):
-            score += 25
-        if algorithm_data.get('caption_seo', False):
-            score += 20
-        if algorithm_data.get('hashtag_strategy', False):
-            score += 15
-        if algorithm_data.get('alt_text_usage', False):
-            score += 10
-        
-        return float(score)
+        get = algorithm_data.get
+        mask = (
+            (1 if get('reels_usage_adequate', False) else 0)
+            | (2 if get('optimal_posting_time', False) else 0)
+            | (4 if get('caption_seo', False) else 0)
+            | (8 if get('hashtag_strategy', False) else 0)
+            | (16 if get('alt_text_usage', False) else 0)
+        )
+        return _ALIGNMENT_SCORES[mask]
     
     def _calculate_trend_utilization(self, trend_data: Dict[str, bool]) -> float:
         """
@@ -1389,18 +1982,14 @@ Aşağıdaki JSON yapısında yanıt ver:
         - Seasonal content: 20 points
         - Viral template usage: 10 points
         """
-        score = 0
-        
-        if trend_data.get('trending_audio', False):
-            score += 40
-        if trend_data.get('trending_format', False):
-            score += 30
-        if trend_data.get('seasonal_content', False):
-            score += 20
-        if trend_data.get('viral_template', False):
-            score += 10
-        
-        return float(score)
+        get = trend_data.get
+        mask = (
+            (1 if get('trending_audio', False) else 0)
+            | (2 if get('trending_format', False) else 0)
+            | (4 if get('seasonal_content', False) else 0)
+            | (8 if get('viral_template', False) else 0)
+        )
+        return _TREND_SCORES[mask]
     
     def calculate_hashtag_effectiveness(
         self,
@@ -1421,39 +2010,21 @@ Aşağıdaki JSON yapısında yanıt ver:
         )
         """
         # Relevance score
-        if relevance_percent >= 80:
-            relevance_score = 100
-        elif relevance_percent >= 60:
-            relevance_score = 80
-        else:
-            relevance_score = relevance_percent
+        step = bisect_right(_HASHTAG_RELEVANCE_THRESHOLDS, relevance_percent)
+        relevance_score = _HASHTAG_RELEVANCE_SCORES[step] if step else relevance_percent
         
         # Size distribution score (ideal: Large 10-15%, Medium 40-50%, Small 35-45%, Micro 5-10%)
-        ideal = {'large': 0.125, 'medium': 0.45, 'small': 0.40, 'micro': 0.075}
-        deviation = sum(abs(size_distribution.get(k, 0) - v) for k, v in ideal.items())
+        deviation = sum(abs(size_distribution.get(k, 0) - v) for k, v in _IDEAL_HASHTAG_SIZES.items())
         size_score = max(0, 100 - (deviation * 100))
         
         # Diversity score based on rotation rate
-        if rotation_rate >= 100:
-            diversity_score = 100
-        elif rotation_rate >= 70:
-            diversity_score = 80
-        elif rotation_rate >= 50:
-            diversity_score = 60
-        else:
-            diversity_score = rotation_rate * 0.8
+        step = bisect_right(_HASHTAG_DIVERSITY_THRESHOLDS, rotation_rate)
+        diversity_score = _HASHTAG_DIVERSITY_SCORES[step] if step else rotation_rate * 0.8
         
         # Performance score based on reach from hashtags
-        if reach_from_hashtags >= 30:
-            performance_score = 100
-        elif reach_from_hashtags >= 20:
-            performance_score = 80
-        elif reach_from_hashtags >= 10:
-            performance_score = 60
-        elif reach_from_hashtags >= 5:
-            performance_score = 40
-        else:
-            performance_score = 20
+        performance_score = _HASHTAG_PERFORMANCE_SCORES[
+            bisect_right(_HASHTAG_PERFORMANCE_THRESHOLDS, reach_from_hashtags)
+        ]
         
         final_score = (
             relevance_score * 0.30 +
@@ -1491,61 +2062,50 @@ Aşağıdaki JSON yapısında yanıt ver:
         )
         """
         # Hook Strength (max 100)
-        hook_score = 0
-        if hook_data.get('has_question'):
-            hook_score += 25
-        if hook_data.get('has_number_list'):
-            hook_score += 25
-        if hook_data.get('starts_with_emoji'):
-            hook_score += 15
-        if hook_data.get('under_10_words'):
-            hook_score += 20
-        if hook_data.get('has_pattern_interrupt'):
-            hook_score += 15
+        hook_get = hook_data.get
+        hook_score = _HOOK_SCORES[
+            (1 if hook_get('has_question') else 0)
+            | (2 if hook_get('has_number_list') else 0)
+            | (4 if hook_get('starts_with_emoji') else 0)
+            | (8 if hook_get('under_10_words') else 0)
+            | (16 if hook_get('has_pattern_interrupt') else 0)
+        ]
         
         # Value Delivery (max 100)
-        value_score = 0
-        if value_data.get('has_actionable_info'):
-            value_score += 35
-        if value_data.get('has_specific_example'):
-            value_score += 25
-        if value_data.get('has_problem_solution'):
-            value_score += 25
-        if value_data.get('has_unique_insight'):
-            value_score += 15
+        value_get = value_data.get
+        value_score = _VALUE_SCORES[
+            (1 if value_get('has_actionable_info') else 0)
+            | (2 if value_get('has_specific_example') else 0)
+            | (4 if value_get('has_problem_solution') else 0)
+            | (8 if value_get('has_unique_insight') else 0)
+        ]
         
         # CTA Effectiveness (max 100)
-        cta_score = 0
-        if cta_data.get('has_clear_cta'):
-            cta_score += 40
-        if cta_data.get('cta_matches_engagement'):
-            cta_score += 30
-        if cta_data.get('cta_in_last_line'):
-            cta_score += 20
-        if cta_data.get('cta_has_emoji'):
-            cta_score += 10
+        cta_get = cta_data.get
+        cta_score = _CTA_SCORES[
+            (1 if cta_get('has_clear_cta') else 0)
+            | (2 if cta_get('cta_matches_engagement') else 0)
+            | (4 if cta_get('cta_in_last_line') else 0)
+            | (8 if cta_get('cta_has_emoji') else 0)
+        ]
         
         # SEO Optimization (max 100)
-        seo_score = 0
-        if seo_data.get('primary_keyword_first_125'):
-            seo_score += 40
-        if seo_data.get('has_secondary_keywords'):
-            seo_score += 25
-        if seo_data.get('natural_keyword_density'):
-            seo_score += 20
-        if seo_data.get('has_location_mention'):
-            seo_score += 15
+        seo_get = seo_data.get
+        seo_score = _SEO_SCORES[
+            (1 if seo_get('primary_keyword_first_125') else 0)
+            | (2 if seo_get('has_secondary_keywords') else 0)
+            | (4 if seo_get('natural_keyword_density') else 0)
+            | (8 if seo_get('has_location_mention') else 0)
+        ]
         
         # Readability (max 100)
-        readability_score = 0
-        if readability_data.get('has_paragraph_breaks'):
-            readability_score += 30
-        if readability_data.get('emoji_count_3_to_7'):
-            readability_score += 25
-        if readability_data.get('has_line_breaks'):
-            readability_score += 25
-        if readability_data.get('avg_sentence_under_15_words'):
-            readability_score += 20
+        readability_get = readability_data.get
+        readability_score = _READABILITY_SCORES[
+            (1 if readability_get('has_paragraph_breaks') else 0)
+            | (2 if readability_get('emoji_count_3_to_7') else 0)
+            | (4 if readability_get('has_line_breaks') else 0)
+            | (8 if readability_get('avg_sentence_under_15_words') else 0)
+        ]
         
         final_score = (
             hook_score * 0.30 +
@@ -1586,17 +2146,7 @@ Aşağıdaki JSON yapısında yanıt ver:
         format_mix_score = self._calculate_format_diversity(format_ratios)
         
         # Topic Variety
-        pillar_count = len(content_pillars)
-        if pillar_count >= 5:
-            topic_score = 100
-        elif pillar_count == 4:
-            topic_score = 80
-        elif pillar_count == 3:
-            topic_score = 60
-        elif pillar_count == 2:
-            topic_score = 40
-        else:
-            topic_score = 20
+        topic_score = _TOPIC_VARIETY_SCORES[min(len(content_pillars), 5)]
         
         # Visual Diversity
         visual_scores = {'high': 100, 'medium': 60, 'low': 30}
@@ -1714,21 +2264,10 @@ Aşağıdaki JSON yapısında yanıt ver:
             "p5_backlog": []
         }
         
+        bucket_for = _PRIORITY_BUCKETS.get
         for rec in recommendations:
-            impact = rec.get('impact', 'medium')
-            effort = rec.get('effort', 'medium')
-            action = rec.get('action', '')
-            
-            if impact == 'high' and effort == 'low':
-                matrix["p1_immediate"].append(action)
-            elif (impact == 'high' and effort == 'medium') or (impact == 'medium' and effort == 'low'):
-                matrix["p2_short_term"].append(action)
-            elif (impact == 'high' and effort == 'high') or (impact == 'medium' and effort == 'medium'):
-                matrix["p3_planned"].append(action)
-            elif (impact == 'medium' and effort == 'high') or (impact == 'low' and effort in ['low', 'medium']):
-                matrix["p4_low_priority"].append(action)
-            else:
-                matrix["p5_backlog"].append(action)
+            bucket = bucket_for((rec.get('impact', 'medium'), rec.get('effort', 'medium')), "p5_backlog")
+            matrix[bucket].append(rec.get('action', ''))
         
         return matrix
     
@@ -1736,27 +2275,4 @@ Aşağıdaki JSON yapısında yanıt ver:
         """
         Get niche-specific benchmarks for comparison
         """
-        # Base benchmarks by tier
-        tier_benchmarks = {
-            "nano": {"avg_er": 7.0, "growth_rate": 8.0, "save_rate": 2.0, "share_rate": 0.8},
-            "micro": {"avg_er": 4.5, "growth_rate": 5.0, "save_rate": 1.5, "share_rate": 0.5},
-            "mid": {"avg_er": 3.0, "growth_rate": 3.0, "save_rate": 1.2, "share_rate": 0.4},
-            "macro": {"avg_er": 1.8, "growth_rate": 2.0, "save_rate": 0.8, "share_rate": 0.3},
-            "mega": {"avg_er": 1.0, "growth_rate": 1.0, "save_rate": 0.5, "share_rate": 0.2}
-        }
-        
-        base = tier_benchmarks.get(tier, tier_benchmarks["micro"])
-        
-        # Apply niche modifier
-        niche_key = niche.lower().replace(' ', '_')
-        niche_mod = self.niche_adjustments.get(niche_key, {})
-        modifier = niche_mod.get('expected_er_modifier', 1.0)
-        
-        return {
-            "niche_average_er": round(base["avg_er"] * modifier, 2),
-            "niche_growth_rate": base["growth_rate"],
-            "niche_save_rate": round(base["save_rate"] * modifier, 2),
-            "niche_share_rate": round(base["share_rate"] * modifier, 2),
-            "adjustment_applied": modifier != 1.0,
-            "niche_notes": niche_mod.get('notes', '')
-        }
+        return dict(_niche_benchmarks(niche, tier))
@@ -21,9 +21,14 @@ Kullanım:
 import json
 import logging
 import asyncio
+import re
+import numpy as np
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
+from .fast_json import JSONDecodeError, dumps as _dumps, loads as _json_loads
+from .scoring_numeric import growth_projections
+
 logger = logging.getLogger(__name__)
 
 
@@ -190,7 +195,7 @@ OUTPUT_SCHEMA = {
 }
 
 # Schema'yı string olarak da tut (prompt'a eklemek için)
-OUTPUT_SCHEMA_STRING = json.dumps(OUTPUT_SCHEMA, indent=2, ensure_ascii=False)
+OUTPUT_SCHEMA_STRING = _dumps(OUTPUT_SCHEMA, indent=True)
 
 
 # =============================================================================
@@ -225,6 +230,12 @@ GENERIC_PHRASES = [
 # VALIDATION FUNCTIONS
 # =============================================================================
 
+def _short_entries(items: List[Any], key: str, min_length: int) -> List[Tuple[int, int]]:
+    """(1-based position, text length) of the items shorter than min_length"""
+    lengths = [len(item.get(key, "")) if isinstance(item, dict) else len(str(item)) for item in items]
+    return [(position, length) for position, length in enumerate(lengths, 1) if length < min_length]
+
+
 def validate_output_quality(output: Dict[str, Any]) -> Tuple[bool, List[str], int]:
     """
     LLM çıktısının kalitesini değerlendir
@@ -244,11 +255,9 @@ def validate_output_quality(output: Dict[str, Any]) -> Tuple[bool, List[str], in
         issues.append(f"Yetersiz bulgu sayısı: {len(findings)}/{QUALITY_THRESHOLDS['min_findings_count']}")
         quality_score -= 20
     
-    for i, finding in enumerate(findings):
-        finding_text = finding.get("finding", "") if isinstance(finding, dict) else str(finding)
-        if len(finding_text) < QUALITY_THRESHOLDS["min_finding_length"]:
-            issues.append(f"Bulgu {i+1} çok kısa: {len(finding_text)} karakter")
-            quality_score -= 10
+    short_findings = _short_entries(findings, "finding", QUALITY_THRESHOLDS["min_finding_length"])
+    issues.extend(f"Bulgu {i} çok kısa: {length} karakter" for i, length in short_findings)
+    quality_score -= 10 * len(short_findings)
     
     # 2. Recommendations kontrolü
     recommendations = output.get("recommendations", [])
@@ -256,13 +265,15 @@ def validate_output_quality(output: Dict[str, Any]) -> Tuple[bool, List[str], in
         issues.append(f"Yetersiz öneri sayısı: {len(recommendations)}/{QUALITY_THRESHOLDS['min_recommendations_count']}")
         quality_score -= 20
     
-    for i, rec in enumerate(recommendations):
-        rec_text = rec.get("action", "") if isinstance(rec, dict) else str(rec)
-        if len(rec_text) < QUALITY_THRESHOLDS["min_recommendation_length"]:
-            issues.append(f"Öneri {i+1} çok kısa: {len(rec_text)} karakter")
-            quality_score -= 10
+    short_recommendations = _short_entries(
+        recommendations, "action", QUALITY_THRESHOLDS["min_recommendation_length"]
+    )
+    issues.extend(f"Öneri {i} çok kısa: {length} karakter" for i, length in short_recommendations)
+    quality_score -= 10 * len(short_recommendations)
     
     # 3. Generic phrase kontrolü
+    # stdlib dumps on purpose: its ", " / ": " separators are part of the
+    # total length measured in step 4
     all_text = json.dumps(output, ensure_ascii=False).lower()
     generic_count = sum(1 for phrase in GENERIC_PHRASES if phrase in all_text)
     if generic_count > QUALITY_THRESHOLDS["max_allowed_generic_phrases"]:
@@ -309,7 +320,7 @@ def get_self_correction_prompt(original_output: Dict[str, Any], issues: List[str
 
 ÖNCEKİ ÇIKTIN:
 ```json
-{json.dumps(original_output, indent=2, ensure_ascii=False)[:3000]}
+{_dumps(original_output, indent=True)[:3000]}
 ```
 
 DÜZELTME TALİMATLARI:
@@ -329,19 +340,9 @@ DÜZELTME TALİMATLARI:
 # ENHANCED PROMPT GENERATOR
 # =============================================================================
 
-def enhance_prompt_with_cot(base_prompt: str, include_schema: bool = True) -> str:
-    """
-    Base prompt'a Chain-of-Thought ve structured output ekle
-    
-    Args:
-        base_prompt: Orijinal prompt
-        include_schema: JSON schema eklensin mi
-        
-    Returns:
-        Zenginleştirilmiş prompt
-    """
-    enhanced = f"""
-{base_prompt}
+# Everything enhance_prompt_with_cot appends after the base prompt is
+# constant, so both variants are assembled once at import
+_COT_SUFFIX_HEAD = f"""
 
 {COT_ANALYSIS_TEMPLATE}
 
@@ -352,15 +353,14 @@ def enhance_prompt_with_cot(base_prompt: str, include_schema: bool = True) -> st
 Analizini aşağıdaki JSON formatında ver:
 
 """
-    
-    if include_schema:
-        enhanced += f"""
+
+_COT_SCHEMA_SECTION = f"""
 JSON SCHEMA (buna UYGUN çıktı üret):
 {OUTPUT_SCHEMA_STRING[:2000]}...
 
 """
-    
-    enhanced += """
+
+_COT_SUFFIX_TAIL = """
 ⚠️ KRİTİK: 
 - Sadece JSON döndür, başka metin yazma
 - Her finding EN AZ 100 karakter
@@ -369,14 +369,36 @@ JSON SCHEMA (buna UYGUN çıktı üret):
 
 ```json
 """
+
+_COT_SUFFIX = _COT_SUFFIX_HEAD + _COT_SUFFIX_TAIL
+_COT_SUFFIX_WITH_SCHEMA = _COT_SUFFIX_HEAD + _COT_SCHEMA_SECTION + _COT_SUFFIX_TAIL
+
+
+def enhance_prompt_with_cot(base_prompt: str, include_schema: bool = True) -> str:
+    """
+    Base prompt'a Chain-of-Thought ve structured output ekle
     
-    return enhanced
+    Args:
+        base_prompt: Orijinal prompt
+        include_schema: JSON schema eklensin mi
+        
+    Returns:
+        Zenginleştirilmiş prompt
+    """
+    suffix = _COT_SUFFIX_WITH_SCHEMA if include_schema else _COT_SUFFIX
+    return f"\n{base_prompt}{suffix}"
 
 
 # =============================================================================
 # SELF-CORRECTION ENGINE
 # =============================================================================
 
+# Trailing-comma cleanup for truncated JSON (_repair_json)
+_TRAILING_COMMA_END_RE = re.compile(r',\s*$')
+_TRAILING_COMMA_OBJECT_RE = re.compile(r',\s*}')
+_TRAILING_COMMA_ARRAY_RE = re.compile(r',\s*]')
+
+
 class SelfCorrectionEngine:
     """
     LLM çıktılarını otomatik düzelten motor
@@ -450,42 +472,67 @@ class SelfCorrectionEngine:
         logger.warning(f"⚠️ Max corrections reached, returning best effort (score: {quality_score})")
         return corrected_output, correction_count > 0, correction_count
     
+    async def correct_many(
+        self,
+        outputs_and_prompts: List[Tuple[Dict[str, Any], str]],
+        max_concurrent: int = 8
+    ) -> List[Any]:
+        """
+        Birden fazla çıktıyı eşzamanlı kontrol et ve düzelt
+        
+        Args:
+            outputs_and_prompts: (output, original_prompt) çiftleri
+            max_concurrent: Aynı anda çalışan en fazla düzeltme (LLM rate limit)
+            
+        Returns:
+            Girdi sırasıyla correct_if_needed sonuçları; başarısız olanlar
+            için yakalanan exception
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async def _correct(output: Dict[str, Any], original_prompt: str):
+            async with semaphore:
+                return await self.correct_if_needed(output, original_prompt)
+        
+        return await asyncio.gather(
+            *(_correct(output, prompt) for output, prompt in outputs_and_prompts),
+            return_exceptions=True
+        )
+    
     def _parse_correction(self, text: str) -> Dict[str, Any]:
         """Düzeltme yanıtını parse et"""
-        # JSON block'u bul
-        if "```json" in text:
-            start = text.find("```json") + 7
-            end = text.find("```", start)
-            if end == -1:
-                json_str = text[start:]
-            else:
-                json_str = text[start:end]
-        elif "```" in text:
-            start = text.find("```") + 3
+        # JSON block'u bul (```json fence first, then any ``` fence)
+        start = text.find("```json")
+        if start != -1:
+            start += 7
+        else:
+            start = text.find("```")
+            if start != -1:
+                start += 3
+        if start == -1:
+            json_str = text
+        else:
             end = text.find("```", start)
             if end == -1:
                 json_str = text[start:]
             else:
                 json_str = text[start:end]
-        else:
-            json_str = text
         
-        # Parse
+        # Parse (orjson when available); the repaired string goes through the
+        # stdlib parser, which also accepts NaN/Infinity and >64-bit integers
         try:
-            return json.loads(json_str.strip())
-        except json.JSONDecodeError:
+            return _json_loads(json_str.strip())
+        except JSONDecodeError:
             # Repair attempt
             json_str = self._repair_json(json_str)
             return json.loads(json_str)
     
     def _repair_json(self, json_str: str) -> str:
         """Truncated JSON'ı onar"""
-        import re
-        
         # Remove trailing comma
-        json_str = re.sub(r',\s*$', '', json_str)
-        json_str = re.sub(r',\s*}', '}', json_str)
-        json_str = re.sub(r',\s*]', ']', json_str)
+        json_str = _TRAILING_COMMA_END_RE.sub('', json_str)
+        json_str = _TRAILING_COMMA_OBJECT_RE.sub('}', json_str)
+        json_str = _TRAILING_COMMA_ARRAY_RE.sub(']', json_str)
         
         # Balance braces
         open_braces = json_str.count('{')
@@ -505,7 +552,19 @@ class SelfCorrectionEngine:
 # PREDICTIVE ANALYTICS HELPERS
 # =============================================================================
 
-def calculate_viral_potential(metrics: Dict[str, Any]) -> Dict[str, Any]:
+# Harmonic viral score: factor values that count as full marks (scaled to 1.0)
+# engagement rate %, save ratio, share ratio, comment/like ratio, monthly growth %
+_VIRAL_FULL_MARKS = np.array([6.0, 0.03, 0.02, 0.05, 10.0], dtype=np.float64)
+_VIRAL_FACTOR_KEYS = (
+    "engagementContribution",
+    "saveContribution",
+    "shareContribution",
+    "commentContribution",
+    "growthContribution",
+)
+
+
+def calculate_viral_potential(metrics: Dict[str, Any], scheme: str = "weighted") -> Dict[str, Any]:
     """
     Viral potansiyel hesapla (basit ML yaklaşımı)
     
@@ -515,6 +574,12 @@ def calculate_viral_potential(metrics: Dict[str, Any]) -> Dict[str, Any]:
     - Share rate
     - Comment-to-like ratio
     - Growth trend
+    
+    Args:
+        metrics: engagementRate, saveRate, shareRate, commentLikeRatio, growthRate
+        scheme: "weighted" (ağırlıklı toplam) veya "harmonic" (tam puana göre
+            ölçeklenmiş faktörlerin harmonik ortalaması; zayıf tek bir faktör
+            skoru aşağı çeker). Harmonic'te factors her faktörün 0-100 skorudur.
     """
     engagement_rate = metrics.get("engagementRate", 0)
     save_rate = metrics.get("saveRate", 0)
@@ -522,18 +587,63 @@ def calculate_viral_potential(metrics: Dict[str, Any]) -> Dict[str, Any]:
     comment_like_ratio = metrics.get("commentLikeRatio", 0)
     growth_rate = metrics.get("growthRate", 0)
     
+    if scheme == "harmonic":
+        return _harmonic_viral_potential(
+            engagement_rate, save_rate, share_rate, comment_like_ratio, growth_rate
+        )
+    if scheme != "weighted":
+        raise ValueError(f"Unknown viral score scheme: {scheme}")
+    
+    # Faktör katkıları (factors'da tekrar kullanılır)
+    engagement_contribution = engagement_rate * 0.25
+    save_contribution = save_rate * 100 * 0.20
+    share_contribution = share_rate * 100 * 0.25
+    comment_contribution = comment_like_ratio * 100 * 0.15
+    growth_contribution = growth_rate * 0.15
+    
     # Ağırlıklı viral score
     viral_score = (
-        engagement_rate * 0.25 +
-        save_rate * 100 * 0.20 +
-        share_rate * 100 * 0.25 +
-        comment_like_ratio * 100 * 0.15 +
-        growth_rate * 0.15
+        engagement_contribution +
+        save_contribution +
+        share_contribution +
+        comment_contribution +
+        growth_contribution
     )
     
-    # Normalize to 0-100
-    viral_score = min(100, max(0, viral_score))
+    # Normalize to 0-100 (NaN and bounds collapse to int 0/100, like min/max did)
+    viral_score = 0 if not viral_score > 0 else (100 if viral_score >= 100 else viral_score)
+    
+    return _viral_result(viral_score, {
+        "engagementContribution": round(engagement_contribution, 2),
+        "saveContribution": round(save_contribution, 2),
+        "shareContribution": round(share_contribution, 2),
+        "commentContribution": round(comment_contribution, 2),
+        "growthContribution": round(growth_contribution, 2),
+    })
+
+
+def _harmonic_viral_potential(
+    engagement_rate: float,
+    save_rate: float,
+    share_rate: float,
+    comment_like_ratio: float,
+    growth_rate: float
+) -> Dict[str, Any]:
+    """Harmonik ortalama viral skor: 100 × n / Σ(1 / ölçekli faktör)"""
+    scaled = np.clip(
+        np.array([engagement_rate, save_rate, share_rate, comment_like_ratio, growth_rate], dtype=np.float64)
+        / _VIRAL_FULL_MARKS,
+        1e-9, 1.0
+    )
+    viral_score = float(100 * scaled.shape[0] / np.reciprocal(scaled).sum())
     
+    return _viral_result(viral_score, {
+        key: round(value * 100, 2) for key, value in zip(_VIRAL_FACTOR_KEYS, scaled.tolist())
+    })
+
+
+def _viral_result(viral_score: float, factors: Dict[str, float]) -> Dict[str, Any]:
+    """Viral skoru kategorize et ve sonuç dict'ini oluştur"""
     # Kategorize
     if viral_score >= 80:
         viral_category = "high"
@@ -549,13 +659,7 @@ def calculate_viral_potential(metrics: Dict[str, Any]) -> Dict[str, Any]:
         "viralScore": round(viral_score, 1),
         "viralCategory": viral_category,
         "description": description,
-        "factors": {
-            "engagementContribution": round(engagement_rate * 0.25, 2),
-            "saveContribution": round(save_rate * 100 * 0.20, 2),
-            "shareContribution": round(share_rate * 100 * 0.25, 2),
-            "commentContribution": round(comment_like_ratio * 100 * 0.15, 2),
-            "growthContribution": round(growth_rate * 0.15, 2),
-        }
+        "factors": factors
     }
 
 
@@ -573,18 +677,18 @@ def predict_growth_trajectory(
     
     adjusted_rate = base_rate * engagement_factor
     """
-    import math
-    
     # Engagement faktörü (yüksek engagement = daha hızlı büyüme)
     engagement_factor = 1 + (engagement_rate / 100)
     
     # Adjusted growth rate
     adjusted_rate = (growth_rate / 100) * engagement_factor
     
-    # Aylik tahminler
+    # Aylik tahminler (followers × (1 + rate)^t; scalar libm pow, same values
+    # as the growth_projections kernel used by predict_growth_trajectories)
+    base = 1 + adjusted_rate
     projections = []
     for month in range(1, months + 1):
-        projected = current_followers * math.pow(1 + adjusted_rate, month)
+        projected = current_followers * base ** float(month)
         projections.append({
             "month": month,
             "projected_followers": int(projected),
@@ -604,3 +708,26 @@ def predict_growth_trajectory(
         "6_month_growth_percent": round((final_projection - current_followers) / current_followers * 100, 1),
         "confidence": "medium" if engagement_rate > 1.5 else "low"
     }
+
+
+def predict_growth_trajectories(
+    current_followers,
+    growth_rates,
+    engagement_rates,
+    months: int = 6
+) -> np.ndarray:
+    """
+    Çok sayıda hesap için büyüme trajektorisi (predict_growth_trajectory modeli)
+    
+    Args:
+        current_followers: Hesap başına mevcut takipçi
+        growth_rates: Aylık büyüme oranları (%)
+        engagement_rates: Engagement oranları (%)
+        months: Tahmin edilen ay sayısı
+        
+    Returns:
+        (hesap, ay) boyutunda tahmini takipçi dizisi (numba kernel, varsa paralel)
+    """
+    engagement_factor = 1 + np.asarray(engagement_rates, dtype=np.float64) / 100
+    adjusted_rate = (np.asarray(growth_rates, dtype=np.float64) / 100) * engagement_factor
+    return growth_projections(current_followers, adjusted_rate, months)
@@ -10,15 +10,23 @@ Gemini (primary model) başarısız olduğunda bu modül:
 """
 
 import asyncio
-import json
 import logging
 import os
+import re
 import httpx
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+from .fast_json import JSONDecodeError, dumps_bytes as _dumps_bytes, loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
+# Connection pool for the long-lived DeepSeek client
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+
+# Markdown code block around the JSON payload
+_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*([\s\S]*?)```')
+
 
 class DeepSeekFallback:
     """
@@ -32,11 +40,30 @@ class DeepSeekFallback:
         self.base_url = os.getenv("DEEPSEEK_BASE_URL", "https://api.deepseek.com")
         self.model = os.getenv("DEEPSEEK_MODEL", "deepseek-chat")
         self.timeout = httpx.Timeout(120.0, connect=15.0)
+        self._http_client: Optional[httpx.AsyncClient] = None
         self.enabled = bool(self.api_key)
         
+        # Request headers are fixed per instance
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        } if self.enabled else None
+        
         if not self.enabled:
             logger.warning("DeepSeek Secondary disabled - DEEPSEEK_API_KEY not set")
     
+    def _client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, created on first use (keep-alive connections are reused)"""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(timeout=self.timeout, limits=_HTTP_LIMITS)
+        return self._http_client
+    
+    async def close(self):
+        """Close HTTP client"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+    
     async def generate_content(
         self,
         system_prompt: str,
@@ -59,11 +86,6 @@ class DeepSeekFallback:
         if not self.enabled:
             raise RuntimeError("DeepSeek not configured - API key missing")
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
         payload = {
             "model": self.model,
             "messages": [
@@ -76,17 +98,16 @@ class DeepSeekFallback:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/v1/chat/completions",
-                    headers=headers,
-                    json=payload
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                return data["choices"][0]["message"]["content"]
-                
+            response = await self._client().post(
+                f"{self.base_url}/v1/chat/completions",
+                headers=self._headers,
+                content=_dumps_bytes(payload)
+            )
+            response.raise_for_status()
+            
+            data = _json_loads(response.content)
+            return data["choices"][0]["message"]["content"]
+            
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 429:
                 logger.error("DeepSeek also rate limited!")
@@ -147,27 +168,29 @@ class DeepSeekFallback:
     
     def _parse_json_response(self, text: str) -> Dict[str, Any]:
         """Parse JSON from LLM response"""
-        # Try direct JSON parse
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError:
-            pass
+        # Try direct JSON parse (only when the text can be an object/array;
+        # fenced or prose responses skip straight to extraction)
+        if text.lstrip()[:1] in ('{', '['):
+            try:
+                return _json_loads(text)
+            except JSONDecodeError:
+                pass
         
         # Try to extract JSON from markdown code blocks
-        import re
-        json_match = re.search(r'```(?:json)?\s*([\s\S]*?)```', text)
+        json_match = _CODE_BLOCK_RE.search(text)
         if json_match:
             try:
-                return json.loads(json_match.group(1))
-            except json.JSONDecodeError:
+                return _json_loads(json_match.group(1))
+            except JSONDecodeError:
                 pass
         
-        # Try to find JSON object in text
-        json_match = re.search(r'\{[\s\S]*\}', text)
-        if json_match:
+        # Try to find JSON object in text (first '{' through last '}')
+        start = text.find('{')
+        end = text.rfind('}')
+        if start != -1 and end > start:
             try:
-                return json.loads(json_match.group())
-            except json.JSONDecodeError:
+                return _json_loads(text[start:end + 1])
+            except JSONDecodeError:
                 pass
         
         # Return as raw response
@@ -192,6 +215,12 @@ def get_deepseek_fallback() -> DeepSeekFallback:
     return _deepseek_fallback
 
 
+async def close_deepseek_fallback() -> None:
+    """Close the DeepSeek secondary instance's HTTP client (if one was created)"""
+    if _deepseek_fallback is not None:
+        await _deepseek_fallback.close()
+
+
 def is_fallback_available() -> bool:
     """Check if DeepSeek secondary is available"""
     return get_deepseek_fallback().enabled
@@ -14,15 +14,60 @@ DeepSeek API: OpenAI uyumlu endpoint kullanır
 """
 
 import asyncio
-import json
 import logging
 import os
 import httpx
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterable, Dict, List, Optional
+
+from .fast_json import dumps_bytes as _dumps_bytes, loads as _json_loads
 
 logger = logging.getLogger(__name__)
 
+# Connection pool for the long-lived DeepSeek client
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+
+
+async def _collect_sse_content(lines: AsyncIterable[str]) -> str:
+    """
+    Join the content deltas of a streamed chat completion as they arrive.
+    
+    Server-sent events: each "data:" line carries a JSON chunk and the stream
+    ends with "data: [DONE]". A stream that stops before [DONE] raises
+    httpx.RemoteProtocolError instead of returning a truncated answer.
+    """
+    parts = []
+    async for line in lines:
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if data == "[DONE]":
+            return "".join(parts)
+        chunk = _json_loads(data)
+        if chunk.get("choices"):
+            parts.append(chunk["choices"][0].get("delta", {}).get("content") or "")
+    raise httpx.RemoteProtocolError("DeepSeek stream ended before [DONE]")
+
+
+# str.lower() maps Turkish 'İ' to 'i' + U+0307 (combining dot above), which
+# would hide keywords like "KRİTİK" / "TAHMİN"; the dot is dropped before matching
+_COMBINING_DOT_ABOVE = {0x0307: None}
+
+
+def _section_for_header(line_lower: str) -> Optional[str]:
+    """Section a (lowercased) response line opens, or None for body lines"""
+    if "durum" in line_lower or "özet" in line_lower:
+        return "situation"
+    if "kritik" in line_lower or "sorun" in line_lower:
+        return "critical_issues"
+    if "bu hafta" in line_lower or "yap" in line_lower and "yapma" not in line_lower:
+        return "this_week_actions"
+    if "yapma" in line_lower:
+        return "dont_do"
+    if "tahmin" in line_lower or "6 ay" in line_lower:
+        return "prediction"
+    return None
+
 
 class DeepSeekFinalAnalyst:
     """
@@ -77,9 +122,28 @@ FORMAT:
         if not self.api_key:
             logger.warning("DEEPSEEK_API_KEY not set - Final Analyst will be disabled")
         
+        # Request headers are fixed per instance
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        } if self.api_key else None
+        
         # HTTP client with timeout
         self.timeout = httpx.Timeout(60.0, connect=10.0)
-        
+        self._http_client: Optional[httpx.AsyncClient] = None
+    
+    def _client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, created on first use (keep-alive connections are reused)"""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(timeout=self.timeout, limits=_HTTP_LIMITS)
+        return self._http_client
+    
+    async def close(self):
+        """Close HTTP client"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+    
     async def analyze(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Tüm analiz sonuçlarını değerlendirip final yorum üret
@@ -133,6 +197,8 @@ FORMAT:
         
         # Temel metrikleri çıkar
         basic_metrics = self._extract_basic_metrics(analysis_data)
+        metrics_text = "\n".join(f"- {key}: {value}" for key, value in basic_metrics.items())
+        success_metrics = ", ".join(map(str, business_identity.get('correct_success_metrics', []))) or "Belirsiz"
         
         # Agent sonuçlarını özetle
         agent_summaries = self._summarize_agents(agent_results)
@@ -146,12 +212,12 @@ HESAP: @{username}
 GENEL SKOR: {final_score}/100 (Not: {final_grade})
 
 TEMEL METRİKLER:
-{json.dumps(basic_metrics, indent=2, ensure_ascii=False)}
+{metrics_text}
 
 İŞLETME KİMLİĞİ:
 - Tip: {business_identity.get('account_type', 'Belirsiz')}
 - Hizmet Sağlayıcı mı: {business_identity.get('is_service_provider', False)}
-- Doğru Başarı Metrikleri: {business_identity.get('correct_success_metrics', [])}
+- Doğru Başarı Metrikleri: {success_metrics}
 
 AGENT ANALİZ ÖZETLERİ:
 {agent_summaries}
@@ -212,11 +278,6 @@ GÖREV: Bu verilere dayanarak kullanıcıya final yorumunu ver. Acımasız ol, g
     async def _call_deepseek(self, context: str) -> str:
         """DeepSeek API'yi çağır"""
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
         payload = {
             "model": self.model,
             "messages": [
@@ -225,19 +286,17 @@ GÖREV: Bu verilere dayanarak kullanıcıya final yorumunu ver. Acımasız ol, g
             ],
             "temperature": 0.7,
             "max_tokens": 2000,
-            "stream": False
+            "stream": True
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/v1/chat/completions",
-                headers=headers,
-                json=payload
-            )
+        async with self._client().stream(
+            "POST",
+            f"{self.base_url}/v1/chat/completions",
+            headers=self._headers,
+            content=_dumps_bytes(payload)
+        ) as response:
             response.raise_for_status()
-            
-            data = response.json()
-            return data["choices"][0]["message"]["content"]
+            return await _collect_sse_content(response.aiter_lines())
     
     def _parse_response(self, response: str) -> Dict[str, Any]:
         """DeepSeek yanıtını yapılandırılmış formata çevir"""
@@ -250,41 +309,20 @@ GÖREV: Bu verilere dayanarak kullanıcıya final yorumunu ver. Acımasız ol, g
             "prediction": ""
         }
         
-        lines = response.strip().split("\n")
         current_section = None
         current_content = []
         
-        for line in lines:
+        for line in response.strip().split("\n"):
             line = line.strip()
             if not line:
                 continue
             
             # Section headers
-            line_lower = line.lower()
-            if "durum" in line_lower or "özet" in line_lower:
-                if current_section and current_content:
-                    sections[current_section] = self._process_section(current_section, current_content)
-                current_section = "situation"
-                current_content = []
-            elif "kritik" in line_lower or "sorun" in line_lower:
-                if current_section and current_content:
-                    sections[current_section] = self._process_section(current_section, current_content)
-                current_section = "critical_issues"
-                current_content = []
-            elif "bu hafta" in line_lower or "yap" in line_lower and "yapma" not in line_lower:
-                if current_section and current_content:
-                    sections[current_section] = self._process_section(current_section, current_content)
-                current_section = "this_week_actions"
-                current_content = []
-            elif "yapma" in line_lower:
-                if current_section and current_content:
-                    sections[current_section] = self._process_section(current_section, current_content)
-                current_section = "dont_do"
-                current_content = []
-            elif "tahmin" in line_lower or "6 ay" in line_lower:
+            header = _section_for_header(line.lower().translate(_COMBINING_DOT_ABOVE))
+            if header is not None:
                 if current_section and current_content:
                     sections[current_section] = self._process_section(current_section, current_content)
-                current_section = "prediction"
+                current_section = header
                 current_content = []
             elif current_section:
                 current_content.append(line)
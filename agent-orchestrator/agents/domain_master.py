@@ -1,7 +1,713 @@
 # Domain Master Agent - PhD Level Implementation
 # Niche Analysis, Trend Detection, Content Strategy & Hashtag Optimization
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Set, Tuple
 from .base_agent import BaseAgent
+from .frozen_config import freeze as _freeze
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:  # pyahocorasick is optional
+    AHOCORASICK_AVAILABLE = False
+
+# Aynı hesap birden çok aşamada ve ajanda analiz edilir; eşleşme sonuçları
+# katlanmış (bio, isim) başına modül düzeyinde saklanır
+_IDENTITY_CACHE_SIZE = 4096
+
+
+def _fold_identity_text(text: str) -> str:
+    """
+    Gösterge eşleştirme için harf katlama: casefold, ardından Türkçe büyük harf
+    farkları silinir ("İ" → "i" + U+0307 noktası düşer, "ı" → "i"), böylece
+    "EĞİTİM" / "DANIŞMAN" yazımları da eşleşir.
+    """
+    # str.translate Türkçe metinde bu iki replace'ten ~7 kat yavaş
+    return text.casefold().replace("\u0307", "").replace("ı", "i")
+
+
+def _occurs_at_word_start(text: str, keyword: str) -> bool:
+    """keyword text'te bir kelime başında geçiyor mu (öncesinde harf/rakam yok)"""
+    start = text.find(keyword)
+    while start > 0 and text[start - 1].isalnum():
+        start = text.find(keyword, start + 1)
+    return start >= 0
+
+
+# =========================
+# İŞLETME KİMLİĞİ TESPİT SİSTEMİ
+# =========================
+
+# Servis sağlayıcı kategorileri
+_SERVICE_PROVIDER_CATEGORIES: Mapping[str, Any] = _freeze({
+    "coaching_consulting": {
+        "indicators": [
+            "life coach", "business coach", "kariyer koçu", "koç",
+            "danışman", "consultant", "mentor", "mentoring",
+            "danışmanlık", "coaching", "koçluk"
+        ],
+        "success_metrics": ["dm_conversion", "appointment_booking", "lead_generation", "course_sales"],
+        "wrong_metrics": ["likes", "views", "follower_count"],
+        "account_type": "SERVICE_PROVIDER",
+        "benchmark_engagement": 1.5  # Daha düşük engagement normaldir
+    },
+    "spiritual_wellness": {
+        "indicators": [
+            "spiritüel", "spiritual", "reiki", "healing", "şifa",
+            "meditasyon", "meditation", "yoga öğretmen", "yoga teacher",
+            "enerji çalışma", "energy healing", "aura", "çakra"
+        ],
+        "success_metrics": ["session_booking", "workshop_attendance", "community_engagement"],
+        "wrong_metrics": ["viral_content", "trending"],
+        "account_type": "SERVICE_PROVIDER",
+        "benchmark_engagement": 2.0
+    },
+    "education_training": {
+        "indicators": [
+            "kurs", "course", "eğitim", "training", "workshop",
+            "bootcamp", "masterclass", "online eğitim", "e-learning",
+            "sertifika", "certificate"
+        ],
+        "success_metrics": ["course_sales", "student_enrollment", "completion_rate"],
+        "wrong_metrics": ["entertainment_value", "virality"],
+        "account_type": "EDUCATOR",
+        "benchmark_engagement": 1.8
+    },
+    "therapy_psychology": {
+        "indicators": [
+            "terapist", "therapist", "psikolog", "psychologist",
+            "psikoterapi", "psychotherapy", "terapi", "therapy",
+            "danışmanlık", "counseling", "mental sağlık"
+        ],
+        "success_metrics": ["appointment_conversion", "trust_building", "professional_credibility"],
+        "wrong_metrics": ["entertainment", "viral_reach"],
+        "account_type": "HEALTHCARE_PROFESSIONAL",
+        "benchmark_engagement": 1.2  # En düşük - profesyonel mesafe
+    },
+    "fitness_health_services": {
+        "indicators": [
+            "antrenör", "trainer", "pt", "personal trainer",
+            "diyetisyen", "dietitian", "nutritionist", "beslenme uzman",
+            "pilates eğitmen", "yoga eğitmen"
+        ],
+        "success_metrics": ["client_acquisition", "transformation_results", "program_sales"],
+        "wrong_metrics": ["dance_challenges", "entertainment_value"],
+        "account_type": "FITNESS_PROFESSIONAL",
+        "benchmark_engagement": 2.5
+    },
+    "professional_services": {
+        "indicators": [
+            "avukat", "lawyer", "hukuk", "legal",
+            "muhasebeci", "accountant", "mali müşavir",
+            "mimar", "architect", "iç mimar", "interior designer",
+            "emlak", "real estate", "danışman"
+        ],
+        "success_metrics": ["lead_generation", "consultation_booking", "professional_authority"],
+        "wrong_metrics": ["entertainment", "virality", "follower_growth"],
+        "account_type": "PROFESSIONAL_SERVICE",
+        "benchmark_engagement": 1.0  # En düşük - profesyonel sektör
+    },
+    "freelancer_agency": {
+        "indicators": [
+            "freelancer", "serbest", "ajans", "agency",
+            "tasarımcı", "designer", "developer", "geliştirici",
+            "sosyal medya yönetimi", "content creator for brands"
+        ],
+        "success_metrics": ["portfolio_views", "client_inquiries", "project_conversion"],
+        "wrong_metrics": ["personal_fame", "viral_content"],
+        "account_type": "B2B_SERVICE",
+        "benchmark_engagement": 1.5
+    }
+})
+
+# Birden çok kategoride geçen göstergeler yalnızca buradaki kategoriye sayılır
+# (listede olmayan tekrarlar tablo sırasındaki ilk kategoriye)
+_INDICATOR_PRIORITY: Mapping[str, str] = _freeze({
+    "danışman": "coaching_consulting",
+    "danışmanlık": "coaching_consulting"
+})
+
+# Content Creator vs Service Provider ayrımı
+_ACCOUNT_TYPE_DEFINITIONS: Mapping[str, Any] = _freeze({
+    "CONTENT_CREATOR": {
+        "description": "İçerik üretimi ana gelir kaynağı",
+        "success_metrics": ["views", "engagement", "follower_growth", "sponsorship_deals", "ad_revenue"],
+        "benchmark_engagement_min": 2.5,
+        "goal": "Maksimum reach ve engagement"
+    },
+    "SERVICE_PROVIDER": {
+        "description": "Hizmet satışı ana gelir kaynağı",
+        "success_metrics": ["dm_conversion", "appointment_booking", "lead_quality", "client_retention"],
+        "benchmark_engagement_min": 1.0,  # Düşük engagement normal!
+        "goal": "Güven inşa etme ve dönüşüm"
+    },
+    "HYBRID": {
+        "description": "Hem içerik hem hizmet",
+        "success_metrics": ["engagement", "conversion", "authority_building"],
+        "benchmark_engagement_min": 1.5,
+        "goal": "Denge: reach + conversion"
+    }
+})
+
+# Bio analiz kelimeleri
+_BIO_SERVICE_INDICATORS: Tuple[str, ...] = _freeze([
+    "randevu", "appointment", "dm", "link", "bio'da",
+    "in bio", "linktr.ee", "calendly", "hizmet", "service",
+    "danışmanlık", "consulting", "seansı", "session",
+    "ücretsiz görüşme", "free call", "discovery call"
+])
+
+# CTA analiz kelimeleri (satış odaklı)
+_SALES_CTA_INDICATORS: Tuple[str, ...] = _freeze([
+    "şimdi başla", "hemen ulaş", "dm at", "link'e tıkla",
+    "randevu al", "ücretsiz dene", "yerini ayırt",
+    "katıl", "başvur", "kayıt ol", "satın al"
+])
+
+
+# =========================
+# Ana niche kategorileri ve alt kategorileri
+# =========================
+
+_NICHE_TAXONOMY: Mapping[str, Any] = _freeze({
+    "lifestyle": {
+        "sub_niches": ["fashion", "beauty", "home_decor", "travel", "food_cooking", "parenting"],
+        "typical_audience": "broad_consumer",
+        "monetization_potential": "high"
+    },
+    "business_professional": {
+        "sub_niches": ["entrepreneurship", "marketing", "finance_investing", "career_leadership", "real_estate", "ecommerce"],
+        "typical_audience": "professionals",
+        "monetization_potential": "very_high"
+    },
+    "health_wellness": {
+        "sub_niches": ["fitness", "nutrition", "mental_health", "yoga_meditation", "medical_healthcare", "alternative_wellness"],
+        "typical_audience": "health_conscious",
+        "monetization_potential": "high"
+    },
+    "education_knowledge": {
+        "sub_niches": ["personal_development", "language_learning", "academic_study", "skills_training", "science_tech", "history_culture"],
+        "typical_audience": "learners",
+        "monetization_potential": "medium_high"
+    },
+    "entertainment": {
+        "sub_niches": ["comedy_humor", "music", "gaming", "movies_tv", "art_design", "photography"],
+        "typical_audience": "general_entertainment",
+        "monetization_potential": "medium"
+    },
+    "technology": {
+        "sub_niches": ["tech_reviews", "software_apps", "ai_innovation", "crypto_web3", "gadgets", "programming"],
+        "typical_audience": "tech_enthusiasts",
+        "monetization_potential": "high"
+    },
+    "special_interest": {
+        "sub_niches": ["pets_animals", "sports", "automotive", "diy_crafts", "gardening", "collectibles"],
+        "typical_audience": "hobbyists",
+        "monetization_potential": "medium"
+    }
+})
+
+# Niche derinlik seviyeleri
+_NICHE_DEPTH_LEVELS: Mapping[str, Any] = _freeze({
+    "level_1_broad": {"description": "Geniş kategori (örn: Fitness)", "competition": "very_high", "differentiation": "low"},
+    "level_2_specific": {"description": "Belirli segment (örn: Women's Fitness)", "competition": "high", "differentiation": "medium"},
+    "level_3_niche": {"description": "Niş alan (örn: Postpartum Fitness)", "competition": "medium", "differentiation": "high"},
+    "level_4_micro": {"description": "Mikro niş (örn: Postpartum Diastasis Recti Recovery)", "competition": "low", "differentiation": "very_high"}
+})
+
+# Niche detection confidence levels
+_CONFIDENCE_LEVELS: Mapping[str, Any] = _freeze({
+    "high": {"range": (0.7, 1.0), "description": "Clear niche positioning"},
+    "medium": {"range": (0.5, 0.7), "description": "Defined but broad"},
+    "low": {"range": (0.3, 0.5), "description": "Multiple niches, unclear focus"},
+    "very_low": {"range": (0.0, 0.3), "description": "Unclear positioning"}
+})
+
+
+# =========================
+# Niche-specific benchmark veritabanı
+# =========================
+
+_NICHE_BENCHMARKS: Mapping[str, Any] = _freeze({
+    "fashion": {
+        "avg_engagement_rate": 2.1,
+        "avg_growth_rate": 4.5,
+        "optimal_posts_per_week": (5, 7),
+        "reels_percentage": 45,
+        "avg_save_rate": 3.2
+    },
+    "beauty": {
+        "avg_engagement_rate": 2.8,
+        "avg_growth_rate": 5.2,
+        "optimal_posts_per_week": (5, 6),
+        "reels_percentage": 50,
+        "avg_save_rate": 4.5
+    },
+    "fitness": {
+        "avg_engagement_rate": 3.5,
+        "avg_growth_rate": 6.0,
+        "optimal_posts_per_week": (6, 7),
+        "reels_percentage": 55,
+        "avg_save_rate": 5.8
+    },
+    "food": {
+        "avg_engagement_rate": 3.2,
+        "avg_growth_rate": 5.5,
+        "optimal_posts_per_week": (5, 7),
+        "reels_percentage": 40,
+        "avg_save_rate": 6.2
+    },
+    "travel": {
+        "avg_engagement_rate": 4.0,
+        "avg_growth_rate": 4.0,
+        "optimal_posts_per_week": (3, 5),
+        "reels_percentage": 50,
+        "avg_save_rate": 7.5
+    },
+    "business_b2b": {
+        "avg_engagement_rate": 1.5,
+        "avg_growth_rate": 3.5,
+        "optimal_posts_per_week": (4, 5),
+        "reels_percentage": 30,
+        "avg_save_rate": 4.0
+    },
+    "personal_development": {
+        "avg_engagement_rate": 2.5,
+        "avg_growth_rate": 5.0,
+        "optimal_posts_per_week": (5, 6),
+        "reels_percentage": 35,
+        "avg_save_rate": 5.5
+    },
+    "parenting": {
+        "avg_engagement_rate": 3.8,
+        "avg_growth_rate": 5.5,
+        "optimal_posts_per_week": (4, 6),
+        "reels_percentage": 45,
+        "avg_save_rate": 4.8
+    },
+    "tech": {
+        "avg_engagement_rate": 1.8,
+        "avg_growth_rate": 4.0,
+        "optimal_posts_per_week": (4, 5),
+        "reels_percentage": 40,
+        "avg_save_rate": 3.5
+    },
+    "entertainment": {
+        "avg_engagement_rate": 4.5,
+        "avg_growth_rate": 7.0,
+        "optimal_posts_per_week": (6, 7),
+        "reels_percentage": 60,
+        "avg_save_rate": 2.5
+    },
+    "education": {
+        "avg_engagement_rate": 2.2,
+        "avg_growth_rate": 4.5,
+        "optimal_posts_per_week": (4, 5),
+        "reels_percentage": 35,
+        "avg_save_rate": 6.0
+    },
+    "art_design": {
+        "avg_engagement_rate": 3.0,
+        "avg_growth_rate": 4.0,
+        "optimal_posts_per_week": (4, 6),
+        "reels_percentage": 35,
+        "avg_save_rate": 5.0
+    }
+})
+
+
+# =========================
+# Trend yaşam döngüsü ve karakteristikleri
+# =========================
+
+_TREND_LIFECYCLE: Mapping[str, Any] = _freeze({
+    "emerging": {
+        "adoption_range": (0, 10),
+        "characteristics": {
+            "early_mover_advantage": True,
+            "risk_level": "high",
+            "reward_potential": "high",
+            "opportunity": "innovation"
+        },
+        "strategy": "Erken giriş, risk al, farklılaş"
+    },
+    "growing": {
+        "adoption_range": (10, 40),
+        "characteristics": {
+            "early_mover_advantage": True,
+            "risk_level": "medium",
+            "reward_potential": "high",
+            "opportunity": "optimal_entry"
+        },
+        "strategy": "En iyi risk/reward oranı, hızlı hareket et"
+    },
+    "mature": {
+        "adoption_range": (40, 70),
+        "characteristics": {
+            "early_mover_advantage": False,
+            "risk_level": "low",
+            "reward_potential": "medium",
+            "opportunity": "safe_execution"
+        },
+        "strategy": "Farklılaşma kritik, kalite odaklı"
+    },
+    "declining": {
+        "adoption_range": (70, 100),
+        "characteristics": {
+            "early_mover_advantage": False,
+            "risk_level": "medium",
+            "reward_potential": "low",
+            "opportunity": "minimal"
+        },
+        "strategy": "Kaçın veya çok farklı yaklaş"
+    }
+})
+
+# Content format trends 2024-2025
+_FORMAT_TRENDS: Mapping[str, Any] = _freeze({
+    "long_form_reels": {"status": "growing", "description": "90+ saniye Reels"},
+    "photo_dumps_carousels": {"status": "stable_growing", "description": "Çoklu fotoğraf paylaşımları"},
+    "behind_the_scenes": {"status": "growing", "description": "Sahne arkası içerikler"},
+    "raw_unfiltered": {"status": "growing", "description": "Filtresiz, doğal içerikler"},
+    "ai_generated": {"status": "emerging", "description": "AI destekli içerikler"},
+    "interactive_content": {"status": "growing", "description": "Etkileşimli içerikler"},
+    "series_episodic": {"status": "growing", "description": "Seri/bölümlü içerikler"}
+})
+
+# Cross-niche topic trends
+_TOPIC_TRENDS: Mapping[str, Any] = _freeze({
+    "sustainability_eco": {"status": "mature_growing", "relevance": "high"},
+    "mental_health": {"status": "mature", "relevance": "high"},
+    "ai_automation": {"status": "growing", "relevance": "very_high"},
+    "work_life_balance": {"status": "growing", "relevance": "high"},
+    "financial_literacy": {"status": "growing", "relevance": "high"},
+    "authenticity_transparency": {"status": "growing", "relevance": "very_high"},
+    "community_building": {"status": "growing", "relevance": "high"}
+})
+
+# Engagement trends
+_ENGAGEMENT_TRENDS: Mapping[str, Any] = _freeze({
+    "dm_engagement": {"status": "growing", "priority": "high"},
+    "broadcast_channels": {"status": "growing", "priority": "high"},
+    "close_friends": {"status": "stable", "priority": "medium"},
+    "collaborative_posts": {"status": "growing", "priority": "high"},
+    "ugc_content": {"status": "mature", "priority": "medium"},
+    "live_shopping": {"status": "emerging", "priority": "region_dependent"}
+})
+
+
+# =========================
+# Niche bazlı sezonsal pattern matrisi
+# =========================
+
+_SEASONAL_PATTERNS: Mapping[str, Any] = _freeze({
+    "fashion": ["Fashion weeks", "Seasons", "Holidays"],
+    "fitness": ["January (NY resolution)", "May-June (summer body)", "September (back to routine)"],
+    "food": ["Holidays", "Seasons", "Cultural events"],
+    "travel": ["Summer", "Holidays", "School breaks"],
+    "beauty": ["Award seasons", "Holidays", "Product launches"],
+    "business": ["Q1 planning", "Q4 budgets", "Tax season"],
+    "education": ["Back to school", "Exam periods", "Summer programs"],
+    "parenting": ["School year", "Holidays", "Summer"],
+    "tech": ["Product launches", "CES", "WWDC", "Tech conferences"],
+    "finance": ["Tax season", "Market events", "Year-end"]
+})
+
+# Weekly content patterns
+_WEEKLY_PATTERNS: Mapping[str, Any] = _freeze({
+    "monday": {"theme": "motivation_planning", "content_type": "inspirational"},
+    "tuesday": {"theme": "educational_value", "content_type": "tutorial"},
+    "wednesday": {"theme": "educational_value", "content_type": "tips"},
+    "thursday": {"theme": "educational_value", "content_type": "insights"},
+    "friday": {"theme": "lighter_fun", "content_type": "entertaining"},
+    "saturday": {"theme": "lifestyle_personal", "content_type": "behind_scenes"},
+    "sunday": {"theme": "reflection_prep", "content_type": "community"}
+})
+
+# Monthly patterns
+_MONTHLY_PATTERNS: Mapping[str, Any] = _freeze({
+    "week_1": {"theme": "fresh_start_goals", "focus": "New initiatives"},
+    "week_2": {"theme": "deep_content", "focus": "Tutorials, detailed guides"},
+    "week_3": {"theme": "deep_content", "focus": "Continued value delivery"},
+    "week_4": {"theme": "recap_engagement", "focus": "Results, testimonials, community"}
+})
+
+
+# =========================
+# Content pillar framework ve dağılım sistemleri
+# =========================
+
+_PILLAR_TYPES: Mapping[str, Any] = _freeze({
+    "educational": {
+        "description": "How-to tutorials, tips, industry insights, myth busting",
+        "best_for": ["authority", "saves", "long_term_value"],
+        "optimal_percentage": (40, 50),
+        "engagement_type": "value_driven"
+    },
+    "inspirational": {
+        "description": "Success stories, transformations, quotes, journey content",
+        "best_for": ["shares", "emotional_connection", "motivation"],
+        "optimal_percentage": (25, 30),
+        "engagement_type": "emotion_driven"
+    },
+    "entertaining": {
+        "description": "Humor/memes, trends, relatable content, day-in-life",
+        "best_for": ["reach", "virality", "new_audience"],
+        "optimal_percentage": (15, 20),
+        "engagement_type": "share_driven"
+    },
+    "promotional": {
+        "description": "Product showcase, testimonials, offers, case studies",
+        "best_for": ["sales", "leads", "conversions"],
+        "optimal_percentage": (5, 10),
+        "engagement_type": "conversion_driven"
+    },
+    "community": {
+        "description": "Q&A, user spotlights, polls, personal stories",
+        "best_for": ["loyalty", "engagement", "retention"],
+        "optimal_percentage": (10, 15),
+        "engagement_type": "connection_driven"
+    }
+})
+
+# Topic relevance scoring
+_TOPIC_RELEVANCE_SCORES: Mapping[str, Any] = _freeze({
+    "core_niche": 100,
+    "adjacent_topic": 70,
+    "tangential_topic": 40,
+    "off_topic": 10
+})
+
+# Competitive differentiation levels
+_DIFFERENTIATION_LEVELS: Mapping[str, Any] = _freeze({
+    "unique_angle": {"score": 100, "description": "Benzersiz perspektif"},
+    "better_execution": {"score": 70, "description": "Daha iyi uygulama"},
+    "similar_to_competitors": {"score": 40, "description": "Rakiplere benzer"},
+    "copying_competitors": {"score": 20, "description": "Kopya içerik"}
+})
+
+# Content gap types
+_GAP_TYPES: Mapping[str, Any] = _freeze({
+    "topic_gaps": ["Competitor topics not covered", "Audience questions unanswered", "Trending topics missed", "Seasonal content missing"],
+    "format_gaps": ["Underutilized formats", "Platform feature gaps", "Content length variety", "Interactive content missing"],
+    "depth_gaps": ["Surface-level only", "Missing advanced content", "No beginner content", "Missing case studies"],
+    "frequency_gaps": ["Inconsistent posting", "Missing content types", "Seasonal gaps", "Time-of-day gaps"]
+})
+
+
+# =========================
+# Hashtag tipleri ve kategori sistemi
+# =========================
+
+_HASHTAG_TYPES: Mapping[str, Any] = _freeze({
+    "branded": {
+        "description": "Hesaba özel, kampanya veya community hashtag'leri",
+        "example": "#NikeRunning",
+        "purpose": "Brand identity, UGC collection"
+    },
+    "niche": {
+        "description": "Sektöre özel, orta rekabet hashtag'leri",
+        "example": "#VeganRecipes",
+        "purpose": "Targeted discovery"
+    },
+    "community": {
+        "description": "Grup kimliği, engagement odaklı hashtag'ler",
+        "example": "#FitFam",
+        "purpose": "Community building"
+    },
+    "location": {
+        "description": "Coğrafi hedefleme hashtag'leri",
+        "example": "#IstanbulFood",
+        "purpose": "Local discovery"
+    },
+    "trending": {
+        "description": "Güncel olaylar, viral konular",
+        "example": "#Oscars2025",
+        "purpose": "Timely reach"
+    }
+})
+
+# Size-based categories
+_HASHTAG_SIZE_CATEGORIES: Mapping[str, Any] = _freeze({
+    "mega": {
+        "post_count": ">10M",
+        "discovery_potential": "low",
+        "competition": "very_high",
+        "use_case": "Brand awareness attempt"
+    },
+    "large": {
+        "post_count": "1M-10M",
+        "discovery_potential": "medium",
+        "competition": "high",
+        "use_case": "Broad discovery"
+    },
+    "medium": {
+        "post_count": "100K-1M",
+        "discovery_potential": "high",
+        "competition": "medium",
+        "use_case": "Sweet spot - optimal discovery"
+    },
+    "small": {
+        "post_count": "10K-100K",
+        "discovery_potential": "high",
+        "competition": "low",
+        "use_case": "Niche targeting"
+    },
+    "micro": {
+        "post_count": "<10K",
+        "discovery_potential": "medium",
+        "competition": "very_low",
+        "use_case": "Ultra-targeted, branded"
+    }
+})
+
+
+# =========================
+# Optimal hashtag stratejisi ve dağılım
+# =========================
+
+# Optimal distribution for 30 hashtags
+_OPTIMAL_HASHTAG_DISTRIBUTION: Mapping[str, Any] = _freeze({
+    "mega": {"count": (2, 3), "percentage": 8},
+    "large": {"count": (5, 7), "percentage": 20},
+    "medium": {"count": (10, 12), "percentage": 37},
+    "small": {"count": (8, 10), "percentage": 30},
+    "micro": {"count": (2, 3), "percentage": 8}
+})
+
+# Hashtag rotation strategy
+_ROTATION_STRATEGY: Mapping[str, Any] = _freeze({
+    "set_a": "Posts 1, 4, 7...",
+    "set_b": "Posts 2, 5, 8...",
+    "set_c": "Posts 3, 6, 9...",
+    "purpose": "Shadowban prevention, performance testing"
+})
+
+# Fitness niche example hashtag bank
+_EXAMPLE_HASHTAG_BANKS: Mapping[str, Any] = _freeze({
+    "fitness": {
+        "mega": ["#fitness", "#workout", "#gym", "#fitnessmotivation", "#fit"],
+        "large": ["#fitlife", "#gymlife", "#fitnessjourney", "#workoutmotivation", "#fitfam"],
+        "medium": ["#homeworkouts", "#fitnessgirl", "#gymmotivation", "#fitnesslifestyle"],
+        "small": ["#turkishfitness", "#evdeegzersiz", "#fitnessturkiye"],
+        "micro": ["branded_hashtags", "local_gym_tags", "specific_program_tags"]
+    }
+})
+
+
+
+class _IdentityMatcher:
+    """
+    İşletme kimliği göstergeleri için anahtar kelime eşleştirici
+    
+    Tüm göstergeler (kategori + bio servis) tek Aho-Corasick otomatında;
+    pyahocorasick yoksa her tekil anahtar kelime için bir substring araması.
+    """
+    
+    def __init__(
+        self,
+        categories: Mapping[str, Any],
+        bio_service_indicators: Tuple[str, ...],
+        indicator_priority: Mapping[str, str] = _INDICATOR_PRIORITY
+    ):
+        # (kategori, gösterge) sırası sonuçtaki sırayı belirler
+        self.indicators = tuple(
+            (category, indicator)
+            for category, info in categories.items()
+            for indicator in info["indicators"]
+        )
+        # Anahtar kelime -> tek slot; tekrarlanan gösterge tek kategoriye sayılır
+        priority = {_fold_identity_text(keyword): owner for keyword, owner in indicator_priority.items()}
+        self.keyword_slots = {}
+        for slot, (category, indicator) in enumerate(self.indicators):
+            keyword = _fold_identity_text(indicator)
+            owner = priority.get(keyword)
+            if owner is None:
+                self.keyword_slots.setdefault(keyword, slot)
+            elif category == owner:
+                self.keyword_slots[keyword] = slot
+        self.bio_service_keywords = tuple(_fold_identity_text(indicator) for indicator in bio_service_indicators)
+        self.keywords = tuple(set(self.keyword_slots) | set(self.bio_service_keywords))
+        
+        # Tüm anahtar kelimeler tek otomatta: bio + isim tek geçişte taranır
+        self.automaton = None
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self.automaton = automaton
+    
+    def find(self, bio: str, full_name: str) -> Tuple[Set[str], Set[str]]:
+        """
+        (bio veya isimde geçen anahtar kelimeler, bio'da geçenler) - girdiler katlanmış
+        
+        Anahtar kelime bir kelime başında geçmeli: Türkçe ekler eşleşir ("koçunuz",
+        "danışmanım"), başka kelimelerin içi eşleşmez ("script" → "pt", "admin" → "dm").
+        """
+        if self.automaton is None:
+            in_bio = {
+                keyword for keyword in self.keywords
+                if keyword in bio and _occurs_at_word_start(bio, keyword)
+            }
+            in_name = {
+                keyword for keyword in self.keywords
+                if keyword in full_name and _occurs_at_word_start(full_name, keyword)
+            }
+            return in_bio | in_name, in_bio
+        
+        # Anahtar kelimeler satır sonu içermez, eşleşme bio/isim sınırını aşamaz
+        text = f"{bio}\n{full_name}"
+        bio_end = len(bio)
+        found = set()
+        in_bio = set()
+        for end, keyword in self.automaton.iter(text):
+            before = end - len(keyword)
+            if before >= 0 and text[before].isalnum():
+                continue
+            found.add(keyword)
+            if end < bio_end:
+                in_bio.add(keyword)
+        return found, in_bio
+
+
+@lru_cache(maxsize=1)
+def _identity_matcher() -> _IdentityMatcher:
+    """Gösterge eşleştiricisi - ilk detect_business_identity çağrısında kurulur"""
+    return _IdentityMatcher(_SERVICE_PROVIDER_CATEGORIES, _BIO_SERVICE_INDICATORS)
+
+
+@lru_cache(maxsize=_IDENTITY_CACHE_SIZE)
+def _match_business_identity(bio: str, full_name: str) -> Tuple[Optional[str], float, Tuple[str, ...], int]:
+    """(kategori, güven, bulunan göstergeler, bio servis sinyalleri) - girdiler katlanmış"""
+    detected_category = None
+    confidence = 0.0
+    indicators_found = []
+    
+    matcher = _identity_matcher()
+    found, found_in_bio = matcher.find(bio, full_name)
+    
+    # Eşleşen göstergeler kategori sırasıyla (anahtar kelime -> slot ters indeksi)
+    slots = sorted(matcher.keyword_slots[keyword] for keyword in found if keyword in matcher.keyword_slots)
+    category_hits = {}
+    for slot in slots:
+        category, indicator = matcher.indicators[slot]
+        indicators_found.append(indicator)
+        category_hits[category] = category_hits.get(category, 0) + 1
+        if confidence == 0.0:
+            confidence = 0.8
+        else:
+            confidence = min(confidence + 0.1, 0.95)
+    
+    # En çok göstergesi eşleşen kategori kazanır (eşitlikte tablo sırası)
+    if category_hits:
+        detected_category = max(category_hits, key=category_hits.get)
+    
+    # Bio'da servis göstergeleri var mı?
+    service_signals = sum(1 for keyword in matcher.bio_service_keywords if keyword in found_in_bio)
+    
+    return detected_category, confidence, tuple(indicators_found), service_signals
 
 
 class DomainMasterAgent(BaseAgent):
@@ -29,7 +735,10 @@ class DomainMasterAgent(BaseAgent):
         self.role = "Niche Positioning & Industry Expert"
         self.specialty = "Niche analysis, trend detection, content strategy, hashtag optimization"
         
-        # Initialize all knowledge bases
+        self._bind_knowledge_bases()
+    
+    def _bind_knowledge_bases(self) -> None:
+        """Knowledge bases (read-only module tables shared by every instance)"""
         self._init_niche_taxonomy()
         self._init_niche_benchmarks()
         self._init_trend_lifecycle()
@@ -39,6 +748,20 @@ class DomainMasterAgent(BaseAgent):
         self._init_hashtag_strategy()
         self._init_business_identity_detection()  # YENİ: İşletme kimliği tespiti
     
+    # mappingproxy tables cannot be pickled or deep-copied: copies and pickles
+    # leave the shared knowledge bases out and rebind the module ones on load
+    def __getstate__(self):
+        state, slots = super().__getstate__()
+        state = {k: v for k, v in state.items() if not isinstance(v, MappingProxyType)}
+        return state, slots
+    
+    def __setstate__(self, state):
+        state, slots = state
+        self.__dict__.update(state)
+        for name, value in slots.items():
+            setattr(self, name, value)
+        self._bind_knowledge_bases()
+    
     def _init_business_identity_detection(self):
         """
         İŞLETME KİMLİĞİ TESPİT SİSTEMİ
@@ -46,155 +769,27 @@ class DomainMasterAgent(BaseAgent):
         KRİTİK: Coach, Danışman, Therapist gibi hesapları
         ASLA "Content Creator" olarak sınıflandırma!
         """
-        # Servis sağlayıcı kategorileri
-        self.service_provider_categories = {
-            "coaching_consulting": {
-                "indicators": [
-                    "life coach", "business coach", "kariyer koçu", "koç",
-                    "danışman", "consultant", "mentor", "mentoring",
-                    "danışmanlık", "coaching", "koçluk"
-                ],
-                "success_metrics": ["dm_conversion", "appointment_booking", "lead_generation", "course_sales"],
-                "wrong_metrics": ["likes", "views", "follower_count"],
-                "account_type": "SERVICE_PROVIDER",
-                "benchmark_engagement": 1.5  # Daha düşük engagement normaldir
-            },
-            "spiritual_wellness": {
-                "indicators": [
-                    "spiritüel", "spiritual", "reiki", "healing", "şifa",
-                    "meditasyon", "meditation", "yoga öğretmen", "yoga teacher",
-                    "enerji çalışma", "energy healing", "aura", "çakra"
-                ],
-                "success_metrics": ["session_booking", "workshop_attendance", "community_engagement"],
-                "wrong_metrics": ["viral_content", "trending"],
-                "account_type": "SERVICE_PROVIDER",
-                "benchmark_engagement": 2.0
-            },
-            "education_training": {
-                "indicators": [
-                    "kurs", "course", "eğitim", "training", "workshop",
-                    "bootcamp", "masterclass", "online eğitim", "e-learning",
-                    "sertifika", "certificate"
-                ],
-                "success_metrics": ["course_sales", "student_enrollment", "completion_rate"],
-                "wrong_metrics": ["entertainment_value", "virality"],
-                "account_type": "EDUCATOR",
-                "benchmark_engagement": 1.8
-            },
-            "therapy_psychology": {
-                "indicators": [
-                    "terapist", "therapist", "psikolog", "psychologist",
-                    "psikoterapi", "psychotherapy", "terapi", "therapy",
-                    "danışmanlık", "counseling", "mental sağlık"
-                ],
-                "success_metrics": ["appointment_conversion", "trust_building", "professional_credibility"],
-                "wrong_metrics": ["entertainment", "viral_reach"],
-                "account_type": "HEALTHCARE_PROFESSIONAL",
-                "benchmark_engagement": 1.2  # En düşük - profesyonel mesafe
-            },
-            "fitness_health_services": {
-                "indicators": [
-                    "antrenör", "trainer", "pt", "personal trainer",
-                    "diyetisyen", "dietitian", "nutritionist", "beslenme uzman",
-                    "pilates eğitmen", "yoga eğitmen"
-                ],
-                "success_metrics": ["client_acquisition", "transformation_results", "program_sales"],
-                "wrong_metrics": ["dance_challenges", "entertainment_value"],
-                "account_type": "FITNESS_PROFESSIONAL",
-                "benchmark_engagement": 2.5
-            },
-            "professional_services": {
-                "indicators": [
-                    "avukat", "lawyer", "hukuk", "legal",
-                    "muhasebeci", "accountant", "mali müşavir",
-                    "mimar", "architect", "iç mimar", "interior designer",
-                    "emlak", "real estate", "danışman"
-                ],
-                "success_metrics": ["lead_generation", "consultation_booking", "professional_authority"],
-                "wrong_metrics": ["entertainment", "virality", "follower_growth"],
-                "account_type": "PROFESSIONAL_SERVICE",
-                "benchmark_engagement": 1.0  # En düşük - profesyonel sektör
-            },
-            "freelancer_agency": {
-                "indicators": [
-                    "freelancer", "serbest", "ajans", "agency",
-                    "tasarımcı", "designer", "developer", "geliştirici",
-                    "sosyal medya yönetimi", "content creator for brands"
-                ],
-                "success_metrics": ["portfolio_views", "client_inquiries", "project_conversion"],
-                "wrong_metrics": ["personal_fame", "viral_content"],
-                "account_type": "B2B_SERVICE",
-                "benchmark_engagement": 1.5
-            }
-        }
-        
-        # Content Creator vs Service Provider ayrımı
-        self.account_type_definitions = {
-            "CONTENT_CREATOR": {
-                "description": "İçerik üretimi ana gelir kaynağı",
-                "success_metrics": ["views", "engagement", "follower_growth", "sponsorship_deals", "ad_revenue"],
-                "benchmark_engagement_min": 2.5,
-                "goal": "Maksimum reach ve engagement"
-            },
-            "SERVICE_PROVIDER": {
-                "description": "Hizmet satışı ana gelir kaynağı",
-                "success_metrics": ["dm_conversion", "appointment_booking", "lead_quality", "client_retention"],
-                "benchmark_engagement_min": 1.0,  # Düşük engagement normal!
-                "goal": "Güven inşa etme ve dönüşüm"
-            },
-            "HYBRID": {
-                "description": "Hem içerik hem hizmet",
-                "success_metrics": ["engagement", "conversion", "authority_building"],
-                "benchmark_engagement_min": 1.5,
-                "goal": "Denge: reach + conversion"
-            }
-        }
-        
-        # Bio analiz kelimeleri
-        self.bio_service_indicators = [
-            "randevu", "appointment", "dm", "link", "bio'da",
-            "in bio", "linktr.ee", "calendly", "hizmet", "service",
-            "danışmanlık", "consulting", "seansı", "session",
-            "ücretsiz görüşme", "free call", "discovery call"
-        ]
-        
-        # CTA analiz kelimeleri (satış odaklı)
-        self.sales_cta_indicators = [
-            "şimdi başla", "hemen ulaş", "dm at", "link'e tıkla",
-            "randevu al", "ücretsiz dene", "yerini ayırt",
-            "katıl", "başvur", "kayıt ol", "satın al"
-        ]
-
+        self.service_provider_categories = _SERVICE_PROVIDER_CATEGORIES
+        self.account_type_definitions = _ACCOUNT_TYPE_DEFINITIONS
+        self.bio_service_indicators = _BIO_SERVICE_INDICATORS
+        self.sales_cta_indicators = _SALES_CTA_INDICATORS
+    
+    def clear_identity_cache(self) -> None:
+        """detect_business_identity eşleşme önbelleğini temizle (tüm ajanlarca paylaşılır)"""
+        _match_business_identity.cache_clear()
+    
     def detect_business_identity(self, account_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Hesabın gerçek kimliğini tespit et
         
         ASLA koç/danışman/terapist hesaplarını "Content Creator" olarak sınıflandırma!
         """
-        bio = account_data.get("bio", "").lower()
-        username = account_data.get("username", "").lower()
-        full_name = account_data.get("fullName", "").lower()
+        bio = _fold_identity_text(account_data.get("bio", ""))
+        full_name = _fold_identity_text(account_data.get("fullName", ""))
         
-        detected_category = None
-        confidence = 0.0
-        indicators_found = []
-        
-        # Tüm kategorileri kontrol et
-        for category, info in self.service_provider_categories.items():
-            for indicator in info["indicators"]:
-                if indicator.lower() in bio or indicator.lower() in full_name:
-                    indicators_found.append(indicator)
-                    if detected_category is None:
-                        detected_category = category
-                        confidence = 0.8
-                    else:
-                        confidence = min(confidence + 0.1, 0.95)
-        
-        # Bio'da servis göstergeleri var mı?
-        service_signals = 0
-        for indicator in self.bio_service_indicators:
-            if indicator.lower() in bio:
-                service_signals += 1
+        detected_category, confidence, indicators_found, service_signals = _match_business_identity(
+            bio, full_name
+        )
         
         # Sonuç
         if detected_category:
@@ -204,10 +799,10 @@ class DomainMasterAgent(BaseAgent):
                 "account_type": category_info["account_type"],
                 "category": detected_category,
                 "confidence": confidence,
-                "indicators_found": indicators_found,
+                "indicators_found": list(indicators_found),
                 "service_signals_in_bio": service_signals,
-                "correct_success_metrics": category_info["success_metrics"],
-                "wrong_metrics_to_avoid": category_info["wrong_metrics"],
+                "correct_success_metrics": list(category_info["success_metrics"]),
+                "wrong_metrics_to_avoid": list(category_info["wrong_metrics"]),
                 "benchmark_engagement": category_info["benchmark_engagement"],
                 "analysis_note": f"⚠️ Bu hesap bir {category_info['account_type']}. Content Creator metrikleriyle değerlendirme YANLIŞ olur!"
             }
@@ -219,7 +814,7 @@ class DomainMasterAgent(BaseAgent):
                 "confidence": 0.7,
                 "indicators_found": [],
                 "service_signals_in_bio": service_signals,
-                "correct_success_metrics": self.account_type_definitions["CONTENT_CREATOR"]["success_metrics"],
+                "correct_success_metrics": list(self.account_type_definitions["CONTENT_CREATOR"]["success_metrics"]),
                 "wrong_metrics_to_avoid": [],
                 "benchmark_engagement": 2.5,
                 "analysis_note": "Bu hesap bir Content Creator olarak değerlendiriliyor."
@@ -227,412 +822,44 @@ class DomainMasterAgent(BaseAgent):
     
     def _init_niche_taxonomy(self):
         """Ana niche kategorileri ve alt kategorileri"""
-        self.niche_taxonomy = {
-            "lifestyle": {
-                "sub_niches": ["fashion", "beauty", "home_decor", "travel", "food_cooking", "parenting"],
-                "typical_audience": "broad_consumer",
-                "monetization_potential": "high"
-            },
-            "business_professional": {
-                "sub_niches": ["entrepreneurship", "marketing", "finance_investing", "career_leadership", "real_estate", "ecommerce"],
-                "typical_audience": "professionals",
-                "monetization_potential": "very_high"
-            },
-            "health_wellness": {
-                "sub_niches": ["fitness", "nutrition", "mental_health", "yoga_meditation", "medical_healthcare", "alternative_wellness"],
-                "typical_audience": "health_conscious",
-                "monetization_potential": "high"
-            },
-            "education_knowledge": {
-                "sub_niches": ["personal_development", "language_learning", "academic_study", "skills_training", "science_tech", "history_culture"],
-                "typical_audience": "learners",
-                "monetization_potential": "medium_high"
-            },
-            "entertainment": {
-                "sub_niches": ["comedy_humor", "music", "gaming", "movies_tv", "art_design", "photography"],
-                "typical_audience": "general_entertainment",
-                "monetization_potential": "medium"
-            },
-            "technology": {
-                "sub_niches": ["tech_reviews", "software_apps", "ai_innovation", "crypto_web3", "gadgets", "programming"],
-                "typical_audience": "tech_enthusiasts",
-                "monetization_potential": "high"
-            },
-            "special_interest": {
-                "sub_niches": ["pets_animals", "sports", "automotive", "diy_crafts", "gardening", "collectibles"],
-                "typical_audience": "hobbyists",
-                "monetization_potential": "medium"
-            }
-        }
-        
-        # Niche derinlik seviyeleri
-        self.niche_depth_levels = {
-            "level_1_broad": {"description": "Geniş kategori (örn: Fitness)", "competition": "very_high", "differentiation": "low"},
-            "level_2_specific": {"description": "Belirli segment (örn: Women's Fitness)", "competition": "high", "differentiation": "medium"},
-            "level_3_niche": {"description": "Niş alan (örn: Postpartum Fitness)", "competition": "medium", "differentiation": "high"},
-            "level_4_micro": {"description": "Mikro niş (örn: Postpartum Diastasis Recti Recovery)", "competition": "low", "differentiation": "very_high"}
-        }
-        
-        # Niche detection confidence levels
-        self.confidence_levels = {
-            "high": {"range": (0.7, 1.0), "description": "Clear niche positioning"},
-            "medium": {"range": (0.5, 0.7), "description": "Defined but broad"},
-            "low": {"range": (0.3, 0.5), "description": "Multiple niches, unclear focus"},
-            "very_low": {"range": (0.0, 0.3), "description": "Unclear positioning"}
-        }
+        self.niche_taxonomy = _NICHE_TAXONOMY
+        self.niche_depth_levels = _NICHE_DEPTH_LEVELS
+        self.confidence_levels = _CONFIDENCE_LEVELS
     
     def _init_niche_benchmarks(self):
         """Niche-specific benchmark veritabanı"""
-        self.niche_benchmarks = {
-            "fashion": {
-                "avg_engagement_rate": 2.1,
-                "avg_growth_rate": 4.5,
-                "optimal_posts_per_week": (5, 7),
-                "reels_percentage": 45,
-                "avg_save_rate": 3.2
-            },
-            "beauty": {
-                "avg_engagement_rate": 2.8,
-                "avg_growth_rate": 5.2,
-                "optimal_posts_per_week": (5, 6),
-                "reels_percentage": 50,
-                "avg_save_rate": 4.5
-            },
-            "fitness": {
-                "avg_engagement_rate": 3.5,
-                "avg_growth_rate": 6.0,
-                "optimal_posts_per_week": (6, 7),
-                "reels_percentage": 55,
-                "avg_save_rate": 5.8
-            },
-            "food": {
-                "avg_engagement_rate": 3.2,
-                "avg_growth_rate": 5.5,
-                "optimal_posts_per_week": (5, 7),
-                "reels_percentage": 40,
-                "avg_save_rate": 6.2
-            },
-            "travel": {
-                "avg_engagement_rate": 4.0,
-                "avg_growth_rate": 4.0,
-                "optimal_posts_per_week": (3, 5),
-                "reels_percentage": 50,
-                "avg_save_rate": 7.5
-            },
-            "business_b2b": {
-                "avg_engagement_rate": 1.5,
-                "avg_growth_rate": 3.5,
-                "optimal_posts_per_week": (4, 5),
-                "reels_percentage": 30,
-                "avg_save_rate": 4.0
-            },
-            "personal_development": {
-                "avg_engagement_rate": 2.5,
-                "avg_growth_rate": 5.0,
-                "optimal_posts_per_week": (5, 6),
-                "reels_percentage": 35,
-                "avg_save_rate": 5.5
-            },
-            "parenting": {
-                "avg_engagement_rate": 3.8,
-                "avg_growth_rate": 5.5,
-                "optimal_posts_per_week": (4, 6),
-                "reels_percentage": 45,
-                "avg_save_rate": 4.8
-            },
-            "tech": {
-                "avg_engagement_rate": 1.8,
-                "avg_growth_rate": 4.0,
-                "optimal_posts_per_week": (4, 5),
-                "reels_percentage": 40,
-                "avg_save_rate": 3.5
-            },
-            "entertainment": {
-                "avg_engagement_rate": 4.5,
-                "avg_growth_rate": 7.0,
-                "optimal_posts_per_week": (6, 7),
-                "reels_percentage": 60,
-                "avg_save_rate": 2.5
-            },
-            "education": {
-                "avg_engagement_rate": 2.2,
-                "avg_growth_rate": 4.5,
-                "optimal_posts_per_week": (4, 5),
-                "reels_percentage": 35,
-                "avg_save_rate": 6.0
-            },
-            "art_design": {
-                "avg_engagement_rate": 3.0,
-                "avg_growth_rate": 4.0,
-                "optimal_posts_per_week": (4, 6),
-                "reels_percentage": 35,
-                "avg_save_rate": 5.0
-            }
-        }
+        self.niche_benchmarks = _NICHE_BENCHMARKS
     
     def _init_trend_lifecycle(self):
         """Trend yaşam döngüsü ve karakteristikleri"""
-        self.trend_lifecycle = {
-            "emerging": {
-                "adoption_range": (0, 10),
-                "characteristics": {
-                    "early_mover_advantage": True,
-                    "risk_level": "high",
-                    "reward_potential": "high",
-                    "opportunity": "innovation"
-                },
-                "strategy": "Erken giriş, risk al, farklılaş"
-            },
-            "growing": {
-                "adoption_range": (10, 40),
-                "characteristics": {
-                    "early_mover_advantage": True,
-                    "risk_level": "medium",
-                    "reward_potential": "high",
-                    "opportunity": "optimal_entry"
-                },
-                "strategy": "En iyi risk/reward oranı, hızlı hareket et"
-            },
-            "mature": {
-                "adoption_range": (40, 70),
-                "characteristics": {
-                    "early_mover_advantage": False,
-                    "risk_level": "low",
-                    "reward_potential": "medium",
-                    "opportunity": "safe_execution"
-                },
-                "strategy": "Farklılaşma kritik, kalite odaklı"
-            },
-            "declining": {
-                "adoption_range": (70, 100),
-                "characteristics": {
-                    "early_mover_advantage": False,
-                    "risk_level": "medium",
-                    "reward_potential": "low",
-                    "opportunity": "minimal"
-                },
-                "strategy": "Kaçın veya çok farklı yaklaş"
-            }
-        }
-        
-        # Content format trends 2024-2025
-        self.format_trends = {
-            "long_form_reels": {"status": "growing", "description": "90+ saniye Reels"},
-            "photo_dumps_carousels": {"status": "stable_growing", "description": "Çoklu fotoğraf paylaşımları"},
-            "behind_the_scenes": {"status": "growing", "description": "Sahne arkası içerikler"},
-            "raw_unfiltered": {"status": "growing", "description": "Filtresiz, doğal içerikler"},
-            "ai_generated": {"status": "emerging", "description": "AI destekli içerikler"},
-            "interactive_content": {"status": "growing", "description": "Etkileşimli içerikler"},
-            "series_episodic": {"status": "growing", "description": "Seri/bölümlü içerikler"}
-        }
-        
-        # Cross-niche topic trends
-        self.topic_trends = {
-            "sustainability_eco": {"status": "mature_growing", "relevance": "high"},
-            "mental_health": {"status": "mature", "relevance": "high"},
-            "ai_automation": {"status": "growing", "relevance": "very_high"},
-            "work_life_balance": {"status": "growing", "relevance": "high"},
-            "financial_literacy": {"status": "growing", "relevance": "high"},
-            "authenticity_transparency": {"status": "growing", "relevance": "very_high"},
-            "community_building": {"status": "growing", "relevance": "high"}
-        }
-        
-        # Engagement trends
-        self.engagement_trends = {
-            "dm_engagement": {"status": "growing", "priority": "high"},
-            "broadcast_channels": {"status": "growing", "priority": "high"},
-            "close_friends": {"status": "stable", "priority": "medium"},
-            "collaborative_posts": {"status": "growing", "priority": "high"},
-            "ugc_content": {"status": "mature", "priority": "medium"},
-            "live_shopping": {"status": "emerging", "priority": "region_dependent"}
-        }
+        self.trend_lifecycle = _TREND_LIFECYCLE
+        self.format_trends = _FORMAT_TRENDS
+        self.topic_trends = _TOPIC_TRENDS
+        self.engagement_trends = _ENGAGEMENT_TRENDS
     
     def _init_seasonal_patterns(self):
         """Niche bazlı sezonsal pattern matrisi"""
-        self.seasonal_patterns = {
-            "fashion": ["Fashion weeks", "Seasons", "Holidays"],
-            "fitness": ["January (NY resolution)", "May-June (summer body)", "September (back to routine)"],
-            "food": ["Holidays", "Seasons", "Cultural events"],
-            "travel": ["Summer", "Holidays", "School breaks"],
-            "beauty": ["Award seasons", "Holidays", "Product launches"],
-            "business": ["Q1 planning", "Q4 budgets", "Tax season"],
-            "education": ["Back to school", "Exam periods", "Summer programs"],
-            "parenting": ["School year", "Holidays", "Summer"],
-            "tech": ["Product launches", "CES", "WWDC", "Tech conferences"],
-            "finance": ["Tax season", "Market events", "Year-end"]
-        }
-        
-        # Weekly content patterns
-        self.weekly_patterns = {
-            "monday": {"theme": "motivation_planning", "content_type": "inspirational"},
-            "tuesday": {"theme": "educational_value", "content_type": "tutorial"},
-            "wednesday": {"theme": "educational_value", "content_type": "tips"},
-            "thursday": {"theme": "educational_value", "content_type": "insights"},
-            "friday": {"theme": "lighter_fun", "content_type": "entertaining"},
-            "saturday": {"theme": "lifestyle_personal", "content_type": "behind_scenes"},
-            "sunday": {"theme": "reflection_prep", "content_type": "community"}
-        }
-        
-        # Monthly patterns
-        self.monthly_patterns = {
-            "week_1": {"theme": "fresh_start_goals", "focus": "New initiatives"},
-            "week_2": {"theme": "deep_content", "focus": "Tutorials, detailed guides"},
-            "week_3": {"theme": "deep_content", "focus": "Continued value delivery"},
-            "week_4": {"theme": "recap_engagement", "focus": "Results, testimonials, community"}
-        }
+        self.seasonal_patterns = _SEASONAL_PATTERNS
+        self.weekly_patterns = _WEEKLY_PATTERNS
+        self.monthly_patterns = _MONTHLY_PATTERNS
     
     def _init_content_pillars(self):
         """Content pillar framework ve dağılım sistemleri"""
-        self.pillar_types = {
-            "educational": {
-                "description": "How-to tutorials, tips, industry insights, myth busting",
-                "best_for": ["authority", "saves", "long_term_value"],
-                "optimal_percentage": (40, 50),
-                "engagement_type": "value_driven"
-            },
-            "inspirational": {
-                "description": "Success stories, transformations, quotes, journey content",
-                "best_for": ["shares", "emotional_connection", "motivation"],
-                "optimal_percentage": (25, 30),
-                "engagement_type": "emotion_driven"
-            },
-            "entertaining": {
-                "description": "Humor/memes, trends, relatable content, day-in-life",
-                "best_for": ["reach", "virality", "new_audience"],
-                "optimal_percentage": (15, 20),
-                "engagement_type": "share_driven"
-            },
-            "promotional": {
-                "description": "Product showcase, testimonials, offers, case studies",
-                "best_for": ["sales", "leads", "conversions"],
-                "optimal_percentage": (5, 10),
-                "engagement_type": "conversion_driven"
-            },
-            "community": {
-                "description": "Q&A, user spotlights, polls, personal stories",
-                "best_for": ["loyalty", "engagement", "retention"],
-                "optimal_percentage": (10, 15),
-                "engagement_type": "connection_driven"
-            }
-        }
-        
-        # Topic relevance scoring
-        self.topic_relevance_scores = {
-            "core_niche": 100,
-            "adjacent_topic": 70,
-            "tangential_topic": 40,
-            "off_topic": 10
-        }
-        
-        # Competitive differentiation levels
-        self.differentiation_levels = {
-            "unique_angle": {"score": 100, "description": "Benzersiz perspektif"},
-            "better_execution": {"score": 70, "description": "Daha iyi uygulama"},
-            "similar_to_competitors": {"score": 40, "description": "Rakiplere benzer"},
-            "copying_competitors": {"score": 20, "description": "Kopya içerik"}
-        }
-        
-        # Content gap types
-        self.gap_types = {
-            "topic_gaps": ["Competitor topics not covered", "Audience questions unanswered", "Trending topics missed", "Seasonal content missing"],
-            "format_gaps": ["Underutilized formats", "Platform feature gaps", "Content length variety", "Interactive content missing"],
-            "depth_gaps": ["Surface-level only", "Missing advanced content", "No beginner content", "Missing case studies"],
-            "frequency_gaps": ["Inconsistent posting", "Missing content types", "Seasonal gaps", "Time-of-day gaps"]
-        }
+        self.pillar_types = _PILLAR_TYPES
+        self.topic_relevance_scores = _TOPIC_RELEVANCE_SCORES
+        self.differentiation_levels = _DIFFERENTIATION_LEVELS
+        self.gap_types = _GAP_TYPES
     
     def _init_hashtag_categories(self):
         """Hashtag tipleri ve kategori sistemi"""
-        self.hashtag_types = {
-            "branded": {
-                "description": "Hesaba özel, kampanya veya community hashtag'leri",
-                "example": "#NikeRunning",
-                "purpose": "Brand identity, UGC collection"
-            },
-            "niche": {
-                "description": "Sektöre özel, orta rekabet hashtag'leri",
-                "example": "#VeganRecipes",
-                "purpose": "Targeted discovery"
-            },
-            "community": {
-                "description": "Grup kimliği, engagement odaklı hashtag'ler",
-                "example": "#FitFam",
-                "purpose": "Community building"
-            },
-            "location": {
-                "description": "Coğrafi hedefleme hashtag'leri",
-                "example": "#IstanbulFood",
-                "purpose": "Local discovery"
-            },
-            "trending": {
-                "description": "Güncel olaylar, viral konular",
-                "example": "#Oscars2025",
-                "purpose": "Timely reach"
-            }
-        }
-        
-        # Size-based categories
-        self.hashtag_size_categories = {
-            "mega": {
-                "post_count": ">10M",
-                "discovery_potential": "low",
-                "competition": "very_high",
-                "use_case": "Brand awareness attempt"
-            },
-            "large": {
-                "post_count": "1M-10M",
-                "discovery_potential": "medium",
-                "competition": "high",
-                "use_case": "Broad discovery"
-            },
-            "medium": {
-                "post_count": "100K-1M",
-                "discovery_potential": "high",
-                "competition": "medium",
-                "use_case": "Sweet spot - optimal discovery"
-            },
-            "small": {
-                "post_count": "10K-100K",
-                "discovery_potential": "high",
-                "competition": "low",
-                "use_case": "Niche targeting"
-            },
-            "micro": {
-                "post_count": "<10K",
-                "discovery_potential": "medium",
-                "competition": "very_low",
-                "use_case": "Ultra-targeted, branded"
-            }
-        }
+        self.hashtag_types = _HASHTAG_TYPES
+        self.hashtag_size_categories = _HASHTAG_SIZE_CATEGORIES
     
     def _init_hashtag_strategy(self):
         """Optimal hashtag stratejisi ve dağılım"""
-        # Optimal distribution for 30 hashtags
-        self.optimal_hashtag_distribution = {
-            "mega": {"count": (2, 3), "percentage": 8},
-            "large": {"count": (5, 7), "percentage": 20},
-            "medium": {"count": (10, 12), "percentage": 37},
-            "small": {"count": (8, 10), "percentage": 30},
-            "micro": {"count": (2, 3), "percentage": 8}
-        }
-        
-        # Hashtag rotation strategy
-        self.rotation_strategy = {
-            "set_a": "Posts 1, 4, 7...",
-            "set_b": "Posts 2, 5, 8...",
-            "set_c": "Posts 3, 6, 9...",
-            "purpose": "Shadowban prevention, performance testing"
-        }
-        
-        # Fitness niche example hashtag bank
-        self.example_hashtag_banks = {
-            "fitness": {
-                "mega": ["#fitness", "#workout", "#gym", "#fitnessmotivation", "#fit"],
-                "large": ["#fitlife", "#gymlife", "#fitnessjourney", "#workoutmotivation", "#fitfam"],
-                "medium": ["#homeworkouts", "#fitnessgirl", "#gymmotivation", "#fitnesslifestyle"],
-                "small": ["#turkishfitness", "#evdeegzersiz", "#fitnessturkiye"],
-                "micro": ["branded_hashtags", "local_gym_tags", "specific_program_tags"]
-            }
-        }
+        self.optimal_hashtag_distribution = _OPTIMAL_HASHTAG_DISTRIBUTION
+        self.rotation_strategy = _ROTATION_STRATEGY
+        self.example_hashtag_banks = _EXAMPLE_HASHTAG_BANKS
     
     # =========================
     # NICHE DETECTION METHODS
@@ -771,11 +998,11 @@ class DomainMasterAgent(BaseAgent):
             if min_adoption <= adoption_percentage < max_adoption:
                 return {
                     "stage": stage,
-                    "characteristics": info["characteristics"],
+                    "characteristics": dict(info["characteristics"]),
                     "strategy": info["strategy"]
                 }
         
-        return {"stage": "declining", "characteristics": self.trend_lifecycle["declining"]["characteristics"]}
+        return {"stage": "declining", "characteristics": dict(self.trend_lifecycle["declining"]["characteristics"])}
     
     # =========================
     # CONTENT PILLAR METHODS
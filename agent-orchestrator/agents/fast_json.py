@@ -0,0 +1,122 @@
+# =============================================================================
+# Fast JSON - orjson with stdlib fallback
+# =============================================================================
+"""
+Thin JSON adapter for prompt payloads and LLM responses.
+
+Uses orjson when it is installed and falls back to the stdlib json module
+otherwise. Both paths emit the same UTF-8 text without ASCII escaping:
+read-only mappings (MappingProxyType) become objects, sets and tuples become
+arrays, datetimes become ISO 8601 strings, enums their value, UUIDs and
+dataclasses as orjson writes them, and NaN/Infinity become null. Other types
+raise TypeError. (Floats below 1e-4 may differ in exponent notation,
+e.g. 1e-05 vs 0.00001, but parse to the same value.)
+"""
+
+import dataclasses
+import json
+import math
+from collections.abc import Mapping
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Union
+from uuid import UUID
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # orjson is optional
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _default(obj: Any) -> Any:
+    """Convert values neither serializer handles natively (as orjson would write them)"""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, UUID):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _finite(obj: Any) -> Any:
+    """Copy of obj with NaN/Infinity floats replaced by None (orjson writes them as null)"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, Mapping):
+        return {k: _finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return [_finite(v) for v in obj]
+    return obj
+
+
+if ORJSON_AVAILABLE:
+    _OPT_COMPACT = orjson.OPT_NON_STR_KEYS
+    _OPT_INDENT = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+
+    def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON bytes"""
+        try:
+            return orjson.dumps(obj, default=_default, option=_OPT_INDENT if indent else _OPT_COMPACT)
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles them
+            return _json_dumps(obj, indent).encode("utf-8")
+
+    def loads(data: Union[str, bytes, bytearray]) -> Any:
+        """Parse JSON text or bytes (NaN/Infinity literals accepted, as json.loads does)"""
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity; LLM responses do contain them.
+            # Malformed input fails here again with json.JSONDecodeError.
+            return json.loads(data)
+else:
+    def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON bytes"""
+        return _json_dumps(obj, indent).encode("utf-8")
+
+    def loads(data: Union[str, bytes, bytearray]) -> Any:
+        """Parse JSON text or bytes"""
+        return json.loads(data)
+
+
+def _json_dumps(obj: Any, indent: bool) -> str:
+    options = {
+        "ensure_ascii": False,
+        "allow_nan": False,
+        "indent": 2 if indent else None,
+        "separators": None if indent else (",", ":"),
+    }
+    try:
+        return json.dumps(obj, default=_default, **options)
+    except ValueError as exc:
+        if "Out of range float" not in str(exc):
+            raise
+        # NaN/Infinity somewhere in the tree: write them as null, like orjson
+        return json.dumps(_finite(obj), default=lambda o: _finite(_default(o)), **options)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to a JSON string (compact unless indent=True, which uses 2 spaces)"""
+    return dumps_bytes(obj, indent).decode("utf-8")
+
+
+# Errors raised by loads() on malformed input (json.JSONDecodeError subclasses ValueError)
+JSONDecodeError = ValueError
+
+
+__all__ = [
+    "ORJSON_AVAILABLE",
+    "JSONDecodeError",
+    "dumps",
+    "dumps_bytes",
+    "loads",
+]
@@ -0,0 +1,31 @@
+# =============================================================================
+# Frozen Config - read-only static tables shared by agent instances
+# =============================================================================
+"""
+Deep read-only copies of the agents' static configuration tables.
+
+Module-level config dicts are frozen once at import and handed out to every
+agent instance without defensive copies.
+"""
+
+import sys
+from types import MappingProxyType
+from typing import Any
+
+
+def freeze(obj: Any) -> Any:
+    """
+    Deep read-only copy of a config tree: dicts become MappingProxyType (with
+    sys.intern'ed keys for identity-fast lookups) and lists become tuples.
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({
+            sys.intern(k) if isinstance(k, str) else k: freeze(v)
+            for k, v in obj.items()
+        })
+    if isinstance(obj, list):
+        return tuple(freeze(v) for v in obj)
+    return obj
+
+
+__all__ = ["freeze"]
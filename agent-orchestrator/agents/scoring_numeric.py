@@ -0,0 +1,172 @@
+# =============================================================================
+# Scoring Numeric Kernels - Content Strategist
+# =============================================================================
+"""
+Numeric kernels behind the content strategist scores:
+
+1. engagement_quality - Per-post weighted engagement (save×3.5 + share×3 + comment×2.5 + like×1)
+2. posting_gaps - Mean / max / std of the gaps between posts, in days
+3. growth_projections - Monthly compound follower projections for many accounts
+
+Kernels are compiled with numba's @njit when numba is installed and fall
+back to plain NumPy otherwise; both paths return the same values.
+Compilation happens on first use, or up front via warm_up() at startup.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional
+    NUMBA_AVAILABLE = False
+
+SECONDS_PER_DAY = 86400.0
+
+# Engagement Quality weights: save, share, comment, like
+ENGAGEMENT_WEIGHTS = np.array([3.5, 3.0, 2.5, 1.0], dtype=np.float64)
+
+
+# =============================================================================
+# NUMPY IMPLEMENTATIONS (always available)
+# =============================================================================
+
+def _engagement_quality_np(
+    likes: np.ndarray, comments: np.ndarray, saves: np.ndarray, shares: np.ndarray
+) -> np.ndarray:
+    return (
+        saves * ENGAGEMENT_WEIGHTS[0]
+        + shares * ENGAGEMENT_WEIGHTS[1]
+        + comments * ENGAGEMENT_WEIGHTS[2]
+        + likes * ENGAGEMENT_WEIGHTS[3]
+    )
+
+
+def _posting_gaps_np(timestamps: np.ndarray) -> Tuple[float, float, float]:
+    if timestamps.shape[0] < 2:
+        return 0.0, 0.0, 0.0
+    gaps = np.diff(np.sort(timestamps)) / SECONDS_PER_DAY
+    return float(gaps.mean()), float(gaps.max()), float(gaps.std())
+
+
+def _growth_projections_py(followers: np.ndarray, rates: np.ndarray, months: int) -> np.ndarray:
+    # Scalar libm pow on purpose: np.power's SIMD loops can be 1 ULP off, and
+    # the projections are truncated to whole followers downstream
+    out = np.empty((followers.shape[0], months), dtype=np.float64)
+    for i in range(followers.shape[0]):
+        base = 1.0 + rates[i]
+        for m in range(months):
+            out[i, m] = followers[i] * base ** float(m + 1)
+    return out
+
+
+# =============================================================================
+# NUMBA KERNELS (compiled when numba is installed)
+# =============================================================================
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True)
+    def _engagement_quality_nb(likes, comments, saves, shares):
+        out = np.empty(likes.shape[0], dtype=np.float64)
+        for i in range(likes.shape[0]):
+            out[i] = saves[i] * 3.5 + shares[i] * 3.0 + comments[i] * 2.5 + likes[i] * 1.0
+        return out
+
+    @njit(cache=True)
+    def _posting_gaps_nb(timestamps):
+        n = timestamps.shape[0]
+        if n < 2:
+            return 0.0, 0.0, 0.0
+        ordered = np.sort(timestamps)
+        total = 0.0
+        largest = 0.0
+        for i in range(1, n):
+            gap = (ordered[i] - ordered[i - 1]) / 86400.0
+            total += gap
+            if gap > largest:
+                largest = gap
+        mean = total / (n - 1)
+        var = 0.0
+        for i in range(1, n):
+            d = (ordered[i] - ordered[i - 1]) / 86400.0 - mean
+            var += d * d
+        return mean, largest, np.sqrt(var / (n - 1))
+
+    @njit(cache=True, parallel=True)
+    def _growth_projections_nb(followers, rates, months):
+        out = np.empty((followers.shape[0], months), dtype=np.float64)
+        for i in prange(followers.shape[0]):
+            base = 1.0 + rates[i]
+            for m in range(months):
+                out[i, m] = followers[i] * base ** float(m + 1)
+        return out
+
+    engagement_quality_kernel = _engagement_quality_nb
+    posting_gaps_kernel = _posting_gaps_nb
+    growth_projections_kernel = _growth_projections_nb
+else:
+    engagement_quality_kernel = _engagement_quality_np
+    posting_gaps_kernel = _posting_gaps_np
+    growth_projections_kernel = _growth_projections_py
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def engagement_quality(likes, comments, saves, shares) -> np.ndarray:
+    """Per-post weighted engagement: save×3.5 + share×3 + comment×2.5 + like×1"""
+    return engagement_quality_kernel(
+        np.asarray(likes, dtype=np.float64),
+        np.asarray(comments, dtype=np.float64),
+        np.asarray(saves, dtype=np.float64),
+        np.asarray(shares, dtype=np.float64),
+    )
+
+
+def posting_gaps(timestamps) -> Tuple[float, float, float]:
+    """(mean, max, std) gap in days between posts, from unix-second timestamps"""
+    mean, largest, std = posting_gaps_kernel(np.asarray(timestamps, dtype=np.int64))
+    return float(mean), float(largest), float(std)
+
+
+def growth_projections(current_followers, adjusted_rates, months: int) -> np.ndarray:
+    """
+    (accounts, months) array of followers × (1 + rate)^t for t = 1..months.
+    
+    Rates are monthly fractions (0.05 = 5%); row i uses current_followers[i]
+    and adjusted_rates[i].
+    """
+    followers = np.asarray(current_followers, dtype=np.float64)
+    rates = np.asarray(adjusted_rates, dtype=np.float64)
+    if followers.shape != rates.shape or followers.ndim != 1:
+        raise ValueError("current_followers and adjusted_rates must be 1-D arrays of the same length")
+    return growth_projections_kernel(followers, rates, max(int(months), 0))
+
+
+def warm_up() -> None:
+    """
+    Compile the numba kernels ahead of the first request (no-op without numba).
+    
+    Call once from application startup; importing this module compiles nothing.
+    With cache=True later processes load the compiled kernels from disk.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    one = np.ones(1, dtype=np.float64)
+    engagement_quality_kernel(one, one, one, one)
+    posting_gaps_kernel(np.zeros(1, dtype=np.int64))
+    growth_projections_kernel(one, one, 1)
+
+
+__all__ = [
+    "NUMBA_AVAILABLE",
+    "ENGAGEMENT_WEIGHTS",
+    "engagement_quality",
+    "posting_gaps",
+    "growth_projections",
+    "warm_up",
+]
@@ -31,6 +31,8 @@ from contextlib import asynccontextmanager
 # Import both old orchestrator (for backward compatibility) and new pipeline
 from agents.orchestrator import AgentOrchestrator
 from agents.new_pipeline import NewPipelineOrchestrator, create_pipeline_orchestrator
+from agents.deepseek_fallback import close_deepseek_fallback
+from agents.scoring_numeric import warm_up as warm_up_scoring_kernels
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -60,12 +62,18 @@ async def lifespan(app: FastAPI):
     # Initialize NEW PIPELINE
     pipeline = create_pipeline_orchestrator(redis_client)
     
+    # Compile the numba scoring kernels off the event loop (no-op without numba)
+    await asyncio.to_thread(warm_up_scoring_kernels)
+    
     logger.info("Agent Orchestrator with NEW PIPELINE started successfully")
     
     yield
     
     # Shutdown
     logger.info("Shutting down Agent Orchestrator...")
+    if pipeline:
+        await pipeline.deepseek_analyst.close()
+    await close_deepseek_fallback()
     if redis_client:
         await redis_client.close()
 
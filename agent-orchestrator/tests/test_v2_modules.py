@@ -8,6 +8,11 @@ Unit tests for new v2.0 modules:
 3. llm_manager.py - Multi-LLM management
 4. output_serializer.py - Output normalization
 5. structured_logger.py - Logging and error handling
+6. scoring_numeric.py - Numeric scoring kernels
+7. domain_master.py - Business identity detection
+8. content_strategist.py - Content strategy scoring
+9. fast_json.py - JSON adapter
+10. deepseek_final_analyst.py - Streamed final verdict
 
 Run tests:
     python -m pytest tests/ -v
@@ -278,6 +283,17 @@ class TestCoTPrompting:
         assert 0 <= viral_score <= 100
         assert isinstance(viral_score, float)
     
+    def test_calculate_viral_potential_harmonic(self):
+        """Test harmonic viral score is dragged down by a single weak factor"""
+        from agents.cot_prompting import calculate_viral_potential
+        
+        strong = {"engagementRate": 6.0, "saveRate": 0.03, "shareRate": 0.02, "commentLikeRatio": 0.05, "growthRate": 10.0}
+        
+        assert calculate_viral_potential(strong, scheme="harmonic")["viralScore"] == 100.0
+        assert calculate_viral_potential({**strong, "saveRate": 0}, scheme="harmonic")["viralScore"] == 0.0
+        with pytest.raises(ValueError):
+            calculate_viral_potential(strong, scheme="geometric")
+    
     def test_predict_growth_trajectory(self, sample_account_data):
         """Test growth trajectory prediction"""
         from agents.cot_prompting import predict_growth_trajectory
@@ -292,6 +308,53 @@ class TestCoTPrompting:
         assert "projected_12_months" in trajectory
         assert trajectory["projected_6_months"] > sample_account_data["followers"]
 
+    def test_predict_growth_trajectories_matches_per_account(self):
+        """Test batch growth projections equal predict_growth_trajectory per account"""
+        from agents.cot_prompting import predict_growth_trajectory, predict_growth_trajectories
+
+        followers = [1200, 48000, 250000, 3100000, 999]
+        growth_rates = [5.0, 2.5, 0.8, 12.0, -3.0]
+        engagement_rates = [3.2, 1.1, 0.4, 7.5, 0.0]
+
+        batch = predict_growth_trajectories(followers, growth_rates, engagement_rates, months=12)
+
+        assert batch.shape == (len(followers), 12)
+        for i, (f, g, e) in enumerate(zip(followers, growth_rates, engagement_rates)):
+            projections = predict_growth_trajectory(f, g, e, months=12)["projections"]
+            assert [int(v) for v in batch[i]] == [p["projected_followers"] for p in projections]
+
+    @pytest.mark.asyncio
+    async def test_correct_many_matches_correct_if_needed(self, sample_agent_result):
+        """Test correct_many returns correct_if_needed results in input order"""
+        import json
+        from types import SimpleNamespace
+        from agents.cot_prompting import SelfCorrectionEngine
+
+        async def generate_content(model, contents, config):
+            return SimpleNamespace(text=f"```json\n{json.dumps(sample_agent_result)}\n```")
+
+        client = SimpleNamespace(aio=SimpleNamespace(models=SimpleNamespace(generate_content=generate_content)))
+        engine = SelfCorrectionEngine(client, generation_config=None, model_name="test-model")
+
+        weak = {
+            "findings": [{"finding": "Too short", "type": "info", "category": "general"}],
+            "recommendations": [],
+            "metrics": {"overallScore": 50}
+        }
+        batch = [(sample_agent_result, "p1"), (weak, "p2"), (None, "p3"), (sample_agent_result, "p4")]
+
+        results = await engine.correct_many(batch, max_concurrent=2)
+
+        assert len(results) == len(batch)
+        for (output, prompt), result in zip(batch, results):
+            try:
+                expected = await engine.correct_if_needed(output, prompt)
+            except Exception as e:
+                assert type(result) is type(e)
+            else:
+                assert result == expected
+        assert results[1][1] is True
+
 
 # =============================================================================
 # LLM_MANAGER.PY TESTS
@@ -550,6 +613,395 @@ class TestIntegration:
         assert isinstance(validation_error, AgentError)
 
 
+# =============================================================================
+# SCORING_NUMERIC.PY TESTS
+# =============================================================================
+
+class TestScoringNumeric:
+    """Tests for numeric scoring kernels"""
+    
+    def test_engagement_quality_weights(self):
+        """Test per-post weighted engagement"""
+        from agents.scoring_numeric import engagement_quality
+        
+        weighted = engagement_quality(likes=[10, 0], comments=[0, 2], saves=[0, 1], shares=[0, 1])
+        
+        assert weighted.tolist() == pytest.approx([10.0, 11.5])
+    
+    def test_posting_gaps(self):
+        """Test gap statistics in days, independent of input order"""
+        from agents.scoring_numeric import posting_gaps
+        
+        day = 86400
+        mean_gap, max_gap, std_gap = posting_gaps([3 * day, 0, day])
+        
+        assert mean_gap == pytest.approx(1.5)
+        assert max_gap == pytest.approx(2.0)
+        assert std_gap == pytest.approx(0.5)
+        assert posting_gaps([day]) == (0.0, 0.0, 0.0)
+
+
+# =============================================================================
+# CONTENT_STRATEGIST.PY TESTS
+# =============================================================================
+
+class TestContentStrategist:
+    """Tests for content strategy scoring"""
+    
+    def test_summarize_recent_posts_coerces_counts(self):
+        """Test scraped counters ("1.2K", >2^31, junk) never raise and are read as numbers"""
+        from agents.content_strategist import ContentStrategistAgent
+        
+        agent = ContentStrategistAgent(None)
+        stats = agent.summarize_recent_posts([
+            {"likesCount": "1.2K"},
+            {"likes": 2 ** 40},
+            {"likesCount": "n/a", "commentsCount": None, "timestamp": 2 ** 80},
+            "not a post",
+        ])
+        
+        assert stats["post_count"] == 3
+        assert stats["avg_weighted_engagement"] == pytest.approx(round((1200 + 2 ** 40) / 3, 1))
+        assert "avg_gap_days" not in stats
+        assert agent.summarize_recent_posts(None) == {}
+    
+    def test_summarize_recent_posts_keeps_format_labels(self):
+        """Test post types are reported as given, not folded into a fixed set"""
+        from agents.content_strategist import ContentStrategistAgent
+        
+        agent = ContentStrategistAgent(None)
+        stats = agent.summarize_recent_posts([
+            {"type": "Sidecar", "timestamp": "2025-01-01T00:00:00Z"},
+            {"type": "igtv", "timestamp": 1735862400000},
+            {"type": "story"},
+            {},
+        ])
+        
+        assert stats["format_distribution"] == {"sidecar": 0.25, "igtv": 0.25, "story": 0.25, "unknown": 0.25}
+        assert stats["format_diversity_score"] == 100.0
+        assert stats["max_gap_days"] == pytest.approx(2.0)
+
+    
+    def test_classify_benchmark_matches_range_ladder_at_cutoffs(self):
+        """Test the searchsorted LUT against an if/elif [min, max) ladder around every cut-off"""
+        from agents.content_strategist import ContentStrategistAgent
+        
+        agent = ContentStrategistAgent(None)
+        
+        def ladder(spec, value):
+            buckets = sorted(spec.items(), key=lambda item: item[1]["min"])
+            if value < buckets[0][1]["max"]:
+                return buckets[0]
+            for name, bucket in buckets[1:-1]:
+                if bucket["min"] <= value < bucket["max"]:
+                    return name, bucket
+            return buckets[-1]
+        
+        for metric in ("engagement_rate", "follower_growth", "save_rate", "share_rate", "comment_rate"):
+            spec = agent.scoring_benchmarks[metric]
+            cutoffs = {b[edge] for b in spec.values() for edge in ("min", "max")}
+            values = [c * f for c in cutoffs for f in (0.999, 1.0, 1.001)] + [c + d for c in cutoffs for d in (-1e-9, 1e-9)]
+            
+            result = agent.classify_benchmark(metric, values)
+            
+            expected = [ladder(spec, v) for v in values]
+            assert result["levels"] == [name for name, _ in expected], metric
+            if result["scores"] is not None:
+                assert result["scores"] == [bucket["score"] for _, bucket in expected], metric
+        
+        assert agent.classify_benchmark("save_rate", 1.0) == {"levels": ["good"], "scores": [75]}
+        with pytest.raises(ValueError):
+            agent.classify_benchmark("post_frequency", 3)
+    
+    def test_score_accounts_matches_per_account_scoring(self):
+        """Test each batch row equals the single-account tier, benchmark and quality scores"""
+        from agents.content_strategist import ContentStrategistAgent
+        
+        agent = ContentStrategistAgent(None)
+        accounts = [
+            {"followers": 4200, "engagementRate": 8.3, "avgLikes": 310, "avgComments": 22,
+             "avgSaves": 41, "avgShares": 9, "niche": "food"},
+            {"followers": 48000, "engagementRate": 2.1, "avgLikes": 900, "avgComments": 35,
+             "avgSaves": 120, "avgShares": 60, "niche": "Personal Brand"},
+            {"followers": 2_500_000, "engagementRate": 0.7, "avgLikes": 15000, "avgComments": 400,
+             "avgSaves": 2000, "avgShares": 1500, "niche": "tech"},
+            {"followers": 300, "engagementRate": 12, "niche": ""},
+            {},
+        ]
+        
+        rows = agent.score_accounts(accounts)
+        
+        assert len(rows) == len(accounts)
+        for row, account in zip(rows, accounts):
+            followers = account.get("followers", 0)
+            er = account.get("engagementRate", 0)
+            pct = 100 / followers if followers else 0
+            rates = {
+                "save_rate": account.get("avgSaves", 0) * pct,
+                "share_rate": account.get("avgShares", 0) * pct,
+                "comment_rate": account.get("avgComments", 0) * pct,
+                "like_rate": account.get("avgLikes", 0) * pct,
+            }
+            tier = agent._calculate_tier(followers)
+            tier_info = agent.tier_definitions[tier]
+            expected_er = (tier_info["expected_er_min"] + tier_info["expected_er_max"]) / 2
+            niche_key = (account.get("niche") or "General").lower().replace(" ", "_")
+            modifier = agent.niche_adjustments.get(niche_key, {}).get("expected_er_modifier", 1.0)
+            
+            assert row["tier"] == tier
+            assert row["engagement_level"] == agent.classify_benchmark("engagement_rate", er)["levels"][0]
+            assert row["er_vs_expected"] == pytest.approx(round(er / (expected_er * modifier), 2))
+            assert row["engagement_quality"] == pytest.approx(agent._calculate_engagement_quality(rates))
+            for field, metric in (("save_score", "save_rate"), ("share_score", "share_rate"), ("comment_score", "comment_rate")):
+                assert row[field] == agent.classify_benchmark(metric, rates[metric])["scores"][0]
+        
+        assert agent.score_accounts([]).shape == (0,)
+    
+    def test_agent_copies_share_config_tables(self):
+        """Test deepcopy and pickle keep working and reuse the read-only config tables"""
+        import copy
+        import pickle
+        from agents.content_strategist import ContentStrategistAgent
+        
+        agent = ContentStrategistAgent(None, model_name="test-model")
+        
+        for clone in (copy.deepcopy(agent), pickle.loads(pickle.dumps(agent))):
+            assert clone is not agent
+            assert clone.model_name == "test-model"
+            assert clone.name == agent.name
+            assert clone.metrics is not agent.metrics
+            assert clone.algorithm_weights is agent.algorithm_weights
+            assert clone.scoring_benchmarks is agent.scoring_benchmarks
+            assert clone.tier_definitions is agent.tier_definitions
+            assert clone.niche_adjustments is agent.niche_adjustments
+
+
+# =============================================================================
+# DOMAIN_MASTER.PY TESTS
+# =============================================================================
+
+class TestDomainMaster:
+    """Tests for business identity detection"""
+    
+    def test_detect_business_identity_ranks_categories_by_hits(self):
+        """Test the category with most matched indicators wins over table order"""
+        from agents.domain_master import DomainMasterAgent
+        
+        agent = DomainMasterAgent(None)
+        result = agent.detect_business_identity({"bio": "Yoga teacher | reiki & meditasyon danışmanlık"})
+        
+        assert result["category"] == "spiritual_wellness"
+        assert result["account_type"] == "SERVICE_PROVIDER"
+        # Shared indicators count once, for their priority category
+        assert result["indicators_found"] == ["danışman", "danışmanlık", "reiki", "meditasyon", "yoga teacher"]
+        assert result["confidence"] == 0.95
+        
+        creator = agent.detect_business_identity({"bio": "travel & food", "fullName": "Ayşe"})
+        assert creator["is_service_provider"] is False
+        assert creator["category"] == "content_creator"
+    
+    def test_detect_business_identity_matches_at_word_start(self):
+        """Test indicators match suffixed words but not the inside of other words"""
+        from agents.domain_master import DomainMasterAgent
+        
+        agent = DomainMasterAgent(None)
+        
+        assert agent.detect_business_identity({"bio": "script writer | admin"})["is_service_provider"] is False
+        suffixed = agent.detect_business_identity({"bio": "Koçunuz Ayşe | dm at"})
+        assert suffixed["indicators_found"] == ["koç"]
+        assert suffixed["service_signals_in_bio"] == 1
+    
+    def test_detect_business_identity_folds_turkish_case(self):
+        """Test upper-case Turkish bios (İ / I) match lower-case indicators"""
+        from agents.domain_master import DomainMasterAgent
+        
+        agent = DomainMasterAgent(None)
+        result = agent.detect_business_identity({"bio": "İÇ MİMAR", "fullName": "DANIŞMAN Ayşe"})
+        
+        assert result["category"] == "professional_services"
+        assert result["indicators_found"] == ["danışman", "mimar", "iç mimar"]
+    
+    def test_identity_cache_is_shared_and_does_not_hold_agents(self):
+        """Test agents reuse one match cache that keeps no reference to them"""
+        import gc
+        import weakref
+        from agents.domain_master import DomainMasterAgent, _match_business_identity
+        
+        first, second = DomainMasterAgent(None), DomainMasterAgent(None)
+        first.clear_identity_cache()
+        account = {"bio": "Yaşam koçu | online danışmanlık", "fullName": "Ayşe"}
+        
+        assert first.detect_business_identity(account) == second.detect_business_identity(account)
+        info = _match_business_identity.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+        
+        gc.disable()
+        try:
+            ref = weakref.ref(first)
+            del first
+            assert ref() is None
+        finally:
+            gc.enable()
+        
+        second.clear_identity_cache()
+        assert _match_business_identity.cache_info().currsize == 0
+    
+    def test_agent_copies_share_knowledge_bases(self):
+        """Test deepcopy and pickle keep working and reuse the read-only knowledge bases"""
+        import copy
+        import pickle
+        from agents.domain_master import DomainMasterAgent
+        
+        agent = DomainMasterAgent(None, model_name="test-model")
+        
+        for clone in (copy.deepcopy(agent), pickle.loads(pickle.dumps(agent))):
+            assert clone is not agent
+            assert clone.model_name == "test-model"
+            assert clone.metrics is not agent.metrics
+            assert clone.niche_taxonomy is agent.niche_taxonomy
+            assert clone.service_provider_categories is agent.service_provider_categories
+            assert clone.bio_service_indicators == agent.bio_service_indicators
+            assert clone.detect_business_identity({"bio": "Yaşam koçu"}) == agent.detect_business_identity({"bio": "Yaşam koçu"})
+
+
+# =============================================================================
+# FAST_JSON.PY TESTS
+# =============================================================================
+
+class TestFastJson:
+    """Tests for the orjson/stdlib JSON adapter"""
+    
+    def test_dumps_backends_agree(self):
+        """Test the orjson path and the stdlib fallback write identical text"""
+        import dataclasses
+        import enum
+        import uuid
+        from datetime import date, timezone
+        from types import MappingProxyType
+        from agents import fast_json
+        
+        class Tier(enum.Enum):
+            MICRO = "micro"
+        
+        @dataclasses.dataclass
+        class Point:
+            x: float
+            y: float
+        
+        payload = {
+            "naive": datetime(2026, 1, 2, 3, 4, 5, 678901),
+            "aware": datetime(2026, 1, 2, tzinfo=timezone.utc),
+            "day": date(2026, 1, 2),
+            "nan": float("nan"),
+            "inf": [1.5, float("inf"), {"neg": -float("inf")}],
+            "frozen": MappingProxyType({"a": (1, 2)}),
+            "tags": {"x"},
+            "tier": Tier.MICRO,
+            "id": uuid.UUID(int=1),
+            "point": Point(1.0, float("nan")),
+            "text": "Öğretmen ış \x01",
+            7: "int key",
+        }
+        
+        for indent in (False, True):
+            text = fast_json.dumps(payload, indent=indent)
+            assert text == fast_json._json_dumps(payload, indent)
+        
+        decoded = json.loads(fast_json.dumps(payload))
+        assert decoded["naive"] == "2026-01-02T03:04:05.678901"
+        assert decoded["aware"] == "2026-01-02T00:00:00+00:00"
+        assert decoded["nan"] is None
+        assert decoded["inf"] == [1.5, None, {"neg": None}]
+        assert decoded["point"] == {"x": 1.0, "y": None}
+        assert decoded["tier"] == "micro"
+        assert decoded["7"] == "int key"
+        assert fast_json.dumps({"big": 2 ** 70}) == '{"big":1180591620717411303424}'
+    
+    def test_dumps_rejects_unknown_types(self):
+        """Test unknown objects raise TypeError on both paths instead of being str()-ed"""
+        from agents import fast_json
+        
+        with pytest.raises(TypeError):
+            fast_json.dumps({"value": object()})
+        with pytest.raises(TypeError):
+            fast_json._json_dumps({"value": object()}, False)
+
+    
+    def test_parse_response_accepts_nan_literals(self):
+        """Test agent responses with NaN/Infinity still parse as JSON, not the fallback"""
+        import math
+        from agents.content_strategist import ContentStrategistAgent
+        from agents.fast_json import JSONDecodeError, loads
+        
+        agent = ContentStrategistAgent(None)
+        
+        direct = agent.parse_response('{"score": NaN, "growth": Infinity, "drop": -Infinity}')
+        fenced = agent.parse_response('```json\n{"score": 72, "ratio": NaN}\n```')
+        
+        assert math.isnan(direct["score"])
+        assert direct["growth"] == math.inf and direct["drop"] == -math.inf
+        assert fenced["score"] == 72 and math.isnan(fenced["ratio"])
+        assert loads(b'[NaN]')[0] != loads(b'[NaN]')[0]
+        with pytest.raises(JSONDecodeError):
+            loads('{"score": }')
+
+# =============================================================================
+# DEEPSEEK_FINAL_ANALYST.PY TESTS
+# =============================================================================
+
+async def _sse_lines(*lines):
+    for line in lines:
+        yield line
+
+
+class TestDeepSeekFinalAnalyst:
+    """Tests for the streamed DeepSeek response reader"""
+    
+    @pytest.mark.asyncio
+    async def test_collect_sse_content_joins_deltas(self):
+        """Test deltas are joined in order and non-data / empty chunks are skipped"""
+        from agents.deepseek_final_analyst import _collect_sse_content
+        
+        content = await _collect_sse_content(_sse_lines(
+            ": keep-alive",
+            'data: {"choices": [{"delta": {"role": "assistant"}}]}',
+            "",
+            'data: {"choices": [{"delta": {"content": "DURUM: "}}]}',
+            'data: {"choices": []}',
+            'data:{"choices": [{"delta": {"content": "İyi"}}]}',
+            "data: [DONE]",
+            'data: {"choices": [{"delta": {"content": "ignored"}}]}',
+        ))
+        
+        assert content == "DURUM: İyi"
+    
+    @pytest.mark.asyncio
+    async def test_collect_sse_content_accepts_nan_literals(self):
+        """Test chunks carrying NaN/Infinity (rejected by orjson) still parse"""
+        from agents.deepseek_final_analyst import _collect_sse_content
+        
+        content = await _collect_sse_content(_sse_lines(
+            'data: {"choices": [{"delta": {"content": "TAHMİN"}, "logprob": NaN}]}',
+            'data: {"choices": [{"delta": {"content": ": +%5"}, "logprob": -Infinity}]}',
+            "data: [DONE]",
+        ))
+        
+        assert content == "TAHMİN: +%5"
+    
+    @pytest.mark.asyncio
+    async def test_collect_sse_content_rejects_truncated_stream(self):
+        """Test a stream that ends without [DONE] raises instead of returning partial text"""
+        import httpx
+        from agents.deepseek_final_analyst import _collect_sse_content
+        
+        with pytest.raises(httpx.RemoteProtocolError):
+            await _collect_sse_content(_sse_lines(
+                'data: {"choices": [{"delta": {"content": "DURUM: yar"}}]}',
+            ))
+        with pytest.raises(httpx.RemoteProtocolError):
+            await _collect_sse_content(_sse_lines())
+
+
 # =============================================================================
 # PERFORMANCE TESTS
 # =============================================================================